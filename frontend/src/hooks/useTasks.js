@@ -7,6 +7,8 @@ export const taskKeys = {
   all: ["tasks"],
   lists: () => [...taskKeys.all, "list"],
   list: (status, search) => [...taskKeys.lists(), { status, search }],
+  // Under lists() so the mutations that invalidate lists refresh stats too
+  stats: () => [...taskKeys.lists(), "stats"],
   details: () => [...taskKeys.all, "detail"],
   detail: (id) => [...taskKeys.details(), id],
   comments: (id) => [...taskKeys.detail(id), "comments"],
@@ -23,15 +25,24 @@ export function useTasks(statusFilter, searchTerm) {
   });
 }
 
+export function useTaskStats() {
+  return useQuery({
+    queryKey: taskKeys.stats(),
+    queryFn: () => taskService.getStats(),
+    staleTime: 1000 * 60, // 1 minute
+  });
+}
+
 export function useTaskDetails(taskId) {
   return useQuery({
     queryKey: taskKeys.detail(taskId),
     queryFn: async () => {
-      const [comments, history] = await Promise.all([
-        taskService.getComments(taskId),
-        taskService.getHistory(taskId),
-      ]);
-      return { comments, history };
+      const detail = await taskService.getDetail(taskId);
+      return {
+        task: detail.task,
+        comments: detail.comments.items,
+        history: detail.history.items,
+      };
     },
     enabled: !!taskId,
   });
@@ -8,9 +8,17 @@ export const taskService = {
 		const query = params.toString() ? `?${params.toString()}` : "";
 		return api.get(`/tasks${query}`);
 	},
+	// Aggregated counts for the dashboard (no task list download)
+	getStats: async () => {
+		return api.get("/tasks/stats");
+	},
 	getById: async (id) => {
 		return api.get(`/tasks/${id}`);
 	},
+	// Task + comments + history in one round trip
+	getDetail: async (id) => {
+		return api.get(`/tasks/${id}/detail`);
+	},
 	create: async (taskData) => {
 		return api.post("/tasks", taskData);
 	},
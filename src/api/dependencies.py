@@ -7,8 +7,11 @@ from typing import Annotated, AsyncGenerator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import make_transient_to_detached
 
+from src.core.deadlines import apply_statement_timeout
+from src.core.principal_cache import principal_cache
 from src.core.security import decode_access_token
 from src.db import AsyncSessionLocal, User
 
@@ -23,10 +26,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency que provee una sesión async de base de datos.
 
+    La sesión es lazy: no toma una conexión del pool hasta la primera
+    consulta, y la devuelve al cerrarse. Con ``DatabaseDep`` se cierra en
+    cuanto termina el endpoint (y la serialización de su respuesta), antes de
+    enviar el cuerpo; solo los endpoints de streaming la mantienen hasta el
+    final del envío (``StreamingDatabaseDep``).
+
+    En PostgreSQL cada transacción queda limitada por el deadline del request
+    (``SET LOCAL statement_timeout``, ver ``src.core.deadlines``).
+
     Yields:
         AsyncSession: Sesión de SQLAlchemy
     """
     async with AsyncSessionLocal() as session:
+        apply_statement_timeout(session)
         try:
             yield session
         finally:
@@ -34,7 +47,28 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 # Type alias para facilitar uso en routers
-DatabaseDep = Annotated[AsyncSession, Depends(get_db)]
+DatabaseDep = Annotated[AsyncSession, Depends(get_db, scope="function")]
+
+# Para StreamingResponse que leen de la DB mientras envían el cuerpo
+StreamingDatabaseDep = Annotated[AsyncSession, Depends(get_db)]
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency que provee la factoría de sesiones.
+
+    Para trabajo en background que sobrevive al request (la sesión de
+    ``get_db`` se cierra al terminar la respuesta).
+
+    Returns:
+        async_sessionmaker: Factoría de sesiones de SQLAlchemy
+    """
+    return AsyncSessionLocal
+
+
+SessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession], Depends(get_session_factory)
+]
 
 
 # === AUTHENTICATION DEPENDENCY ===
@@ -48,6 +82,11 @@ async def get_current_user(
     Dependency que extrae y valida el JWT token.
     Retorna el usuario actual autenticado.
 
+    El usuario de cada token se guarda en ``principal_cache``: con la cache
+    caliente no hay consulta ni se toma conexión del pool. Solo se leen las
+    columnas de ``users`` (no las colecciones de tareas) y el usuario se une a
+    la sesión con ``merge(load=False)``, sin SQL.
+
     Args:
         credentials: Bearer token del header Authorization
         db: Sesión de base de datos
@@ -64,37 +103,47 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # Decodear JWT
     token = credentials.credentials
-    payload = decode_access_token(token)
-
-    if payload is None:
-        raise credentials_exception
+    values = principal_cache.get(token)
 
-    # Extraer user_id del payload
-    user_id: str | None = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
+    if values is None:
+        # Decodear JWT
+        payload = decode_access_token(token)
 
-    # Buscar usuario en DB (ASYNC)
-    try:
-        user_id_int = int(user_id)
-    except ValueError:
-        raise credentials_exception
+        if payload is None:
+            raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id_int))
-    user = result.scalar_one_or_none()
+        # Extraer user_id del payload
+        user_id: str | None = payload.get("sub")
+        if user_id is None:
+            raise credentials_exception
 
-    if user is None:
-        raise credentials_exception
+        # Buscar usuario en DB (ASYNC)
+        try:
+            user_id_int = int(user_id)
+        except ValueError:
+            raise credentials_exception
 
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user",
+        result = await db.execute(
+            select(*User.__table__.columns).where(User.id == user_id_int)
         )
+        row = result.mappings().one_or_none()
+
+        if row is None:
+            raise credentials_exception
+
+        if not row["is_active"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user",
+            )
+
+        values = dict(row)
+        principal_cache.put(token, values, token_exp=payload.get("exp"))
 
-    return user
+    user = User(**values)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
 
 
 # Type alias para facilitar uso en routers
@@ -2,6 +2,6 @@
 API v1 routes.
 """
 
-from src.api.v1 import auth, tasks, users
+from src.api.v1 import activity, analytics, auth, exports, tasks, users
 
-__all__ = ["auth", "tasks", "users"]
+__all__ = ["activity", "analytics", "auth", "exports", "tasks", "users"]
@@ -0,0 +1,42 @@
+"""
+Activity router (API v1).
+Endpoints: export of the activity log
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import CurrentUser, StreamingDatabaseDep
+from src.core.export import ExportFormat, export_response
+from src.schemas import ActivityLogRow
+from src.services import TaskService
+
+router = APIRouter(prefix="/activity", tags=["Activity"])
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_activity(
+    current_user: CurrentUser,
+    db: StreamingDatabaseDep,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+) -> StreamingResponse:
+    """
+    Exporta el activity log en streaming (NDJSON o CSV).
+
+    Un owner recibe toda la actividad; un member, solo la de las tareas que
+    puede ver.
+
+    Args:
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        export_format: (Query Param ``format``) ``ndjson`` o ``csv``
+
+    Returns:
+        StreamingResponse: Fichero ``activity.ndjson`` / ``activity.csv``
+    """
+    query = TaskService.export_activity_query(current_user)
+    return export_response(
+        TaskService.stream_rows(query, db), ActivityLogRow, export_format, "activity"
+    )
@@ -0,0 +1,39 @@
+"""
+Analytics router (API v1).
+Endpoints: flow metrics computed from the activity log
+"""
+
+from datetime import date
+
+from fastapi import APIRouter
+
+from src.api.dependencies import CurrentUser, DatabaseDep
+from src.schemas import FlowMetricsResponse
+from src.services import AnalyticsService
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+@router.get("/flow", response_model=FlowMetricsResponse)
+async def get_flow_metrics(
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    since: date | None = None,
+    until: date | None = None,
+) -> FlowMetricsResponse:
+    """
+    Lead time, cycle time y throughput semanal por assignee.
+
+    Args:
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        since: (Query Param) Primer día de la ventana (por defecto, 12 semanas)
+        until: (Query Param) Último día de la ventana (por defecto, hoy)
+
+    Returns:
+        FlowMetricsResponse: Percentiles de duración y throughput por semana
+
+    Raises:
+        400: Ventana inválida o mayor a dos años
+    """
+    return await AnalyticsService.get_flow_metrics(current_user, db, since, until)
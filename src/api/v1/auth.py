@@ -42,9 +42,7 @@ async def register(
 
 @router.post("/login", response_model=Token)
 @limiter.limit("5/minute")
-async def login(
-    request: Request, credentials: LoginRequest, db: DatabaseDep
-) -> Token:
+async def login(request: Request, credentials: LoginRequest, db: DatabaseDep) -> Token:
     """
     Autentica un usuario y retorna JWT token.
 
@@ -0,0 +1,76 @@
+"""
+Exports router (API v1).
+Endpoints: asynchronous exports of tasks and activity
+"""
+
+from fastapi import APIRouter, BackgroundTasks, status
+from fastapi.responses import FileResponse
+
+from src.api.dependencies import CurrentUser, DatabaseDep, SessionFactoryDep
+from src.schemas import ExportJobCreate, ExportJobResponse
+from src.services import ExportService
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+@router.post("", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_export(
+    export_request: ExportJobCreate,
+    background_tasks: BackgroundTasks,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    session_factory: SessionFactoryDep,
+) -> ExportJobResponse:
+    """
+    Encola una exportación; el fichero se genera en background.
+
+    También limpia (lazy) las exportaciones cuyo TTL venció.
+
+    Args:
+        export_request: Qué exportar (``tasks``/``activity``), formato y filtros
+        background_tasks: Cola de tareas que corren tras enviar la respuesta
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        session_factory: Factoría de sesiones para el worker
+
+    Returns:
+        ExportJobResponse: Job en estado ``pending``
+    """
+    job = await ExportService.create_job(export_request, current_user, db)
+    background_tasks.add_task(ExportService.run_job, job.id, session_factory)
+    background_tasks.add_task(ExportService.cleanup_expired, session_factory)
+    return job
+
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+async def get_export(
+    job_id: int, current_user: CurrentUser, db: DatabaseDep
+) -> ExportJobResponse:
+    """
+    Estado y progreso (``rows_written`` / ``total_rows``) de una exportación.
+
+    Raises:
+        404: Export not found
+        403: La exportación es de otro usuario
+    """
+    return await ExportService.get_job(job_id, current_user, db)
+
+
+@router.get("/{job_id}/file", response_class=FileResponse)
+async def download_export(
+    job_id: int, current_user: CurrentUser, db: DatabaseDep
+) -> FileResponse:
+    """
+    Descarga el fichero gzip de una exportación terminada.
+
+    FileResponse soporta ``Range`` (descargas reanudables, 206) y usa
+    ``http.response.pathsend`` (sendfile sin copia) si el servidor lo soporta.
+
+    Raises:
+        404: Export not found
+        403: La exportación es de otro usuario
+        409: La exportación aún no terminó
+        410: La exportación expiró
+    """
+    path = await ExportService.get_job_file(job_id, current_user, db)
+    return FileResponse(path, media_type="application/gzip", filename=path.name)
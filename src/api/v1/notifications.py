@@ -4,18 +4,23 @@ Endpoints: CRUD operations for notifications
 """
 
 from fastapi import APIRouter, status
+from pydantic import TypeAdapter
 
 from src.api.dependencies import CurrentUser, DatabaseDep
+from src.core.responses import FastJSONResponse
 from src.schemas.notification import NotificationResponse
 from src.services.notification_service import NotificationService
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
+# Validación ORM -> modelos (una sola vez por request, sin re-validar al responder)
+_notifications_adapter = TypeAdapter(list[NotificationResponse])
+
 
 @router.get("", response_model=list[NotificationResponse])
 async def list_notifications(
     current_user: CurrentUser, db: DatabaseDep, unread_only: bool = False
-) -> list[NotificationResponse]:
+) -> list[NotificationResponse] | FastJSONResponse:
     """
     List all notifications for the current user.
 
@@ -30,7 +35,9 @@ async def list_notifications(
     notifications = await NotificationService.get_user_notifications(
         current_user.id, db, unread_only
     )
-    return notifications
+    return FastJSONResponse(
+        _notifications_adapter.validate_python(notifications, from_attributes=True)
+    )
 
 
 @router.patch("/{notification_id}", response_model=NotificationResponse)
@@ -3,44 +3,307 @@ Tasks router (API v1).
 Endpoints: CRUD operations for tasks
 """
 
-from fastapi import APIRouter, status
+from datetime import date, datetime
+from typing import Annotated
 
-from src.api.dependencies import CurrentUser, DatabaseDep
+from fastapi import APIRouter, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import CurrentUser, DatabaseDep, StreamingDatabaseDep
+from src.core.export import ExportFormat, export_response
+from src.core.http_cache import conditional_response
+from src.core.import_parsers import iter_csv_records, iter_ndjson_records
+from src.core.singleflight import request_coalescer, request_key
 from src.schemas import (
+    ActivityField,
     ActivityLogResponse,
+    BurndownResponse,
+    BurndownSnapshotResponse,
     CommentCreate,
     CommentResponse,
+    TaskBatchGetRequest,
+    TaskBatchGetResponse,
+    TaskBulkRequest,
+    TaskBulkResponse,
+    TaskChangesResponse,
     TaskCreate,
+    TaskDetailResponse,
+    TaskImportResponse,
     TaskResponse,
+    TaskRow,
+    TaskStatsResponse,
     TaskUpdate,
 )
-from src.services import TaskService
+from src.services import BurndownService, TaskService
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
 @router.get("", response_model=list[TaskResponse])
 async def list_tasks(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     db: DatabaseDep,
     status: str | None = None,
     search: str | None = None,
-) -> list[TaskResponse]:
+    fields: str | None = None,
+) -> list[TaskResponse] | Response:
     """
     Lista las tareas del usuario, opcionalmente filtradas por estado y/o búsqueda.
 
+    Soporta GET condicional: si ``If-None-Match`` coincide con el ETag actual
+    responde 304 sin cuerpo (solo cuesta una consulta de agregación).
+
+    Los requests idénticos y concurrentes de usuarios con la misma visibilidad
+    comparten las consultas y el cuerpo serializado (``request_coalescer``).
+
     Args:
+        request: HTTP request (para If-None-Match)
+        response: Respuesta en curso (para el header ETag)
         current_user: Usuario autenticado
         db: Sesión de base de datos
         status: (Query Param) Filtro opcional por estado (pending, in_progress, done)
         search: (Query Param) Búsqueda por título o descripción
+        fields: (Query Param) Campos a devolver separados por coma
+            (ej: ``id,title,status``); ``id`` siempre se incluye
 
     Returns:
-        list[TaskResponse]: Lista de tareas
+        list[TaskResponse]: Lista de tareas (solo los campos pedidos)
+
+    Raises:
+        400: Campo desconocido en ``fields``
     """
-    return await TaskService.list_tasks(
-        current_user, db, status_filter=status, search=search
+    selected = TaskService.parse_fields(fields)
+    # Requests idénticos y concurrentes (misma visibilidad) comparten consulta
+    key = request_key(request, TaskService.visibility_class(current_user))
+    etag = await request_coalescer.do(
+        ("etag", key),
+        lambda: TaskService.list_tasks_etag(
+            current_user, db, status_filter=status, search=search, fields=selected
+        ),
     )
+    if cached := conditional_response(request, response, etag):
+        return cached
+
+    # Fast path: el JSON sale serializado del servicio, sin re-validar. Los
+    # bytes se comparten por versión (ETag)
+    body = await request_coalescer.do(
+        ("body", key, etag),
+        lambda: TaskService.list_tasks_json(
+            current_user, db, status_filter=status, search=search, fields=selected
+        ),
+    )
+    return Response(
+        content=body, media_type="application/json", headers=response.headers
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    current_user: CurrentUser,
+    db: StreamingDatabaseDep,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    status: str | None = None,
+    search: str | None = None,
+) -> StreamingResponse:
+    """
+    Exporta todas las tareas visibles en streaming (NDJSON o CSV).
+
+    Las filas se leen con un cursor del servidor en chunks de tamaño fijo y
+    se envían según llegan, así que la memoria no depende del total.
+
+    Args:
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        export_format: (Query Param ``format``) ``ndjson`` o ``csv``
+        status: (Query Param) Filtro opcional por estado
+        search: (Query Param) Búsqueda por título o descripción
+
+    Returns:
+        StreamingResponse: Fichero ``tasks.ndjson`` / ``tasks.csv``
+    """
+    query = TaskService.export_tasks_query(
+        current_user, status_filter=status, search=search
+    )
+    return export_response(
+        TaskService.stream_rows(query, db), TaskRow, export_format, "tasks"
+    )
+
+
+@router.get("/stats", response_model=TaskStatsResponse)
+async def get_task_stats(
+    request: Request, current_user: CurrentUser, db: DatabaseDep
+) -> TaskStatsResponse:
+    """
+    Conteos de las tareas visibles para el dashboard.
+
+    Se calculan con una sola consulta agrupada, sin traer la lista de tareas.
+    Los requests concurrentes de usuarios con la misma visibilidad comparten
+    esa consulta.
+
+    Args:
+        request: HTTP request (clave de coalescing)
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        TaskStatsResponse: Total, por estado, por assignee, vencidas y por vencer
+    """
+    key = request_key(request, TaskService.visibility_class(current_user))
+    return await request_coalescer.do(
+        key, lambda: TaskService.get_stats(current_user, db)
+    )
+
+
+@router.get("/burndown", response_model=BurndownResponse)
+async def get_burndown(
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    start: Annotated[date | None, Query(alias="from")] = None,
+    end: Annotated[date | None, Query(alias="to")] = None,
+    assigned_to_id: int | None = None,
+) -> BurndownResponse:
+    """
+    Tareas por estado y día, para gráficos de burndown / cumulative flow.
+
+    Solo lee los snapshots diarios (un punto por día con snapshot).
+
+    Args:
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        start: (Query Param ``from``) Primer día (por defecto, hace 30 días)
+        end: (Query Param ``to``) Último día, incluido (por defecto, hoy)
+        assigned_to_id: (Query Param) Solo tareas de este assignee
+
+    Returns:
+        BurndownResponse: Conteos por estado y tareas pendientes de cada día
+
+    Raises:
+        400: Rango inválido o mayor a un año
+    """
+    return await BurndownService.get_burndown(
+        current_user, db, start=start, end=end, assigned_to_id=assigned_to_id
+    )
+
+
+@router.post("/burndown/snapshot", response_model=BurndownSnapshotResponse)
+async def take_burndown_snapshot(
+    current_user: CurrentUser, db: DatabaseDep
+) -> BurndownSnapshotResponse:
+    """
+    Toma (o rehace) el snapshot del día en curso. Solo owners.
+
+    El job nocturno guarda el cierre definitivo de cada día.
+
+    Raises:
+        403: El usuario no es owner
+    """
+    return await BurndownService.take_snapshot_now(current_user, db)
+
+
+@router.get("/changes", response_model=TaskChangesResponse)
+async def list_task_changes(
+    current_user: CurrentUser, db: DatabaseDep, since: str | None = None
+) -> TaskChangesResponse:
+    """
+    Sincronización incremental de tareas.
+
+    Args:
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        since: (Query Param) Watermark devuelto por la llamada anterior.
+            Sin él se devuelven todas las tareas visibles.
+
+    Returns:
+        TaskChangesResponse: Tareas modificadas, ids eliminados y nuevo watermark
+
+    Raises:
+        400: Watermark inválido
+    """
+    return await TaskService.get_changes(current_user, db, since=since)
+
+
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def bulk_tasks(
+    bulk_request: TaskBulkRequest, current_user: CurrentUser, db: DatabaseDep
+) -> TaskBulkResponse:
+    """
+    Crea, actualiza (status, assignee, due_date) y elimina tareas en lote.
+
+    Todo el lote se ejecuta en una transacción; cada operación devuelve su
+    propio resultado (201/200/204 o 400/403/404/422).
+
+    Args:
+        bulk_request: Listas ``create``, ``update`` y ``delete``
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        TaskBulkResponse: Resultado por operación
+    """
+    return await TaskService.bulk_tasks(bulk_request, current_user, db)
+
+
+@router.post("/batch-get", response_model=TaskBatchGetResponse)
+async def batch_get_tasks(
+    batch_request: TaskBatchGetRequest, current_user: CurrentUser, db: DatabaseDep
+) -> TaskBatchGetResponse:
+    """
+    Obtiene varias tareas por ID en una sola consulta.
+
+    Args:
+        batch_request: Lista de IDs (máximo 500)
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+
+    Returns:
+        TaskBatchGetResponse: Tareas accesibles, IDs prohibidos e IDs inexistentes
+    """
+    return await TaskService.batch_get_tasks(batch_request.ids, current_user, db)
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_tasks(
+    request: Request,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    import_format: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+) -> TaskImportResponse:
+    """
+    Importa tareas desde el cuerpo del request (NDJSON o CSV con cabecera).
+
+    El cuerpo se parsea de forma incremental según llega. Cada fila usa los
+    campos de TaskCreate; el assignee puede indicarse por ``assigned_to``
+    (username) o ``assigned_to_id``. Las filas inválidas no detienen la
+    importación y se devuelven en ``errors``.
+
+    Args:
+        request: HTTP request (se lee el cuerpo como stream)
+        current_user: Usuario autenticado (owner de las tareas importadas)
+        db: Sesión de base de datos
+        import_format: (Query Param ``format``) ``ndjson`` o ``csv``
+
+    Returns:
+        TaskImportResponse: Filas creadas, fallidas y detalle de errores
+
+    Raises:
+        400: El cuerpo no es UTF-8 válido
+    """
+    parse = iter_csv_records if import_format == "csv" else iter_ndjson_records
+    return await TaskService.import_tasks(parse(request.stream()), current_user, db)
 
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -63,38 +326,67 @@ async def create_task(
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
-    task_id: int, current_user: CurrentUser, db: DatabaseDep
-) -> TaskResponse:
+    task_id: int,
+    request: Request,
+    response: Response,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    as_of: datetime | None = None,
+) -> TaskResponse | Response:
     """
     Obtiene una tarea por ID.
 
+    Soporta GET condicional con un ETag derivado de ``version``. Con
+    ``?as_of=`` devuelve la tarea tal como estaba en esa fecha, reconstruida
+    desde los snapshots y el historial.
+
     Args:
         task_id: ID de la tarea
+        request: HTTP request (para If-None-Match)
+        response: Respuesta en curso (para el header ETag)
         current_user: Usuario autenticado
         db: Sesión de base de datos
+        as_of: (Query Param) Fecha (ISO 8601) en la que consultar la tarea
 
     Returns:
         TaskResponse: Tarea encontrada
 
     Raises:
-        404: Tarea no encontrada
+        404: Tarea no encontrada (o inexistente en ``as_of``)
         403: No autorizado para acceder a esta tarea
     """
-    return await TaskService.get_task(task_id, current_user, db)
+    if as_of:
+        return await TaskService.get_task_as_of(task_id, current_user, db, as_of)
+
+    task = await TaskService.get_task(task_id, current_user, db)
+    if cached := conditional_response(request, response, TaskService.task_etag(task)):
+        return cached
+    return task
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
-    task_id: int, task_data: TaskUpdate, current_user: CurrentUser, db: DatabaseDep
+    task_id: int,
+    task_data: TaskUpdate,
+    response: Response,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> TaskResponse:
     """
     Actualiza una tarea.
 
+    Con ``If-Match`` (el ETag de ``GET /tasks/{task_id}``) la actualización
+    solo se aplica si nadie modificó la tarea desde entonces. La respuesta
+    lleva el ETag de la nueva versión.
+
     Args:
         task_id: ID de la tarea
         task_data: Campos a actualizar (title, description, status)
+        response: Respuesta en curso (para el header ETag)
         current_user: Usuario autenticado
         db: Sesión de base de datos
+        if_match: (Header) ETag de la versión que se quiere modificar
 
     Returns:
         TaskResponse: Tarea actualizada
@@ -102,8 +394,13 @@ async def update_task(
     Raises:
         404: Tarea no encontrada
         403: No autorizado para modificar esta tarea
+        412: If-Match no coincide (la tarea cambió)
     """
-    return await TaskService.update_task(task_id, task_data, current_user, db)
+    task = await TaskService.update_task(
+        task_id, task_data, current_user, db, if_match=if_match
+    )
+    response.headers["ETag"] = TaskService.task_etag(task)
+    return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -139,15 +436,88 @@ async def add_comment(
 
 @router.get("/{task_id}/comments", response_model=list[CommentResponse])
 async def list_comments(
-    task_id: int, current_user: CurrentUser, db: DatabaseDep
-) -> list[CommentResponse]:
-    """Listar comentarios de una tarea."""
-    return await TaskService.get_comments(task_id, current_user, db)
+    task_id: int,
+    request: Request,
+    response: Response,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+) -> list[CommentResponse] | Response:
+    """
+    Listar comentarios de una tarea (orden cronológico, paginado por cursor).
+
+    Si hay más resultados, el header ``X-Next-Cursor`` contiene el cursor
+    para pedir la siguiente página. Soporta GET condicional (ETag).
+    """
+    etag = await TaskService.get_comments_etag(
+        task_id, current_user, db, limit=limit, cursor=cursor
+    )
+    if cached := conditional_response(request, response, etag):
+        return cached
+
+    page = await TaskService.get_comments(
+        task_id, current_user, db, limit=limit, cursor=cursor
+    )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
 
 
 @router.get("/{task_id}/history", response_model=list[ActivityLogResponse])
 async def get_history(
-    task_id: int, current_user: CurrentUser, db: DatabaseDep
-) -> list[ActivityLogResponse]:
-    """Ver historial de cambios de una tarea."""
-    return await TaskService.get_history(task_id, current_user, db)
+    task_id: int,
+    request: Request,
+    response: Response,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+    field: ActivityField | None = None,
+) -> list[ActivityLogResponse] | Response:
+    """
+    Ver historial de cambios de una tarea (más reciente primero).
+
+    Con ``?field=status`` (o cualquier otro campo de la tarea) solo se
+    devuelven los cambios de ese campo. Si hay más resultados, el header
+    ``X-Next-Cursor`` contiene el cursor para pedir la siguiente página.
+    Soporta GET condicional (ETag).
+    """
+    etag = await TaskService.get_history_etag(
+        task_id, current_user, db, limit=limit, cursor=cursor, field=field
+    )
+    if cached := conditional_response(request, response, etag):
+        return cached
+
+    page = await TaskService.get_history(
+        task_id, current_user, db, limit=limit, cursor=cursor, field=field
+    )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+
+@router.get("/{task_id}/detail", response_model=TaskDetailResponse)
+async def get_task_detail(
+    task_id: int,
+    current_user: CurrentUser,
+    db: DatabaseDep,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+) -> TaskDetailResponse:
+    """
+    Obtiene la tarea, sus comentarios y su historial en una sola llamada.
+
+    Args:
+        task_id: ID de la tarea
+        current_user: Usuario autenticado
+        db: Sesión de base de datos
+        limit: (Query Param) Máximo de comentarios y de entradas de historial
+
+    Returns:
+        TaskDetailResponse: Tarea + página de comentarios + página de historial
+
+    Raises:
+        404: Tarea no encontrada
+        403: No autorizado para acceder a esta tarea
+    """
+    return await TaskService.get_task_detail(task_id, current_user, db, limit=limit)
@@ -3,22 +3,42 @@ Users router (API v1).
 Endpoints: List users (for dropdowns)
 """
 
-from fastapi import APIRouter
-from sqlalchemy import select
+from fastapi import APIRouter, Request, Response
+from sqlalchemy import func, select
 
 from src.api.dependencies import CurrentUser, DatabaseDep
-from src.db import User
+from src.core.http_cache import conditional_response, make_etag
+from src.db import User, UserRole
 from src.schemas import UserSummary
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("", response_model=list[UserSummary])
-async def list_users(current_user: CurrentUser, db: DatabaseDep) -> list[UserSummary]:
+async def list_users(
+    request: Request, response: Response, current_user: CurrentUser, db: DatabaseDep
+) -> list[UserSummary] | Response:
     """
     List all users (ID, Username).
     Useful for populating 'Assign To' dropdowns.
+
+    Supports conditional GET: the ETag is derived from a single aggregate
+    query over active users (count, max id/created_at, number of owners).
     """
+    count, max_id, last_created, owners = (
+        await db.execute(
+            select(
+                func.count(User.id),
+                func.max(User.id),
+                func.max(User.created_at),
+                func.count(User.id).filter(User.role == UserRole.OWNER.value),
+            ).where(User.is_active)
+        )
+    ).one()
+    etag = make_etag("users", count, max_id, last_created, owners)
+    if cached := conditional_response(request, response, etag):
+        return cached
+
     # In a real app, we might filter this or paginate.
     result = await db.execute(select(User).where(User.is_active))
     users = result.scalars().all()
@@ -0,0 +1,284 @@
+"""
+Admission Control Module
+========================
+
+Limita la concurrencia de la API por clase de ruta para que, si la base de
+datos se degrada, los requests no se acumulen en la cola del pool de
+SQLAlchemy hasta agotar su timeout:
+
+- Clases de ruta: ``auth``, ``reads``, ``writes`` y ``exports``, cada una con
+  su propio límite de requests en vuelo. Las rutas fuera de ``/api/``
+  (``/health``, ``/``, docs) no pasan por el control de admisión
+- El límite se adapta con un algoritmo de gradiente (estilo Gradient2): se
+  compara la latencia de cada request con una media de largo plazo; si la
+  latencia sube el límite baja, si se mantiene el límite crece mientras se
+  esté usando
+- Lo que supera el límite espera en una cola FIFO acotada; si la espera
+  supera ``ADMISSION_QUEUE_TIMEOUT_MS`` (o la cola está llena) se responde
+  503 con ``Retry-After``
+
+Así la sobrecarga se traduce en rechazos rápidos de lo que no se puede
+servir, manteniendo el throughput de lo admitido.
+
+Usage:
+    from src.core.admission_control import setup_admission_control
+    setup_admission_control(app)
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class RouteClassLimits:
+    """Límites de concurrencia de una clase de ruta (la cola admite ``max_limit``)."""
+
+    initial: int
+    min_limit: int
+    max_limit: int
+
+
+# El pool por defecto de SQLAlchemy admite 15 conexiones (5 + 10 de overflow)
+ROUTE_CLASS_LIMITS = {
+    "auth": RouteClassLimits(initial=4, min_limit=1, max_limit=16),  # bcrypt
+    "reads": RouteClassLimits(initial=10, min_limit=2, max_limit=64),
+    "writes": RouteClassLimits(initial=5, min_limit=1, max_limit=32),
+    "exports": RouteClassLimits(initial=2, min_limit=1, max_limit=4),
+    # Descarga de ficheros ya generados: sin DB, pero puede durar mucho
+    "downloads": RouteClassLimits(initial=4, min_limit=1, max_limit=16),
+}
+
+# Rutas que ocupan el hueco durante toda una exportación o importación
+# masiva: streaming de la respuesta o del cuerpo, o el job que corre como
+# background task tras el POST. También tienen el deadline largo
+EXPORT_ROUTES = frozenset(
+    {
+        ("GET", "/api/v1/tasks/export"),
+        ("GET", "/api/v1/activity/export"),
+        ("POST", "/api/v1/exports"),
+        ("POST", "/api/v1/tasks/import"),
+    }
+)
+EXPORT_JOBS_PREFIX = "/api/v1/exports/"
+
+
+def classify_route(method: str, path: str) -> str | None:
+    """Clase de ruta de un request (None si no pasa por el control de admisión)."""
+    if not path.startswith("/api/"):
+        return None
+    if path.startswith("/api/v1/auth/"):
+        return "auth"
+    if (method, path.rstrip("/")) in EXPORT_ROUTES:
+        return "exports"
+    if path.startswith(EXPORT_JOBS_PREFIX) and path.rstrip("/").endswith("/file"):
+        return "downloads"
+    # El estado de un job (GET /exports/{id}) es una lectura más
+    return "reads" if method in READ_METHODS else "writes"
+
+
+class GradientLimit:
+    """
+    Límite de concurrencia adaptativo por gradiente de latencia.
+
+    ``gradient = tolerance * long_rtt / rtt`` (acotado a [0.5, 1]): con la
+    latencia estable el límite crece en ``sqrt(limit)`` por muestra (suavizado);
+    si la latencia supera ``tolerance`` veces la de largo plazo, baja.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 100,
+    ) -> None:
+        self.value = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_window = long_window
+        self.long_rtt: float | None = None
+
+    def update(self, rtt: float, inflight: int) -> float:
+        """
+        Ajusta el límite con la latencia de un request completado.
+
+        Args:
+            rtt: Duración del request (segundos, sin la espera en cola)
+            inflight: Requests en vuelo cuando empezó a procesarse
+        """
+        rtt = max(rtt, 1e-6)
+        if self.long_rtt is None:
+            self.long_rtt = rtt
+        else:
+            self.long_rtt += (rtt - self.long_rtt) / self.long_window
+            # Tras una racha lenta la media de largo plazo vuelve antes a la normalidad
+            if self.long_rtt / rtt > 2:
+                self.long_rtt *= 0.95
+
+        # Con menos de la mitad del límite en uso no hay información sobre él
+        if inflight < self.value / 2:
+            return self.value
+
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / rtt))
+        new_limit = self.value * gradient + math.sqrt(self.value)
+        new_limit = self.value * (1 - self.smoothing) + new_limit * self.smoothing
+        self.value = max(self.min_limit, min(self.max_limit, new_limit))
+        return self.value
+
+
+class ConcurrencyGate:
+    """Límite de requests en vuelo de una clase de ruta, con cola FIFO acotada."""
+
+    def __init__(self, name: str, limits: RouteClassLimits, queue_timeout: float):
+        self.name = name
+        self.limit = GradientLimit(limits.initial, limits.min_limit, limits.max_limit)
+        self.queue_timeout = queue_timeout
+        self.max_queue = limits.max_limit
+        self.inflight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """
+        Espera un hueco como mucho ``queue_timeout`` segundos.
+
+        Returns:
+            False si el request se descarta (cola llena o espera agotada)
+        """
+        if not self._waiters and self.inflight < self.limit.value:
+            self.inflight += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # El hueco llegó a la vez que el timeout: se acepta
+                if isinstance(exc, TimeoutError):
+                    return True
+                self.release(None)
+            else:
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return False
+        return True
+
+    def release(self, rtt: float | None) -> None:
+        """Libera el hueco; si el request terminó, ajusta el límite con su latencia."""
+        if rtt is not None:
+            self.limit.update(rtt, self.inflight)
+        self.inflight -= 1
+        while self._waiters and self.inflight < self.limit.value:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self.inflight += 1
+
+
+class AdmissionController:
+    """
+    Un ``ConcurrencyGate`` por clase de ruta.
+
+    Attributes:
+        enabled: Si es False se admite todo sin límite
+        gates: Gate por clase de ruta
+    """
+
+    def __init__(
+        self, limits: dict[str, RouteClassLimits], queue_timeout: float
+    ) -> None:
+        self.enabled = True
+        self.gates = {
+            name: ConcurrencyGate(name, route_limits, queue_timeout)
+            for name, route_limits in limits.items()
+        }
+
+    def gate_for(self, method: str, path: str) -> ConcurrencyGate | None:
+        route_class = classify_route(method, path)
+        return self.gates.get(route_class) if route_class else None
+
+
+class AdmissionControlMiddleware:
+    """Aplica el control de admisión a cada request HTTP (ASGI puro)."""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        gate = (
+            self.controller.gate_for(scope["method"], scope["path"])
+            if scope["type"] == "http" and self.controller.enabled
+            else None
+        )
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await gate.acquire():
+            logger.warning(
+                f"Shedding {scope['method']} {scope['path']}: {gate.name} overloaded "
+                f"(limit={gate.limit.value:.1f}, queued={gate.queued})"
+            )
+            response = JSONResponse(
+                {"detail": "Server overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(max(math.ceil(gate.queue_timeout), 1))},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        completed = False
+        try:
+            await self.app(scope, receive, send)
+            completed = True
+        finally:
+            # Un request cancelado (cliente desconectado) no aporta latencia
+            gate.release(time.monotonic() - started if completed else None)
+
+
+# Instancia global (los tests la desactivan o sustituyen sus gates)
+admission_controller = AdmissionController(
+    ROUTE_CLASS_LIMITS, queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000
+)
+
+
+def setup_admission_control(app: FastAPI) -> None:
+    """
+    Registra el middleware de control de admisión.
+
+    Debe añadirse antes que el de seguridad para quedar por dentro del rate
+    limiting (los 429 no ocupan hueco) y que los 503 lleven security headers.
+    """
+    admission_controller.enabled = settings.ADMISSION_CONTROL_ENABLED
+    app.state.admission_controller = admission_controller
+    app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+    logger.info("Admission control configured")
@@ -0,0 +1,257 @@
+"""
+Compression Middleware Module
+=============================
+
+Comprime respuestas según el header Accept-Encoding:
+- gzip (siempre disponible)
+- zstd (si el paquete opcional ``zstandard`` está instalado; tiene prioridad)
+
+Características:
+- Umbral mínimo de tamaño para respuestas completas (no vale la pena
+  comprimir cuerpos pequeños)
+- Respuestas streaming (StreamingResponse) se comprimen chunk a chunk con
+  flush por chunk, sin acumular el cuerpo en memoria
+- Solo tipos de contenido comprimibles (JSON, NDJSON, CSV, texto...)
+- Añade ``Vary: Accept-Encoding`` y convierte el ETag en débil (W/) porque
+  la representación comprimida no es idéntica byte a byte. Se hace en toda
+  respuesta comprimible (y en los 304) cuando se negoció una codificación,
+  para que el 200 y el 304 anuncien siempre el mismo ETag
+- No toca respuestas 204/206/304, ya codificadas o con Content-Range
+
+Usage:
+    from src.core.compression_middleware import setup_compression_middleware
+    setup_compression_middleware(app)
+"""
+
+import logging
+import zlib
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependencia opcional
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+# Orden de preferencia cuando el cliente acepta varias con el mismo q
+_PREFERENCE = ("zstd", "gzip")
+
+
+def _supported_encodings() -> tuple[str, ...]:
+    return _PREFERENCE if zstandard is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """
+    Elige la codificación a usar según Accept-Encoding (con q-values).
+
+    Args:
+        accept_encoding: Valor del header Accept-Encoding
+
+    Returns:
+        "zstd", "gzip" o None si no hay ninguna aceptable
+    """
+    supported = _supported_encodings()
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name == "*":
+            for encoding in supported:
+                weights.setdefault(encoding, q)
+        elif name in supported:
+            weights[name] = q
+
+    candidates = [enc for enc in supported if weights.get(enc, 0.0) > 0]
+    if not candidates:
+        return None
+    # max() conserva el primero en caso de empate -> respeta _PREFERENCE
+    return max(candidates, key=lambda enc: weights[enc])
+
+
+def _is_compressible(content_type: str) -> bool:
+    return content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def _weaken_etag(message: Message) -> None:
+    """Convierte el ETag en débil: el cuerpo comprimido no es idéntico byte a byte."""
+    headers = MutableHeaders(scope=message)
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _Encoder:
+    """Compresor incremental con la misma interfaz para gzip y zstd."""
+
+    def __init__(self, encoding: str, gzip_level: int, zstd_level: int) -> None:
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+        else:
+            # wbits=31 -> contenedor gzip (header + CRC)
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Comprime un chunk; si no es el último, hace flush para emitirlo ya."""
+        if self.encoding == "zstd":
+            out = self._zstd.compress(data)
+            if final:
+                return out + self._zstd.flush()
+            return out + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        out = self._gzip.compress(data)
+        return out + self._gzip.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware de compresión negociada por Accept-Encoding.
+
+    Es un middleware ASGI puro (no BaseHTTPMiddleware) para poder comprimir
+    respuestas streaming sin acumularlas.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send,
+            _Encoder(encoding, self.gzip_level, self.zstd_level),
+            self.minimum_size,
+        )
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """Envuelve ``send``: retiene el start hasta ver el primer chunk del cuerpo."""
+
+    def __init__(self, send: Send, encoder: _Encoder, minimum_size: int) -> None:
+        self.send = send
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.start_message: Message | None = None
+        self.eligible = False
+        self.compressing = False
+
+    async def __call__(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.start_message = message
+            self.eligible = (
+                message["status"] not in (204, 206, 304)
+                and "content-encoding" not in headers
+                and "content-range" not in headers
+                and _is_compressible(headers.get("content-type", ""))
+            )
+            if self.eligible or message["status"] == 304:
+                # Mismo ETag (débil) en el 200 y en el 304, se comprima o no
+                _weaken_etag(message)
+            return
+
+        if message_type != "http.response.body":
+            # p.ej. http.response.pathsend (sendfile): se envía tal cual
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            # Primer chunk: decidir si se comprime
+            if not self.eligible or (not more_body and len(body) < self.minimum_size):
+                await self._flush_start()
+                await self.send(message)
+                return
+
+            self.compressing = True
+            headers = MutableHeaders(scope=self.start_message)
+            headers["Content-Encoding"] = self.encoder.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            data = self.encoder.compress(body, final=not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(data))
+            await self._flush_start()
+            await self.send(
+                {"type": "http.response.body", "body": data, "more_body": more_body}
+            )
+            return
+
+        if not self.compressing:
+            await self.send(message)
+            return
+
+        data = self.encoder.compress(body, final=not more_body)
+        await self.send(
+            {"type": "http.response.body", "body": data, "more_body": more_body}
+        )
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            await self.send(start)
+
+
+def setup_compression_middleware(app: FastAPI) -> None:
+    """
+    Registra el middleware de compresión con la configuración de settings.
+
+    Args:
+        app: The FastAPI application instance
+    """
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+    )
+    logger.info(
+        "Compression middleware configured "
+        f"(encodings={', '.join(_supported_encodings())}, "
+        f"minimum_size={settings.COMPRESSION_MINIMUM_SIZE})"
+    )
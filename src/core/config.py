@@ -18,6 +18,48 @@ class Settings(BaseSettings):
     CORS_ORIGINS: list[str]
     PROJECT_NAME: str = "Task Manager API"
 
+    # JSON serialization backend for API responses: auto | orjson | pydantic | std
+    JSON_RESPONSE_BACKEND: str = "auto"
+
+    # Response compression (gzip, plus zstd if the zstandard package is installed)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Asynchronous exports: output directory and file lifetime
+    EXPORT_DIR: str = "exports"
+    EXPORT_TTL_HOURS: int = 24
+
+    # Rate limiting: token-bucket storage (memory://, sqlite:///path or
+    # redis://host:port/db) and default limit per user / IP for the whole API
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    RATE_LIMIT_DEFAULT: str = "1000/hour"
+    # Requests are allowed (fail open) when the store takes longer than this
+    RATE_LIMIT_STORE_TIMEOUT_MS: int = 150
+
+    # Admission control: adaptive concurrency limits per route class (auth,
+    # reads, writes, exports); requests queued longer than this get a 503
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_QUEUE_TIMEOUT_MS: int = 2000
+
+    # Request deadlines (clients may ask for less with X-Request-Timeout-Ms);
+    # enforced with asyncio timeouts and PostgreSQL statement_timeout
+    REQUEST_TIMEOUT_MS: int = 10000
+    # Exports and bulk imports (POST /tasks/import)
+    EXPORT_REQUEST_TIMEOUT_MS: int = 120000
+
+    # Authenticated user cache per token (per worker); 0 disables it. Role
+    # changes and deactivations take up to this long to apply
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+
+    # Identical concurrent GETs on opted-in routes share one computation;
+    # the result may also be reused for this window (0 = in-flight only)
+    REQUEST_COALESCING_ENABLED: bool = True
+    REQUEST_COALESCING_WINDOW_MS: int = 0
+
+    # Nightly burndown snapshot job (disable when an external scheduler runs it)
+    BURNDOWN_SNAPSHOT_ENABLED: bool = True
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
@@ -0,0 +1,165 @@
+"""
+Request Deadlines Module
+========================
+
+Cada request de la API tiene un deadline: el de su clase de ruta
+(``REQUEST_TIMEOUT_MS``, o ``EXPORT_REQUEST_TIMEOUT_MS`` para exportaciones e
+importaciones masivas) o uno más corto que pida el cliente con
+``X-Request-Timeout-Ms``. El cliente puede acortarlo, nunca alargarlo.
+
+- ``DeadlineMiddleware`` ejecuta el request bajo ``asyncio.timeout``: al
+  vencer se cancela (las sesiones de ``get_db`` se cierran en su ``finally`` y
+  la conexión vuelve al pool) y se responde 504. Las background tasks, que
+  corren tras enviar la respuesta, quedan fuera del deadline
+- ``apply_statement_timeout`` (usado por ``get_db``) fija
+  ``SET LOCAL statement_timeout`` con el tiempo restante al empezar cada
+  transacción en PostgreSQL, para que el servidor aborte la query aunque el
+  cliente ya no la espere. Si salta, también se responde 504
+
+Usage:
+    from src.core.deadlines import setup_deadlines
+    setup_deadlines(app)
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.admission_control import classify_route
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout-Ms"
+
+# SQLSTATE de PostgreSQL para "canceling statement due to statement timeout"
+QUERY_CANCELED = "57014"
+
+# Deadline del request en curso (time.monotonic()), None fuera de un request
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def route_timeout(method: str, path: str) -> float | None:
+    """Timeout por defecto (segundos) de una ruta; None si no tiene deadline."""
+    route_class = classify_route(method, path)
+    if route_class is None:
+        return None
+    if route_class == "exports":
+        return settings.EXPORT_REQUEST_TIMEOUT_MS / 1000
+    return settings.REQUEST_TIMEOUT_MS / 1000
+
+
+def remaining_time() -> float | None:
+    """Segundos hasta el deadline del request en curso (None si no hay)."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def apply_statement_timeout(session: AsyncSession) -> None:
+    """
+    Limita cada transacción de ``session`` al tiempo restante del request.
+
+    Solo PostgreSQL (``SET LOCAL`` dura lo que la transacción); sin deadline
+    o en otros dialectos no hace nada.
+    """
+    if _deadline.get() is None:
+        return
+
+    @event.listens_for(session.sync_session, "after_begin")
+    def _set_statement_timeout(sync_session, transaction, connection) -> None:
+        remaining = remaining_time()
+        if remaining is None or connection.dialect.name != "postgresql":
+            return
+        # SET no admite parámetros; el valor es siempre un entero
+        timeout_ms = max(int(remaining * 1000), 1)
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    """True si ``exc`` es una consulta cancelada por ``statement_timeout``."""
+    if not isinstance(exc, DBAPIError):
+        return False
+    orig = exc.orig
+    return QUERY_CANCELED in (
+        getattr(orig, "sqlstate", None),
+        getattr(orig, "pgcode", None),
+    )
+
+
+class DeadlineMiddleware:
+    """Cancela los requests de la API que superan su deadline (ASGI puro)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timeout = (
+            route_timeout(scope["method"], scope["path"])
+            if scope["type"] == "http"
+            else None
+        )
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        requested = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+        if requested and requested.isdigit():
+            timeout = min(timeout, max(int(requested), 1) / 1000)
+
+        token = _deadline.set(time.monotonic() + timeout)
+        response_started = False
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+
+                async def send_with_deadline(message: Message) -> None:
+                    nonlocal response_started
+                    response_started = True
+                    await send(message)
+                    if message["type"] == "http.response.body" and not message.get(
+                        "more_body", False
+                    ):
+                        deadline.reschedule(None)  # Background tasks: sin deadline
+
+                await self.app(scope, receive, send_with_deadline)
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            await self._deadline_exceeded(scope, receive, send, response_started)
+        except DBAPIError as exc:
+            if not is_statement_timeout(exc):
+                raise
+            await self._deadline_exceeded(scope, receive, send, response_started)
+        finally:
+            _deadline.reset(token)
+
+    @staticmethod
+    async def _deadline_exceeded(
+        scope: Scope, receive: Receive, send: Send, response_started: bool
+    ) -> None:
+        logger.warning(f"Deadline exceeded: {scope['method']} {scope['path']}")
+        if response_started:
+            return  # Respuesta a medias (streaming): solo queda cortarla
+        response = JSONResponse(
+            {"detail": "Request deadline exceeded"}, status_code=504
+        )
+        await response(scope, receive, send)
+
+
+def setup_deadlines(app: FastAPI) -> None:
+    """
+    Registra el middleware de deadlines.
+
+    Debe ser el primero en añadirse (el más interno) para que el 504 pase por
+    la compresión, el control de admisión y los security headers.
+    """
+    app.add_middleware(DeadlineMiddleware)
+    logger.info("Request deadlines configured")
@@ -0,0 +1,111 @@
+"""
+Export helpers.
+Serialización por chunks a NDJSON / CSV para exportaciones en streaming.
+"""
+
+import csv
+import io
+import json
+import types
+from functools import cache
+from typing import AsyncIterator, Literal, Union, get_args, get_origin, get_type_hints
+
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _is_container(hint: object) -> bool:
+    """True si el tipo (o alguna rama de un ``X | None``) es una lista o dict."""
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        return any(_is_container(arg) for arg in get_args(hint))
+    return (origin or hint) in (list, dict)
+
+
+class RowEncoder:
+    """
+    Convierte chunks de filas (dicts con los campos de ``row_type``) a bytes.
+
+    Las filas vienen de la DB con los tipos correctos, así que se serializan
+    con un TypeAdapter sin validar (igual que el listado de tareas). En CSV,
+    los campos anidados (listas, dicts) van como JSON dentro de la celda.
+    """
+
+    def __init__(self, row_type: type, export_format: ExportFormat) -> None:
+        self.format = export_format
+        hints = get_type_hints(row_type)
+        self.fields = tuple(hints)
+        self._json_fields = tuple(
+            field for field, hint in hints.items() if _is_container(hint)
+        )
+        self._row_adapter = TypeAdapter(row_type)
+        self._rows_adapter = TypeAdapter(list[row_type])
+
+    def header(self) -> bytes:
+        """Cabecera del fichero (solo CSV)."""
+        if self.format == "csv":
+            return (",".join(self.fields) + "\r\n").encode("utf-8")
+        return b""
+
+    def encode(self, rows: list[dict]) -> bytes:
+        """Serializa un chunk de filas."""
+        if self.format == "ndjson":
+            return b"".join(self._row_adapter.dump_json(row) + b"\n" for row in rows)
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.fields)
+        # mode="json": fechas en ISO 8601, igual que en NDJSON
+        dumped = self._rows_adapter.dump_python(rows, mode="json")
+        for row in dumped if self._json_fields else ():
+            for field in self._json_fields:
+                if row[field] is not None:
+                    row[field] = json.dumps(row[field], separators=(",", ":"))
+        writer.writerows(dumped)
+        return buffer.getvalue().encode("utf-8")
+
+
+@cache
+def get_row_encoder(row_type: type, export_format: ExportFormat) -> RowEncoder:
+    """RowEncoder cacheado por tipo de fila y formato."""
+    return RowEncoder(row_type, export_format)
+
+
+def export_response(
+    chunks: AsyncIterator[list[dict]],
+    row_type: type,
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    StreamingResponse que serializa cada chunk según se lee de la DB.
+
+    Args:
+        chunks: Chunks de filas (ver ``TaskService.stream_rows``)
+        row_type: TypedDict con los campos de cada fila
+        export_format: "ndjson" o "csv"
+        filename: Nombre base del fichero descargado (sin extensión)
+    """
+    encoder = get_row_encoder(row_type, export_format)
+
+    async def body() -> AsyncIterator[bytes]:
+        if header := encoder.header():
+            yield header
+        async for rows in chunks:
+            yield encoder.encode(rows)
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format}"'
+            )
+        },
+    )
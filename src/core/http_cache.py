@@ -0,0 +1,67 @@
+"""
+HTTP conditional request helpers.
+Generación de ETags y manejo de If-None-Match para respuestas GET.
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Cache-Control para respuestas revalidables: el cliente puede guardar la
+# respuesta, pero debe revalidarla (If-None-Match) antes de reutilizarla.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Construye un ETag fuerte a partir de las partes que identifican la versión
+    del recurso (timestamps, contadores, filtros, etc.).
+
+    Args:
+        *parts: Valores que determinan el contenido de la respuesta
+
+    Returns:
+        ETag entre comillas, listo para el header
+    """
+    raw = "|".join(repr(part) for part in parts).encode("utf-8")
+    return f'"{hashlib.sha1(raw).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Verifica si el header If-None-Match del request coincide con el ETag.
+
+    Usa comparación débil (RFC 9110 §13.1.2): se ignora el prefijo ``W/``.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Respuesta 304 sin cuerpo para un ETag que el cliente ya tiene."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL},
+    )
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str
+) -> Response | None:
+    """
+    Aplica el ETag a la respuesta en curso.
+
+    Returns:
+        Una respuesta 304 si el cliente ya tiene esta versión, o None si el
+        handler debe continuar y generar el cuerpo (con el ETag ya asignado).
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+    return None
@@ -0,0 +1,95 @@
+"""
+Import parsers.
+Lectura incremental de NDJSON / CSV desde el cuerpo del request: se procesa
+chunk a chunk, sin cargar el fichero completo en memoria.
+
+Cada parser produce tuplas ``(row, record)`` donde ``record`` es un dict o,
+si la fila no se pudo leer, un str con el error.
+"""
+
+import codecs
+import csv
+import json
+from typing import AsyncIterator
+
+ParsedRecord = tuple[int, dict | str]
+
+
+async def _iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Divide el stream en líneas de texto (UTF-8, con o sin BOM).
+
+    Raises:
+        UnicodeDecodeError: Si el cuerpo no es UTF-8 válido
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in stream:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def iter_ndjson_records(
+    stream: AsyncIterator[bytes],
+) -> AsyncIterator[ParsedRecord]:
+    """Un objeto JSON por línea; ``row`` es el número de línea (se saltan vacías)."""
+    line_number = 0
+    async for line in _iter_lines(stream):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Expected a JSON object"
+            continue
+        yield line_number, record
+
+
+async def iter_csv_records(stream: AsyncIterator[bytes]) -> AsyncIterator[ParsedRecord]:
+    """
+    CSV con cabecera; ``row`` es el número de registro (sin contar la cabecera).
+
+    Un registro puede ocupar varias líneas si tiene saltos de línea entre
+    comillas: se acumulan líneas hasta que el número de comillas es par.
+    Los valores vacíos se omiten (el schema aplica sus valores por defecto).
+    """
+    header: list[str] | None = None
+    buffer: list[str] = []
+    quotes = 0
+    row_number = 0
+
+    async for line in _iter_lines(stream):
+        buffer.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue  # Campo entre comillas todavía abierto
+
+        values = next(csv.reader(["\n".join(buffer)]), [])
+        buffer, quotes = [], 0
+        if not any(value.strip() for value in values):
+            continue  # Línea vacía
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield (
+            row_number,
+            {name: value for name, value in zip(header, values) if value != ""},
+        )
+
+    if buffer:
+        yield row_number + 1, "Unterminated quoted field"
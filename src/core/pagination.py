@@ -0,0 +1,67 @@
+"""
+Cursor pagination helpers.
+Codifica/decodifica cursores opacos sobre la clave (created_at, id) y
+watermarks de sincronización incremental.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Codifica la posición de una fila como cursor opaco.
+
+    Args:
+        created_at: Timestamp de la última fila de la página
+        row_id: ID de la última fila de la página
+
+    Returns:
+        Cursor en base64 url-safe
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decodifica un cursor generado por ``encode_cursor``.
+
+    Args:
+        cursor: Cursor opaco recibido del cliente
+
+    Returns:
+        Tupla (created_at, id)
+
+    Raises:
+        ValueError: Si el cursor está malformado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_watermark(timestamp: datetime) -> str:
+    """Codifica un timestamp de sincronización como token opaco."""
+    raw = timestamp.isoformat().encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_watermark(token: str) -> datetime:
+    """
+    Decodifica un token generado por ``encode_watermark``.
+
+    Raises:
+        ValueError: Si el token está malformado
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        return datetime.fromisoformat(raw)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid watermark") from exc
@@ -0,0 +1,72 @@
+"""
+Principal cache.
+Cache en memoria (por worker) del usuario autenticado, indexada por token, para
+que ``get_current_user`` no consulte la base de datos en cada request.
+
+Se guardan solo las columnas del usuario (nunca instancias ORM, que pertenecen
+a una sesión). Una entrada vive ``PRINCIPAL_CACHE_TTL_SECONDS`` como mucho y
+nunca más allá del ``exp`` del token; un cambio de rol o una desactivación
+tarda como mucho ese TTL en aplicarse.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.core.config import settings
+
+
+class PrincipalCache:
+    """Cache TTL + LRU de columnas de usuario por token."""
+
+    def __init__(self, ttl: float, max_entries: int = 10000) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        # El token no se guarda en claro
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Columnas del usuario del token, o None si no está o ha expirado."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return values
+
+    def put(
+        self, token: str, values: dict[str, Any], token_exp: float | None = None
+    ) -> None:
+        """
+        Guarda el usuario de un token ya validado.
+
+        Args:
+            token: JWT
+            values: Columnas del usuario
+            token_exp: Claim ``exp`` del token (epoch), si lo tiene
+        """
+        if self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        key = self._key(token)
+        self._entries[key] = (expires_at, values)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
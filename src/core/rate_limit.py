@@ -0,0 +1,178 @@
+"""
+Rate Limiting Module
+====================
+
+Rate limiter con token buckets y almacenamiento intercambiable (ver
+``src.core.rate_limit_stores``):
+- Límite por defecto para toda la API (``RateLimitMiddleware``), por usuario
+  si el request trae un JWT válido y por IP si no
+- Límites por endpoint con el decorador ``limiter.limit("5/minute")``, por IP
+  (login, registro)
+
+Al superar el límite se responde 429 con ``Retry-After``. Si el store falla
+o no responde a tiempo (p. ej. Redis caído o inalcanzable) el request se deja
+pasar y se registra el error: el rate limiting no debe tumbar la API.
+
+Usage:
+    limiter = RateLimiter(create_store("memory://"), default_limit="1000/hour")
+
+    @router.post("/login")
+    @limiter.limit("5/minute")
+    async def login(request: Request, ...): ...
+"""
+
+import asyncio
+import functools
+import logging
+import math
+from typing import Callable
+
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.rate_limit_stores import RateLimit, RateLimitResult, TokenBucketStore
+from src.core.security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+
+def client_ip(request: Request) -> str:
+    """Clave por IP del cliente."""
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def user_or_ip(request: Request) -> str:
+    """Clave por usuario si el Bearer token es válido; por IP si no."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = decode_access_token(token)
+        if payload and payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return client_ip(request)
+
+
+def _limit_headers(limit: RateLimit, result: RateLimitResult) -> dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(limit.amount),
+        "X-RateLimit-Remaining": str(result.remaining),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(math.ceil(result.retry_after), 1))
+    return headers
+
+
+class RateLimitExceeded(HTTPException):
+    """429 con los headers de rate limit (lo gestiona el handler de FastAPI)."""
+
+    def __init__(self, limit: RateLimit, result: RateLimitResult) -> None:
+        super().__init__(
+            status_code=429,
+            detail="Rate limit exceeded",
+            headers=_limit_headers(limit, result),
+        )
+
+
+class RateLimiter:
+    """
+    Rate limiter de la API.
+
+    Attributes:
+        enabled: Si es False no se aplica ningún límite (tests)
+        store: Almacenamiento de los buckets
+        default_limit: Límite del middleware para toda la API
+        timeout: Segundos que se espera al store antes de dejar pasar el
+            request (conexión incluida)
+    """
+
+    def __init__(
+        self, store: TokenBucketStore, default_limit: str, timeout: float = 0.15
+    ) -> None:
+        self.enabled = True
+        self.store = store
+        self.default_limit = RateLimit.parse(default_limit)
+        self.timeout = timeout
+
+    async def acquire(self, key: str, limit: RateLimit) -> RateLimitResult:
+        """Consume un token de ``key`` (fail-open si el store falla o tarda)."""
+        try:
+            async with asyncio.timeout(self.timeout):
+                return await self.store.acquire(key, limit)
+        except TimeoutError:
+            logger.error(
+                f"Rate limit store timed out after {self.timeout}s, allowing request"
+            )
+        except Exception:
+            logger.exception("Rate limit store unavailable, allowing request")
+        return RateLimitResult(True, limit.amount, 0.0)
+
+    def limit(
+        self, limit_value: str, key_func: Callable[[Request], str] = client_ip
+    ) -> Callable:
+        """
+        Decorador de endpoint con un límite propio (bucket por endpoint y clave).
+
+        El endpoint debe recibir ``request: Request``.
+        """
+        limit = RateLimit.parse(limit_value)
+
+        def decorator(endpoint: Callable) -> Callable:
+            scope = f"{endpoint.__module__}.{endpoint.__name__}"
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if self.enabled and isinstance(request, Request):
+                    result = await self.acquire(f"{scope}:{key_func(request)}", limit)
+                    if not result.allowed:
+                        logger.warning(f"Rate limit exceeded on {scope}")
+                        raise RateLimitExceeded(limit, result)
+                return await endpoint(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+class RateLimitMiddleware:
+    """
+    Aplica ``limiter.default_limit`` a las rutas ``/api/`` (ASGI puro).
+
+    Añade ``X-RateLimit-Limit`` / ``X-RateLimit-Remaining`` a las respuestas
+    y responde 429 con ``Retry-After`` al agotar el bucket.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter) -> None:
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.limiter.enabled
+            or not scope["path"].startswith("/api/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limiter.default_limit
+        key = user_or_ip(Request(scope))
+        result = await self.limiter.acquire(f"default:{key}", limit)
+        headers = _limit_headers(limit, result)
+
+        if not result.allowed:
+            logger.warning(f"Rate limit exceeded for {key}")
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"}, status_code=429, headers=headers
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
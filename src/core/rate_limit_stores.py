@@ -0,0 +1,400 @@
+"""
+Rate Limit Stores
+=================
+
+Almacenamiento de token buckets para el rate limiter:
+- ``MemoryTokenBucketStore``: en proceso, LRU acotado (un límite por worker)
+- ``SQLiteTokenBucketStore``: fichero SQLite compartido por los workers de
+  un mismo host (transacciones ``BEGIN IMMEDIATE``)
+- ``RedisTokenBucketStore``: compartido entre hosts; habla el protocolo de
+  Redis (RESP) directamente y actualiza cada bucket con WATCH/MULTI/EXEC
+
+Todos guardan por clave ``(tokens, updated)`` y calculan el rellenado al
+consultar, así que no hay tareas de fondo. Una clave cuyo bucket ya estaría
+lleno equivale a una clave inexistente y se puede descartar (expiración en
+Redis, limpieza periódica en SQLite, LRU en memoria).
+
+Usage:
+    store = create_store("memory://?max_keys=10000")
+    store = create_store("sqlite:////var/run/taskmanager/ratelimit.db")
+    store = create_store("redis://localhost:6379/0")
+    store = create_store("redis://:password@localhost:6379/0")
+"""
+
+import asyncio
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+from urllib.parse import parse_qs, unquote, urlsplit
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_LIMIT_RE = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Límite "N/periodo" como token bucket.
+
+    Capacidad N (ráfaga máxima) y rellenado continuo de N tokens por periodo.
+    """
+
+    amount: int
+    period: int  # Segundos
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parsea "5/minute", "1000/hour"..."""
+        match = _LIMIT_RE.match(value)
+        if not match:
+            raise ValueError(f"Invalid rate limit: {value!r}")
+        return cls(int(match[1]), _PERIODS[match[2]])
+
+    @property
+    def rate(self) -> float:
+        """Tokens por segundo."""
+        return self.amount / self.period
+
+    def __str__(self) -> str:
+        return f"{self.amount}/{self.period}s"
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float  # Segundos hasta tener tokens suficientes (0 si allowed)
+
+
+def take_tokens(
+    tokens: float | None, updated: float, now: float, limit: RateLimit, cost: int
+) -> tuple[float, RateLimitResult]:
+    """
+    Rellena el bucket hasta ``now`` e intenta consumir ``cost`` tokens.
+
+    Args:
+        tokens: Tokens guardados (None si la clave no existe: bucket lleno)
+        updated: Momento en que se guardaron
+        now: Momento actual (mismo reloj que ``updated``)
+
+    Returns:
+        (tokens tras la operación, resultado)
+    """
+    if tokens is None:
+        tokens = float(limit.amount)
+    else:
+        elapsed = max(now - updated, 0.0)
+        tokens = min(float(limit.amount), tokens + elapsed * limit.rate)
+
+    if tokens >= cost:
+        tokens -= cost
+        return tokens, RateLimitResult(True, int(tokens), 0.0)
+    return tokens, RateLimitResult(False, 0, (cost - tokens) / limit.rate)
+
+
+def seconds_until_full(tokens: float, limit: RateLimit) -> float:
+    """Tiempo hasta que el bucket vuelve a estar lleno (y la clave sobra)."""
+    return (limit.amount - tokens) / limit.rate
+
+
+class TokenBucketStore(Protocol):
+    async def acquire(
+        self, key: str, limit: RateLimit, cost: int = 1
+    ) -> RateLimitResult: ...
+
+    async def clear(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryTokenBucketStore:
+    """
+    Buckets en memoria del proceso, como mucho ``max_keys`` (LRU).
+
+    Expulsar una clave equivale a rellenar su bucket, así que ``max_keys``
+    debe cubrir holgadamente los clientes activos en un periodo.
+    """
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def acquire(
+        self, key: str, limit: RateLimit, cost: int = 1
+    ) -> RateLimitResult:
+        # Sin awaits: la operación es atómica dentro del event loop
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (None, now))
+        tokens, result = take_tokens(tokens, updated, now, limit, cost)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return result
+
+    async def clear(self) -> None:
+        self._buckets.clear()
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteTokenBucketStore:
+    """
+    Buckets en un fichero SQLite compartido por los procesos del host.
+
+    Cada operación es una transacción ``BEGIN IMMEDIATE`` (lock de escritura
+    del fichero), ejecutada en un thread para no bloquear el event loop.
+    Cada ``PRUNE_EVERY`` operaciones se borran los buckets ya llenos.
+    """
+
+    PRUNE_EVERY = 1000
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._operations = 0
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+
+    def _acquire(self, key: str, limit: RateLimit, cost: int) -> RateLimitResult:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()  # Reloj compartido entre procesos
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                tokens, result = take_tokens(
+                    row[0] if row else None, row[1] if row else now, now, limit, cost
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets VALUES (?, ?, ?, ?)",
+                    (key, tokens, now, now + seconds_until_full(tokens, limit)),
+                )
+                self._operations += 1
+                if self._operations % self.PRUNE_EVERY == 0:
+                    self._conn.execute(
+                        "DELETE FROM rate_limit_buckets WHERE expires_at < ?", (now,)
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return result
+
+    async def acquire(
+        self, key: str, limit: RateLimit, cost: int = 1
+    ) -> RateLimitResult:
+        return await asyncio.to_thread(self._acquire, key, limit, cost)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_limit_buckets")
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RespError(Exception):
+    """Respuesta de error (-ERR ...) del servidor Redis."""
+
+
+class RespConnection:
+    """Conexión mínima al protocolo de Redis (RESP2): comandos y respuestas."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def open(
+        cls,
+        host: str,
+        port: int,
+        db: int = 0,
+        username: str | None = None,
+        password: str | None = None,
+    ) -> "RespConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+        try:
+            # AUTH antes que cualquier otro comando (ACL de Redis 6 si hay usuario)
+            if password is not None:
+                credentials = (username, password) if username else (password,)
+                await connection.execute("AUTH", *credentials)
+            if db:
+                await connection.execute("SELECT", db)
+        except BaseException:
+            await connection.close()
+            raise
+        return connection
+
+    async def execute(self, *args) -> object:
+        """Envía un comando y devuelve la respuesta (errores como RespError)."""
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._writer.write(b"".join(parts))
+        await self._writer.drain()
+        reply = await self._read_reply()
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def _read_reply(self) -> object:
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            return RespError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            size = int(payload)
+            if size < 0:
+                return None
+            data = await self._reader.readexactly(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            size = int(payload)
+            if size < 0:
+                return None
+            return [await self._read_reply() for _ in range(size)]
+        raise ConnectionError(f"Invalid RESP reply: {line!r}")
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+class RedisTokenBucketStore:
+    """
+    Buckets en Redis, compartidos entre workers y hosts.
+
+    Cada bucket es un string "tokens:updated" con expiración = tiempo hasta
+    volver a estar lleno (la memoria no crece con claves inactivas). La
+    actualización es optimista: WATCH, lectura, MULTI/SET/EXEC; si otro
+    cliente modificó la clave, EXEC falla y se reintenta. Se usa el reloj
+    del servidor (TIME) para que todos los nodos compartan referencia.
+
+    WATCH es por conexión, así que cada operación toma una conexión del pool.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        pool_size: int = 10,
+        username: str | None = None,
+        password: str | None = None,
+    ) -> None:
+        self.host, self.port, self.db = host, port, db
+        self.username, self.password = username, password
+        self._pool: asyncio.LifoQueue[RespConnection] = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def _execute_with_connection(self, operation):
+        async with self._slots:
+            try:
+                connection = self._pool.get_nowait()
+            except asyncio.QueueEmpty:
+                connection = await RespConnection.open(
+                    self.host, self.port, self.db, self.username, self.password
+                )
+            try:
+                result = await operation(connection)
+            except BaseException:
+                await connection.close()  # Estado desconocido: no se reutiliza
+                raise
+            self._pool.put_nowait(connection)
+            return result
+
+    async def acquire(
+        self, key: str, limit: RateLimit, cost: int = 1
+    ) -> RateLimitResult:
+        async def operation(connection: RespConnection) -> RateLimitResult:
+            for _ in range(self.MAX_ATTEMPTS):
+                await connection.execute("WATCH", key)
+                stored = await connection.execute("GET", key)
+                seconds, micros = await connection.execute("TIME")
+                now = int(seconds) + int(micros) / 1_000_000
+
+                if stored:
+                    saved_tokens, saved_at = stored.split(b":")
+                    previous = (float(saved_tokens), float(saved_at))
+                else:
+                    previous = (None, now)
+                tokens, result = take_tokens(*previous, now, limit, cost)
+                if not result.allowed:
+                    await connection.execute("UNWATCH")
+                    return result
+
+                ttl_ms = max(math.ceil(seconds_until_full(tokens, limit) * 1000), 1)
+                await connection.execute("MULTI")
+                await connection.execute("SET", key, f"{tokens}:{now}", "PX", ttl_ms)
+                if await connection.execute("EXEC") is not None:
+                    return result
+            # Contención persistente sobre la misma clave: se trata como exceso
+            return RateLimitResult(False, 0, 1 / limit.rate)
+
+        return await self._execute_with_connection(operation)
+
+    async def clear(self) -> None:
+        async def operation(connection: RespConnection) -> None:
+            await connection.execute("FLUSHDB")
+
+        await self._execute_with_connection(operation)
+
+    async def close(self) -> None:
+        while not self._pool.empty():
+            await self._pool.get_nowait().close()
+
+
+def create_store(uri: str) -> TokenBucketStore:
+    """
+    Crea el store a partir de su URI.
+
+    - ``memory://`` (opcional ``?max_keys=N``)
+    - ``sqlite:///ruta/relativa.db`` o ``sqlite:////ruta/absoluta.db``
+    - ``redis://[usuario:password@]host:puerto/db`` (opcional ``?pool_size=N``)
+    """
+    parts = urlsplit(uri)
+    options = {name: int(values[-1]) for name, values in parse_qs(parts.query).items()}
+    if parts.scheme == "memory":
+        return MemoryTokenBucketStore(**options)
+    if parts.scheme == "sqlite":
+        return SQLiteTokenBucketStore(parts.path.removeprefix("/"))
+    if parts.scheme == "redis":
+        return RedisTokenBucketStore(
+            host=parts.hostname or "localhost",
+            port=parts.port or 6379,
+            db=int(parts.path.strip("/") or 0),
+            username=unquote(parts.username) if parts.username else None,
+            password=unquote(parts.password) if parts.password is not None else None,
+            **options,
+        )
+    raise ValueError(f"Unsupported rate limit storage: {uri!r}")
@@ -0,0 +1,103 @@
+"""
+Fast JSON responses.
+Response class del proyecto: serializa directamente a bytes con orjson (si
+está instalado) o con pydantic-core, sin pasar por json.dumps.
+
+El backend se elige con ``settings.JSON_RESPONSE_BACKEND``:
+    - "auto": orjson si está disponible, si no pydantic-core
+    - "orjson": requiere el paquete orjson
+    - "pydantic": pydantic_core.to_json
+    - "std": json.dumps (comportamiento por defecto de Starlette)
+"""
+
+import json
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback de orjson para tipos que no conoce (modelos pydantic, etc.)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    # Decimal, Enum, set, ... con el mismo criterio que pydantic
+    return json.loads(to_json(value))
+
+
+def _dumps_orjson(content: Any) -> bytes:
+    return orjson.dumps(
+        content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _dumps_pydantic(content: Any) -> bytes:
+    # to_json serializa modelos pydantic, listas y datetimes directamente
+    return to_json(content)
+
+
+def _dumps_std(content: Any) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def get_json_dumps(backend: str) -> Callable[[Any], bytes]:
+    """
+    Devuelve la función de serialización para el backend configurado.
+
+    Raises:
+        ValueError: Si el backend no existe o orjson no está instalado
+    """
+    backend = backend.lower()
+    if backend == "auto":
+        backend = "orjson" if orjson is not None else "pydantic"
+    if backend == "orjson":
+        if orjson is None:
+            raise ValueError("JSON_RESPONSE_BACKEND=orjson requires 'orjson'")
+        return _dumps_orjson
+    if backend == "pydantic":
+        return _dumps_pydantic
+    if backend == "std":
+        return _dumps_std
+    raise ValueError(f"Unknown JSON_RESPONSE_BACKEND: {backend}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse que serializa directamente a bytes.
+
+    Acepta dicts/listas ya serializables (lo que FastAPI le pasa tras aplicar
+    ``response_model``) y también modelos pydantic o listas de modelos, de
+    modo que un handler puede devolver ``FastJSONResponse(models)`` y evitar
+    el paso intermedio a dict.
+    """
+
+    dumps: Callable[[Any], bytes] = staticmethod(
+        get_json_dumps(settings.JSON_RESPONSE_BACKEND)
+    )
+
+    def render(self, content: Any) -> bytes:
+        if _is_model_content(content):
+            # pydantic-core serializa los modelos en Rust, sin pasar por dict
+            return to_json(content)
+        return self.dumps(content)
+
+
+def _is_model_content(content: Any) -> bool:
+    """True si el contenido es un modelo pydantic o una lista de modelos."""
+    if isinstance(content, BaseModel):
+        return True
+    return (
+        isinstance(content, list)
+        and bool(content)
+        and isinstance(content[0], BaseModel)
+    )
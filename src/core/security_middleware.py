@@ -3,7 +3,9 @@ Security Middleware Module
 ==========================
 
 Provides security-related middleware for the FastAPI application:
-- Rate Limiting (DDoS protection, brute force prevention)
+- Rate Limiting (DDoS protection, brute force prevention): token buckets
+  per user (or per IP when unauthenticated) for the whole API, plus
+  per-IP limits on auth endpoints. See src.core.rate_limit
 - Security Headers (HSTS, CSP, X-Frame-Options, etc.)
 
 Usage:
@@ -15,18 +17,23 @@ import logging
 from typing import Callable
 
 from fastapi import FastAPI, Request, Response
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.core.config import settings
+from src.core.http_cache import REVALIDATE_CACHE_CONTROL
+from src.core.rate_limit import RateLimiter, RateLimitMiddleware
+from src.core.rate_limit_stores import create_store
+
 logger = logging.getLogger(__name__)
 
 # Rate Limiter Configuration
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["1000/hour"],  # Default limit for all endpoints
-    storage_uri="memory://",  # Use Redis in production: "redis://localhost:6379"
+# Storage: memory:// (per worker), sqlite:///path (shared by the workers of
+# one host) or redis://host:port/db (shared across hosts)
+limiter = RateLimiter(
+    store=create_store(settings.RATE_LIMIT_STORAGE_URI),
+    default_limit=settings.RATE_LIMIT_DEFAULT,  # Per user / IP, whole API
+    # Fail open if the store hangs (e.g. unreachable Redis)
+    timeout=settings.RATE_LIMIT_STORE_TIMEOUT_MS / 1000,
 )
 
 
@@ -42,7 +49,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Content-Security-Policy: Prevents injection attacks
     - Referrer-Policy: Controls referrer information
     - Permissions-Policy: Restricts browser APIs
-    - Cache-Control: Prevents caching of sensitive data
+    - Cache-Control: Prevents caching of sensitive data. Responses that carry
+      an ETag are revalidatable instead ("private, no-cache").
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -82,12 +90,17 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "geolocation=(), microphone=(), camera=(), payment=()"
         )
 
-        # Prevent caching of API responses (for sensitive data)
+        # Prevent caching of API responses (for sensitive data).
+        # Responses with an ETag may be stored privately but must be
+        # revalidated with If-None-Match before every reuse.
         if "/api/" in request.url.path:
-            response.headers["Cache-Control"] = (
-                "no-store, no-cache, must-revalidate, private"
-            )
-            response.headers["Pragma"] = "no-cache"
+            if "etag" in response.headers:
+                response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+            else:
+                response.headers["Cache-Control"] = (
+                    "no-store, no-cache, must-revalidate, private"
+                )
+                response.headers["Pragma"] = "no-cache"
 
         return response
 
@@ -97,7 +110,7 @@ def setup_security_middleware(app: FastAPI) -> None:
     Configure all security middleware for the application.
 
     This function should be called during app startup to enable:
-    - Rate limiting (with SlowAPI)
+    - Rate limiting (token buckets, see src.core.rate_limit)
     - Security headers
     - Request logging for security events
 
@@ -107,8 +120,9 @@ def setup_security_middleware(app: FastAPI) -> None:
     # Add rate limiter state
     app.state.limiter = limiter
 
-    # Add rate limit exceeded handler
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    # Default rate limit, added first so that 429 responses also get the
+    # security headers
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
 
     # Add security headers middleware
     app.add_middleware(SecurityHeadersMiddleware)
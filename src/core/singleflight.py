@@ -0,0 +1,135 @@
+"""
+Request coalescing (singleflight).
+Los GET idénticos y concurrentes comparten una sola ejecución: el primero
+(leader) calcula el resultado y el resto espera y lo reutiliza, sin consultas
+propias ni conexión del pool.
+
+Es opt-in por ruta: el endpoint elige la clave con ``request_key`` (ruta,
+query normalizada y clase de visibilidad del usuario) y envuelve el cálculo
+con ``request_coalescer.do``. Solo debe usarse con lecturas idempotentes cuyo
+resultado dependa únicamente de esa clave.
+
+Opcionalmente, un resultado ya calculado se reutiliza durante
+``REQUEST_COALESCING_WINDOW_MS``. Cualquier commit de este worker descarta las
+ejecuciones en curso y los resultados guardados, para que quien acaba de
+escribir no lea un resultado anterior a su propia escritura.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.deadlines import is_statement_timeout
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Ejecuciones compartidas por clave, con ventana de reutilización opcional."""
+
+    def __init__(self, window: float = 0.0, enabled: bool = True) -> None:
+        self.window = window
+        self.enabled = enabled
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._recent: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Resultado de ``fn()`` para ``key``, compartido con las llamadas
+        concurrentes con la misma clave.
+
+        Si el leader falla, todos reciben la misma excepción. Si el leader se
+        cancela (cliente desconectado) o agota su deadline (timeout o
+        ``statement_timeout``), el siguiente que esperaba pasa a ser leader y
+        lo vuelve a intentar con el suyo.
+        """
+        if not self.enabled:
+            return await fn()
+
+        while True:
+            if (recent := self._recent_value(key)) is not None:
+                return recent[0]
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                # shield: cancelar a quien espera no cancela a los demás
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await fn()
+        except BaseException as exc:
+            if _leader_only(exc):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()  # Marcada como recuperada
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        future.set_result(value)
+        if self.window > 0 and generation == self._generation:
+            self._remember(key, value)
+        return value
+
+    def forget(self) -> None:
+        """Las llamadas siguientes no reutilizan nada calculado hasta ahora."""
+        self._generation += 1
+        self._inflight.clear()
+        self._recent.clear()
+
+    def _recent_value(self, key: Hashable) -> tuple[Any] | None:
+        now = time.monotonic()
+        # Las entradas se insertan en orden de expiración
+        while self._recent and next(iter(self._recent.values()))[0] <= now:
+            self._recent.popitem(last=False)
+        entry = self._recent.get(key)
+        return None if entry is None else (entry[1],)
+
+    def _remember(self, key: Hashable, value: Any) -> None:
+        self._recent[key] = (time.monotonic() + self.window, value)
+        self._recent.move_to_end(key)
+
+
+def _leader_only(exc: BaseException) -> bool:
+    """Errores que dependen del request del leader, no del resultado."""
+    return isinstance(
+        exc, (asyncio.CancelledError, TimeoutError)
+    ) or is_statement_timeout(exc)
+
+
+def request_key(request: Request, *scope: Hashable) -> tuple:
+    """
+    Clave de coalescing de un request: método, ruta, query normalizada
+    (parámetros ordenados) y el ``scope`` que indique el endpoint (p. ej. la
+    clase de visibilidad del usuario).
+    """
+    query = tuple(sorted(request.query_params.multi_items()))
+    return (request.method, request.url.path, query, *scope)
+
+
+request_coalescer = SingleFlight(
+    window=settings.REQUEST_COALESCING_WINDOW_MS / 1000,
+    enabled=settings.REQUEST_COALESCING_ENABLED,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_on_commit(session: Session) -> None:
+    request_coalescer.forget()
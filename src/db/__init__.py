@@ -7,7 +7,11 @@ Centraliza imports de componentes de base de datos.
 from src.db.activity_logs import ActivityLog
 from src.db.base import AsyncSessionLocal, Base, engine
 from src.db.comments import Comment
+from src.db.export_jobs import ExportJob
 from src.db.notifications import Notification
+from src.db.task_daily_snapshots import TaskDailySnapshot
+from src.db.task_snapshots import TaskSnapshot
+from src.db.task_tombstones import TaskTombstone
 from src.db.tasks import Task
 from src.db.user_roles import UserRole
 
@@ -26,6 +30,10 @@ __all__ = [
     "Comment",
     "ActivityLog",
     "Notification",
+    "TaskTombstone",
+    "ExportJob",
+    "TaskDailySnapshot",
+    "TaskSnapshot",
     # Enums
     "UserRole",
 ]
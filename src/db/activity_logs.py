@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -12,6 +13,23 @@ if TYPE_CHECKING:
 
 class ActivityLog(Base):
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        # Keyset pagination del historial por entidad
+        Index(
+            "ix_activity_logs_entity_created_at_id",
+            "entity_type",
+            "entity_id",
+            "created_at",
+            "id",
+        ),
+        # Historial filtrado por campo: changes @> '[{"field": "status"}]'
+        Index(
+            "ix_activity_logs_changes",
+            "changes",
+            postgresql_using="gin",
+            postgresql_ops={"changes": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -20,12 +38,17 @@ class ActivityLog(Base):
     )
     action: Mapped[str] = mapped_column(
         String(50), nullable=False
-    )  # CREATE, UPDATE, DELETE, ASSIGN, COMMENT
+    )  # CREATE, UPDATE, DELETE, ASSIGN, COMMENT, IMPORT_TASKS
     entity_type: Mapped[str] = mapped_column(
         String(20), nullable=False
-    )  # task, comment
+    )  # task, comment, user (importaciones)
     entity_id: Mapped[int] = mapped_column(nullable=False)
     details: Mapped[str] = mapped_column(String(500), nullable=True)
+    # Cambios estructurados de UPDATE_TASK: [{"field", "old", "new"}, ...]
+    changes: Mapped[list[dict] | None] = mapped_column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
@@ -0,0 +1,58 @@
+"""
+Export job model.
+Define la tabla 'export_jobs': exportaciones asíncronas de tareas / actividad.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class ExportJob(Base):
+    """
+    Export job model.
+
+    Un worker en background escribe el fichero comprimido en disco y va
+    actualizando ``rows_written``. Estados: 'pending', 'running', 'done', 'failed'
+    """
+
+    __tablename__ = "export_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    # Qué se exporta
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)  # tasks, activity
+    format: Mapped[str] = mapped_column(String(10), nullable=False)  # ndjson, csv
+    status_filter: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    search: Mapped[str | None] = mapped_column(String(200), nullable=True)
+
+    # Progreso
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending"
+    )  # "pending", "running", "done", "failed"
+    rows_written: Mapped[int] = mapped_column(nullable=False, default=0)
+    total_rows: Mapped[int | None] = mapped_column(nullable=True)
+    error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    # Fichero resultante (relativo a settings.EXPORT_DIR)
+    file_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        nullable=True,
+        index=True,  # Limpieza por TTL
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExportJob(id={self.id}, kind='{self.kind}', status='{self.status}')>"
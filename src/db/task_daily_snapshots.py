@@ -0,0 +1,49 @@
+"""
+Task daily snapshot model.
+Define la tabla 'task_daily_snapshots': distribución de tareas por día, para
+burndown y cumulative flow.
+"""
+
+from datetime import date
+
+from sqlalchemy import Date, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class TaskDailySnapshot(Base):
+    """
+    Número de tareas de un día por (status, owner, assignee).
+
+    Guarda owner/assignee (sin FK, es un histórico) para aplicar el mismo
+    filtro de visibilidad que en el listado de tareas. Cada día tiene como
+    mucho estados x owners x assignees filas.
+    """
+
+    __tablename__ = "task_daily_snapshots"
+    __table_args__ = (
+        # Un snapshot por día; NULLS NOT DISTINCT para assigned_to_id = NULL
+        UniqueConstraint(
+            "day",
+            "status",
+            "owner_id",
+            "assigned_to_id",
+            name="uq_task_daily_snapshots_group",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    owner_id: Mapped[int] = mapped_column(nullable=False)
+    assigned_to_id: Mapped[int | None] = mapped_column(nullable=True)
+    task_count: Mapped[int] = mapped_column(nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TaskDailySnapshot(day={self.day}, status={self.status}, "
+            f"count={self.task_count})>"
+        )
@@ -0,0 +1,50 @@
+"""
+Task snapshot model.
+Define la tabla 'task_snapshots': estado completo de una tarea cada cierto
+número de cambios, para reconstruir la tarea en una fecha (``as_of``).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class TaskSnapshot(Base):
+    """
+    Estado de una tarea tras un cambio concreto del activity log.
+
+    ``state`` tiene los campos de TaskResponse serializados a JSON. El estado
+    en otra fecha se obtiene aplicando los ``changes`` de los UPDATE_TASK
+    posteriores (o deshaciendo los anteriores) a partir del snapshot.
+    """
+
+    __tablename__ = "task_snapshots"
+    __table_args__ = (
+        # Snapshot más cercano a una fecha para una tarea
+        Index("ix_task_snapshots_task_taken_at", "task_id", "taken_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    task_id: Mapped[int] = mapped_column(
+        ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
+    )
+    # Último cambio incluido en el snapshot (y su fecha)
+    activity_log_id: Mapped[int] = mapped_column(nullable=False)
+    taken_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Versión de la tarea en el snapshot (None en los anteriores a la columna)
+    version: Mapped[int | None] = mapped_column(nullable=True)
+
+    state: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TaskSnapshot(task_id={self.task_id}, version={self.version}, "
+            f"taken_at={self.taken_at})>"
+        )
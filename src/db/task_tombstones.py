@@ -0,0 +1,46 @@
+"""
+Task tombstone model.
+Registra las tareas eliminadas (o que dejaron de ser visibles para un
+usuario) para la sincronización incremental.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class TaskTombstone(Base):
+    """
+    Marca de borrado de una tarea.
+
+    Guarda owner/assignee al momento del borrado para aplicar el mismo
+    filtro de visibilidad que en el listado de tareas.
+
+    Con ``reason="revoked"`` la tarea sigue existiendo pero ``assigned_to_id``
+    (el assignee anterior) ya no la ve: solo cuenta para ese usuario.
+    """
+
+    __tablename__ = "task_tombstones"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    # Sin FK: la tarea ya no existe
+    task_id: Mapped[int] = mapped_column(nullable=False)
+    owner_id: Mapped[int] = mapped_column(nullable=False)
+    assigned_to_id: Mapped[int | None] = mapped_column(nullable=True)
+    reason: Mapped[str] = mapped_column(
+        String(10), default="deleted", server_default="deleted", nullable=False
+    )
+
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TaskTombstone(task_id={self.task_id}, reason={self.reason}, "
+            f"deleted_at={self.deleted_at})>"
+        )
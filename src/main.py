@@ -2,17 +2,31 @@
 Main FastAPI application (ASYNC).
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.v1 import auth, notifications, tasks, users
+from src.api.v1 import (
+    activity,
+    analytics,
+    auth,
+    exports,
+    notifications,
+    tasks,
+    users,
+)
+from src.core.admission_control import setup_admission_control
+from src.core.compression_middleware import setup_compression_middleware
 from src.core.config import settings
+from src.core.deadlines import setup_deadlines
 from src.core.logging_config import setup_logging
+from src.core.responses import FastJSONResponse
 from src.core.security_middleware import setup_security_middleware
-from src.db import Base, engine
+from src.db import AsyncSessionLocal, Base, engine
+from src.services import BurndownService
 
 # Setup logging
 setup_logging(log_level=settings.LOG_LEVEL)
@@ -34,9 +48,20 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     logger.info("✅ Database tables created/verified")
 
+    # Job nocturno de snapshots para burndown
+    snapshot_job = None
+    if settings.BURNDOWN_SNAPSHOT_ENABLED:
+        snapshot_job = asyncio.create_task(
+            BurndownService.run_nightly(AsyncSessionLocal)
+        )
+
     yield
 
-    # Shutdown: cerrar conexiones
+    # Shutdown: parar jobs y cerrar conexiones
+    if snapshot_job:
+        snapshot_job.cancel()
+        with suppress(asyncio.CancelledError):
+            await snapshot_job
     logger.info("👋 Shutting down Task Manager API")
     await engine.dispose()
     logger.info("✅ Database connections closed")
@@ -48,8 +73,22 @@ app = FastAPI(
     version="1.0.0",
     description="Task Manager API - Take-home assignment",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# Request deadlines (504 + statement_timeout). El más interno, para que el 504
+# pase por el resto de middlewares.
+setup_deadlines(app)
+
+# Compression middleware (gzip / zstd negotiated by Accept-Encoding).
+# Se registra antes que el de seguridad para quedar por dentro: así ve la
+# respuesta original (y su tamaño) en lugar del stream de BaseHTTPMiddleware.
+setup_compression_middleware(app)
+
+# Admission control (adaptive concurrency limits + load shedding with 503).
+# Por dentro del rate limiting: los requests rechazados con 429 no ocupan hueco.
+setup_admission_control(app)
+
 # Security middleware (Rate Limiting + Security Headers)
 setup_security_middleware(app)
 
@@ -59,8 +98,20 @@ app.add_middleware(
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "Accept"],
-    expose_headers=["X-Total-Count", "X-RateLimit-Limit", "X-RateLimit-Remaining"],
+    allow_headers=[
+        "Authorization",
+        "Content-Type",
+        "Accept",
+        "If-Match",
+        "X-Request-Timeout-Ms",
+    ],
+    expose_headers=[
+        "ETag",
+        "X-Total-Count",
+        "X-Next-Cursor",
+        "X-RateLimit-Limit",
+        "X-RateLimit-Remaining",
+    ],
     max_age=3600,
 )
 
@@ -69,6 +120,9 @@ app.include_router(auth.router, prefix="/api/v1")
 app.include_router(tasks.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
 app.include_router(notifications.router, prefix="/api/v1")
+app.include_router(activity.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
+app.include_router(analytics.router, prefix="/api/v1")
 
 
 # Root endpoint
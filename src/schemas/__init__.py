@@ -6,12 +6,27 @@ Orquesta todos los schemas para request/response validation.
 
 # Auth schemas
 # Activity Log schemas
-from src.schemas.activity_log import ActivityLogResponse
+from src.schemas.activity_log import (
+    ActivityChange,
+    ActivityField,
+    ActivityLogResponse,
+    ActivityLogRow,
+)
+
+# Analytics schemas
+from src.schemas.analytics import (
+    AssigneeThroughput,
+    DurationStats,
+    FlowMetricsResponse,
+)
 from src.schemas.auth import LoginRequest, Token, TokenData
 
 # Comment schemas
 from src.schemas.comment import CommentCreate, CommentResponse
 
+# Export schemas
+from src.schemas.export_job import ExportJobCreate, ExportJobResponse
+
 # Notification schemas
 from src.schemas.notification import (
     NotificationCreate,
@@ -19,8 +34,31 @@ from src.schemas.notification import (
     NotificationResponse,
 )
 
+# Pagination schemas
+from src.schemas.pagination import Page
+
 # Task schemas
-from src.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from src.schemas.task import (
+    BurndownPoint,
+    BurndownResponse,
+    BurndownSnapshotResponse,
+    TaskAssigneeCount,
+    TaskBatchGetRequest,
+    TaskBatchGetResponse,
+    TaskBulkItemResult,
+    TaskBulkRequest,
+    TaskBulkResponse,
+    TaskBulkUpdate,
+    TaskChangesResponse,
+    TaskCreate,
+    TaskDetailResponse,
+    TaskImportResponse,
+    TaskImportRowError,
+    TaskResponse,
+    TaskRow,
+    TaskStatsResponse,
+    TaskUpdate,
+)
 
 # User schemas
 from src.schemas.user import UserCreate, UserLogin, UserResponse, UserSummary
@@ -39,11 +77,39 @@ __all__ = [
     "TaskCreate",
     "TaskUpdate",
     "TaskResponse",
+    "TaskRow",
+    "TaskDetailResponse",
+    "TaskChangesResponse",
+    "TaskBulkRequest",
+    "TaskBulkUpdate",
+    "TaskBulkItemResult",
+    "TaskBulkResponse",
+    "TaskBatchGetRequest",
+    "TaskBatchGetResponse",
+    "TaskImportRowError",
+    "TaskImportResponse",
+    "TaskAssigneeCount",
+    "BurndownPoint",
+    "BurndownResponse",
+    "BurndownSnapshotResponse",
+    "TaskStatsResponse",
     # Comment
     "CommentCreate",
     "CommentResponse",
     # Activity
+    "ActivityChange",
+    "ActivityField",
     "ActivityLogResponse",
+    "ActivityLogRow",
+    # Analytics
+    "DurationStats",
+    "AssigneeThroughput",
+    "FlowMetricsResponse",
+    # Pagination
+    "Page",
+    # Export
+    "ExportJobCreate",
+    "ExportJobResponse",
     # Notification
     "NotificationCreate",
     "NotificationResponse",
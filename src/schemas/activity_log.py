@@ -1,6 +1,19 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel
+from typing_extensions import TypedDict  # pydantic no acepta typing.TypedDict < 3.12
+
+# Campos de una tarea que registran cambios en el historial (ver TaskUpdate)
+ActivityField = Literal["title", "description", "status", "due_date", "assigned_to_id"]
+
+
+class ActivityChange(TypedDict):
+    """Un cambio de campo; las fechas se guardan en ISO 8601."""
+
+    field: str
+    old: str | int | None
+    new: str | int | None
 
 
 class ActivityLogResponse(BaseModel):
@@ -10,6 +23,20 @@ class ActivityLogResponse(BaseModel):
     entity_type: str
     entity_id: int
     details: str | None
+    changes: list[ActivityChange] | None = None
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ActivityLogRow(TypedDict):
+    """Mismos campos que ActivityLogResponse, como dict plano (sin validación)."""
+
+    id: int
+    user_id: int
+    action: str
+    entity_type: str
+    entity_id: int
+    details: str | None
+    changes: list[ActivityChange] | None
+    created_at: datetime
@@ -0,0 +1,38 @@
+"""
+Analytics Pydantic schemas.
+Define la estructura de las métricas de flujo (lead/cycle time, throughput).
+"""
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class DurationStats(BaseModel):
+    """Distribución de una duración, en horas (None si no hay muestras)."""
+
+    count: int
+    mean_hours: float | None
+    p50_hours: float | None
+    p85_hours: float | None
+    p95_hours: float | None
+
+
+class AssigneeThroughput(BaseModel):
+    """Tareas terminadas por semana para un assignee (None = sin asignar)."""
+
+    assigned_to_id: int | None
+    total: int
+    weekly: list[int]  # Alineado con FlowMetricsResponse.week_starts
+    rolling_avg: list[float]  # Media móvil de las últimas semanas
+
+
+class FlowMetricsResponse(BaseModel):
+    """Schema para GET /analytics/flow."""
+
+    since: date
+    until: date
+    week_starts: list[date]
+    lead_time: DurationStats  # Creación -> done
+    cycle_time: DurationStats  # Primer in_progress -> done
+    throughput: list[AssigneeThroughput]
@@ -0,0 +1,38 @@
+"""
+Export job Pydantic schemas.
+Define la estructura de datos para las exportaciones asíncronas.
+"""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from src.core.export import ExportFormat
+
+
+class ExportJobCreate(BaseModel):
+    """Schema para POST /exports."""
+
+    kind: Literal["tasks", "activity"]
+    format: ExportFormat = "ndjson"
+    # Filtros de tareas (mismos que GET /tasks); se ignoran para "activity"
+    status: str | None = Field(None, max_length=20)
+    search: str | None = Field(None, max_length=200)
+
+
+class ExportJobResponse(BaseModel):
+    """Estado y progreso de una exportación."""
+
+    id: int
+    kind: str
+    format: str
+    status: str
+    rows_written: int
+    total_rows: int | None
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+    expires_at: datetime | None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,18 @@
+"""
+Pagination schemas.
+Estructuras genéricas para respuestas paginadas.
+"""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Página de resultados."""
+
+    items: list[T]
+    has_more: bool = False
+    next_cursor: str | None = None
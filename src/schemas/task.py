@@ -3,9 +3,17 @@ Task Pydantic schemas.
 Define la estructura de datos para Task requests/responses.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+from typing_extensions import TypedDict  # pydantic no acepta typing.TypedDict < 3.12
+
+from src.schemas.activity_log import ActivityLogResponse
+from src.schemas.comment import CommentResponse
+from src.schemas.pagination import Page
+
+# Máximo de operaciones por request en POST /tasks/bulk
+BULK_MAX_ITEMS = 500
 
 
 # Base schema con campos comunes
@@ -46,5 +54,155 @@ class TaskResponse(TaskBase):
     assigned_to_id: int | None
     created_at: datetime
     updated_at: datetime
+    # Solo para el ETag (If-Match); no forma parte del JSON
+    version: int = Field(1, exclude=True)
 
     model_config = {"from_attributes": True}  # Permite crear desde ORM models
+
+
+# Fila de tarea ya validada por la DB (fast path de serialización)
+class TaskRow(TypedDict):
+    """Mismos campos que TaskResponse, como dict plano (sin validación)."""
+
+    id: int
+    title: str
+    description: str | None
+    status: str
+    due_date: datetime | None
+    assigned_to_id: int | None
+    owner_id: int
+    created_at: datetime
+    updated_at: datetime
+
+
+# Schema para el detalle agregado (task + comments + history)
+class TaskDetailResponse(BaseModel):
+    """Schema para GET /tasks/{task_id}/detail."""
+
+    task: TaskResponse
+    comments: Page[CommentResponse]
+    history: Page[ActivityLogResponse]
+
+
+# Schema para sincronización incremental
+class TaskChangesResponse(BaseModel):
+    """Schema para GET /tasks/changes."""
+
+    changed: list[TaskResponse]
+    deleted_ids: list[int]
+    watermark: str  # Token a enviar como ?since= en la siguiente llamada
+
+
+# Schemas para operaciones en lote
+class TaskBulkUpdate(BaseModel):
+    """Cambio de una tarea dentro de POST /tasks/bulk."""
+
+    id: int
+    status: str | None = Field(None, pattern="^(todo|in_progress|done)$")
+    assigned_to_id: int | None = None
+    due_date: datetime | None = None
+
+
+class TaskBulkRequest(BaseModel):
+    """Schema para POST /tasks/bulk."""
+
+    create: list[TaskCreate] = []
+    update: list[TaskBulkUpdate] = []
+    delete: list[int] = []
+
+    @model_validator(mode="after")
+    def check_size(self) -> "TaskBulkRequest":
+        total = len(self.create) + len(self.update) + len(self.delete)
+        if total > BULK_MAX_ITEMS:
+            raise ValueError(f"At most {BULK_MAX_ITEMS} operations per request")
+        return self
+
+
+class TaskBulkItemResult(BaseModel):
+    """Resultado de una operación individual del lote."""
+
+    op: str  # "create", "update", "delete"
+    index: int  # Posición dentro de la lista de esa operación
+    id: int | None = None
+    status_code: int
+    detail: str | None = None
+
+
+class TaskBulkResponse(BaseModel):
+    """Schema para la respuesta de POST /tasks/bulk."""
+
+    results: list[TaskBulkItemResult]
+
+
+# Schemas para lectura en lote por ids
+class TaskBatchGetRequest(BaseModel):
+    """Schema para POST /tasks/batch-get."""
+
+    ids: list[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBatchGetResponse(BaseModel):
+    """Tareas encontradas + ids sin permiso + ids inexistentes."""
+
+    tasks: list[TaskResponse]
+    forbidden: list[int]
+    missing: list[int]
+
+
+# Schemas para importación masiva (POST /tasks/import)
+class TaskImportRowError(BaseModel):
+    """Fila rechazada durante la importación."""
+
+    row: int  # Línea (NDJSON) o número de registro sin cabecera (CSV)
+    detail: str
+
+
+class TaskImportResponse(BaseModel):
+    """Resumen de la importación con el detalle de las filas rechazadas."""
+
+    created: int
+    failed: int
+    errors: list[TaskImportRowError]
+    errors_truncated: bool = False  # True si hubo más errores de los listados
+
+
+# Schemas para estadísticas del dashboard (GET /tasks/stats)
+class TaskAssigneeCount(BaseModel):
+    """Número de tareas por assignee (None = sin asignar)."""
+
+    assigned_to_id: int | None
+    count: int
+
+
+class TaskStatsResponse(BaseModel):
+    """Conteos agregados de las tareas visibles para el usuario."""
+
+    total: int
+    by_status: dict[str, int]
+    by_assignee: list[TaskAssigneeCount]
+    overdue: int  # No terminadas con due_date vencido
+    due_soon: int  # No terminadas que vencen dentro de DUE_SOON_WINDOW
+
+
+# Schemas para burndown / cumulative flow (GET /tasks/burndown)
+class BurndownPoint(BaseModel):
+    """Distribución de tareas al cierre de un día (snapshot diario)."""
+
+    day: date
+    by_status: dict[str, int]
+    remaining: int  # No terminadas
+
+
+class BurndownResponse(BaseModel):
+    """Un punto por día con snapshot en el rango (los días sin snapshot se omiten)."""
+
+    start: date
+    end: date
+    points: list[BurndownPoint]
+
+
+class BurndownSnapshotResponse(BaseModel):
+    """Resultado de tomar el snapshot de un día."""
+
+    day: date
+    groups: int  # Filas (status, owner, assignee) escritas
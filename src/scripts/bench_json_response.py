@@ -0,0 +1,122 @@
+"""
+JSON Response Benchmark
+=======================
+
+Compara la serialización de respuestas grandes (``list[TaskResponse]`` y
+``list[NotificationResponse]``):
+
+    - FastAPI + JSONResponse: valida contra response_model, convierte a dict
+      (``mode="json"``) y serializa con json.dumps
+    - FastAPI + FastJSONResponse: mismo camino, pero render con el backend
+      configurado (orjson / pydantic-core)
+    - FastJSONResponse(models): el handler devuelve los modelos y se
+      serializan directamente a bytes, sin dict intermedio
+
+No usa la base de datos.
+
+Usage:
+    # From project root
+    uv run python -m src.scripts.bench_json_response
+    uv run python -m src.scripts.bench_json_response --rows 50000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from src.core.config import settings
+from src.core.responses import FastJSONResponse
+from src.schemas import NotificationResponse, TaskResponse
+
+
+def _tasks(rows: int) -> list[TaskResponse]:
+    now = datetime.utcnow()
+    return [
+        TaskResponse(
+            id=i,
+            title=f"Task {i}",
+            description="Lorem ipsum dolor sit amet. " * 8,
+            status=("todo", "in_progress", "done")[i % 3],
+            due_date=now + timedelta(days=i % 30),
+            assigned_to_id=i % 10 or None,
+            owner_id=1 + i % 10,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def _notifications(rows: int) -> list[NotificationResponse]:
+    now = datetime.utcnow()
+    return [
+        NotificationResponse(
+            id=i,
+            user_id=1 + i % 10,
+            task_id=i,
+            type="task_updated",
+            title="Task Updated",
+            message=f"alice updated the task: Task {i}",
+            is_read=bool(i % 2),
+            created_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def _measure(name: str, fn, rows: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<36} {best * 1000:9.1f} ms   {rows / best:>12,.0f} rows/s")
+    return best
+
+
+def _bench(label: str, models: list[BaseModel], repeat: int) -> None:
+    rows = len(models)
+    adapter = TypeAdapter(list[type(models[0])])
+
+    def via_response_model(response_class):
+        # Lo que hace FastAPI con response_model antes de llamar a render()
+        content = adapter.dump_python(adapter.validate_python(models), mode="json")
+        return response_class(content).body
+
+    print(f"\n{label} ({rows:,} items, best of {repeat})")
+    baseline = _measure(
+        "response_model + JSONResponse",
+        lambda: via_response_model(JSONResponse),
+        rows,
+        repeat,
+    )
+    _measure(
+        "response_model + FastJSONResponse",
+        lambda: via_response_model(FastJSONResponse),
+        rows,
+        repeat,
+    )
+    direct = _measure(
+        "FastJSONResponse(models)",
+        lambda: FastJSONResponse(models).body,
+        rows,
+        repeat,
+    )
+    print(f"  Speedup (direct vs baseline): {baseline / direct:.1f}x")
+
+
+def main(rows: int, repeat: int) -> None:
+    print(f"JSON_RESPONSE_BACKEND={settings.JSON_RESPONSE_BACKEND}")
+    _bench("list[TaskResponse]", _tasks(rows), repeat)
+    _bench("list[NotificationResponse]", _notifications(rows), repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
@@ -0,0 +1,129 @@
+"""
+Task List Serialization Benchmark
+=================================
+
+Compara el camino anterior de GET /tasks (instancias ORM + model_validate +
+validación/serialización de FastAPI vía response_model) con el fast path de
+``TaskService.list_tasks_json`` (columnas con SQLAlchemy Core + TypeAdapter
+cacheado, sin re-validación).
+
+Usa SQLite en memoria (requiere ``aiosqlite``), así que no toca la DB real.
+Las tareas se crean sin ``due_date`` para que el chequeo lazy de
+notificaciones de vencimiento (común a ambos caminos) no domine la medición.
+
+Usage:
+    # From project root
+    uv run python -m src.scripts.bench_task_list
+    uv run python -m src.scripts.bench_task_list --rows 50000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.db import Base, Task, User, UserRole
+from src.schemas import TaskResponse
+from src.services import TaskService
+
+
+async def _seed(session_maker: async_sessionmaker, rows: int) -> User:
+    """Crea un owner, unos miembros y ``rows`` tareas."""
+    async with session_maker() as db:
+        owner = User(
+            username="bench_owner",
+            email="bench_owner@example.com",
+            hashed_password="x",
+            role=UserRole.OWNER.value,
+        )
+        members = [
+            User(
+                username=f"bench{i}", email=f"bench{i}@example.com", hashed_password="x"
+            )
+            for i in range(10)
+        ]
+        db.add_all([owner, *members])
+        await db.flush()
+
+        await db.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"Task {i}",
+                    "description": "Lorem ipsum dolor sit amet. " * 8,
+                    "status": ("todo", "in_progress", "done")[i % 3],
+                    "owner_id": members[i % len(members)].id,
+                    "assigned_to_id": members[(i + 1) % len(members)].id,
+                }
+                for i in range(rows)
+            ],
+        )
+        await db.commit()
+        return owner
+
+
+async def _orm_path(session_maker: async_sessionmaker, user: User) -> bytes:
+    """Camino anterior: ORM + model_validate + response_model de FastAPI."""
+    async with session_maker() as db:
+        tasks = (await db.execute(select(Task))).scalars().all()
+        models = [TaskResponse.model_validate(task) for task in tasks]
+
+    # FastAPI: valida contra response_model, lo pasa a dict y json.dumps
+    adapter = TypeAdapter(list[TaskResponse])
+    content = adapter.dump_python(
+        adapter.validate_python(models, from_attributes=True), mode="json"
+    )
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+async def _fast_path(session_maker: async_sessionmaker, user: User) -> bytes:
+    """Camino actual: ``TaskService.list_tasks_json``."""
+    async with session_maker() as db:
+        return await TaskService.list_tasks_json(user, db)
+
+
+async def _measure(name: str, fn, session_maker, user, rows: int, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = await fn(session_maker, user)
+        best = min(best, time.perf_counter() - start)
+    assert len(json.loads(body)) == rows
+    print(f"{name:<28} {best * 1000:9.1f} ms   {rows / best:>12,.0f} rows/s")
+    return best
+
+
+async def main(rows: int, repeat: int) -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    owner = await _seed(session_maker, rows)
+    print(f"GET /tasks serialization, {rows:,} tasks, best of {repeat}\n")
+    before = await _measure(
+        "ORM + response_model", _orm_path, session_maker, owner, rows, repeat
+    )
+    after = await _measure(
+        "Core + TypeAdapter", _fast_path, session_maker, owner, rows, repeat
+    )
+    print(f"\nSpeedup: {before / after:.1f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
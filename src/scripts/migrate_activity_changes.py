@@ -0,0 +1,153 @@
+"""
+Activity Changes Migration
+==========================
+
+Añade la columna ``activity_logs.changes`` (JSONB en PostgreSQL, JSON en el
+resto) con su índice GIN y la rellena a partir del texto de ``details`` de los
+UPDATE_TASK existentes ("campo: viejo -> nuevo, campo: viejo -> nuevo").
+
+Usage:
+    # From project root
+    uv run python -m src.scripts.migrate_activity_changes
+    uv run python -m src.scripts.migrate_activity_changes --batch-size 5000
+
+    # Or with Docker
+    docker-compose exec api python -m src.scripts.migrate_activity_changes
+
+Features:
+    - Idempotente: solo procesa filas con ``changes`` a NULL
+    - Por lotes (keyset por id), un commit por lote
+    - ``details`` se conserva tal cual; las entradas que no se pueden
+      interpretar quedan con ``changes = []``
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+from datetime import datetime
+from typing import get_args
+
+from sqlalchemy import bindparam, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.config import settings
+from src.db import ActivityLog
+from src.schemas import ActivityChange, ActivityField
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_FIELDS = "|".join(get_args(ActivityField))
+# Un valor puede contener ", ": el siguiente cambio empieza en ", <campo>: "
+LEGACY_CHANGE_RE = re.compile(
+    rf"(?:^|, )({_FIELDS}): (.*?) -> (.*?)(?=, (?:{_FIELDS}): |$)", re.DOTALL
+)
+
+
+def _legacy_value(field: str, value: str) -> str | int | None:
+    """Recupera el tipo del valor a partir de su ``str()``."""
+    if value == "None":
+        return None
+    if field == "assigned_to_id" and value.isdigit():
+        return int(value)
+    if field == "due_date":
+        try:
+            return datetime.fromisoformat(value).isoformat()
+        except ValueError:
+            return value  # Truncado por el límite de details
+    return value
+
+
+def parse_legacy_details(details: str | None) -> list[ActivityChange]:
+    """Convierte "campo: viejo -> nuevo, ..." en cambios estructurados."""
+    return [
+        ActivityChange(
+            field=field,
+            old=_legacy_value(field, old),
+            new=_legacy_value(field, new),
+        )
+        for field, old, new in LEGACY_CHANGE_RE.findall(details or "")
+    ]
+
+
+def _add_changes_column(connection) -> None:
+    """ALTER TABLE + índice, si la columna todavía no existe."""
+    table = ActivityLog.__table__
+    existing = {
+        column["name"] for column in inspect(connection).get_columns("activity_logs")
+    }
+    if "changes" not in existing:
+        column_type = table.c.changes.type.compile(dialect=connection.dialect)
+        connection.exec_driver_sql(
+            f"ALTER TABLE activity_logs ADD COLUMN changes {column_type}"
+        )
+        logger.info("Added column activity_logs.changes")
+    if connection.dialect.name == "postgresql":
+        for index in table.indexes:
+            if index.name == "ix_activity_logs_changes":
+                index.create(connection, checkfirst=True)
+
+
+async def migrate(engine: AsyncEngine, batch_size: int = 1000) -> int:
+    """
+    Ejecuta la migración.
+
+    Returns:
+        Número de entradas de actividad rellenadas
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(_add_changes_column)
+
+    table = ActivityLog.__table__
+    fill = (
+        update(table)
+        .where(table.c.id == bindparam("log_id"))
+        .values(changes=bindparam("log_changes"))
+    )
+    migrated = 0
+    last_id = 0
+    while True:
+        async with engine.begin() as conn:
+            rows = (
+                await conn.execute(
+                    select(table.c.id, table.c.details)
+                    .where(
+                        table.c.action == "UPDATE_TASK",
+                        table.c.changes.is_(None),
+                        table.c.id > last_id,
+                    )
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not rows:
+                break
+            await conn.execute(
+                fill,
+                [
+                    {"log_id": log_id, "log_changes": parse_legacy_details(details)}
+                    for log_id, details in rows
+                ],
+            )
+        migrated += len(rows)
+        last_id = rows[-1].id
+        logger.info(f"Migrated {migrated} activity entries")
+
+    return migrated
+
+
+async def main(batch_size: int) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        migrated = await migrate(engine, batch_size)
+    finally:
+        await engine.dispose()
+    logger.info(f"✅ Done: {migrated} activity entries migrated")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
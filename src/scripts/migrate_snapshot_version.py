@@ -0,0 +1,81 @@
+"""
+Snapshot Version Migration
+==========================
+
+Añade la columna ``task_snapshots.version`` a bases de datos creadas antes de
+que existiera y la rellena para los snapshots existentes. Cada incremento de
+``tasks.version`` registra un ``UPDATE_TASK``: la versión de un snapshot es 1
+más los ``UPDATE_TASK`` de la tarea hasta su ``activity_log_id``.
+
+Usage:
+    # From project root
+    uv run python -m src.scripts.migrate_snapshot_version
+
+    # Or with Docker
+    docker-compose exec api python -m src.scripts.migrate_snapshot_version
+
+Features:
+    - Idempotente: no hace nada si la columna ya existe
+    - Un ALTER TABLE y un único UPDATE con subconsulta correlacionada
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.config import settings
+from src.db import ActivityLog, TaskSnapshot
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _add_version_column(connection) -> bool:
+    """ALTER TABLE + backfill si la columna todavía no existe."""
+    existing = {
+        column["name"] for column in inspect(connection).get_columns("task_snapshots")
+    }
+    if "version" in existing:
+        return False
+    connection.exec_driver_sql("ALTER TABLE task_snapshots ADD COLUMN version INTEGER")
+
+    updates = (
+        select(func.count(ActivityLog.id))
+        .where(
+            ActivityLog.entity_type == "task",
+            ActivityLog.entity_id == TaskSnapshot.task_id,
+            ActivityLog.action == "UPDATE_TASK",
+            ActivityLog.id <= TaskSnapshot.activity_log_id,
+        )
+        .scalar_subquery()
+    )
+    connection.execute(update(TaskSnapshot).values(version=1 + updates))
+    return True
+
+
+async def migrate(engine: AsyncEngine) -> bool:
+    """
+    Ejecuta la migración.
+
+    Returns:
+        True si se añadió la columna
+    """
+    async with engine.begin() as conn:
+        return await conn.run_sync(_add_version_column)
+
+
+async def main() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        added = await migrate(engine)
+    finally:
+        await engine.dispose()
+    logger.info(
+        "✅ Added column task_snapshots.version" if added else "✅ Nothing to do"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+Task Version Migration
+======================
+
+Añade la columna ``tasks.version`` (concurrencia optimista, If-Match) a bases
+de datos creadas antes de que existiera. Las tareas existentes empiezan en la
+versión 1.
+
+Usage:
+    # From project root
+    uv run python -m src.scripts.migrate_task_version
+
+    # Or with Docker
+    docker-compose exec api python -m src.scripts.migrate_task_version
+
+Features:
+    - Idempotente: no hace nada si la columna ya existe
+    - Un único ALTER TABLE con DEFAULT (sin reescribir la tabla en PostgreSQL 11+)
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.config import settings
+from src.db import Task
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _add_version_column(connection) -> bool:
+    """ALTER TABLE si la columna todavía no existe."""
+    existing = {column["name"] for column in inspect(connection).get_columns("tasks")}
+    if "version" in existing:
+        return False
+    column_type = Task.__table__.c.version.type.compile(dialect=connection.dialect)
+    connection.exec_driver_sql(
+        f"ALTER TABLE tasks ADD COLUMN version {column_type} NOT NULL DEFAULT 1"
+    )
+    return True
+
+
+async def migrate(engine: AsyncEngine) -> bool:
+    """
+    Ejecuta la migración.
+
+    Returns:
+        True si se añadió la columna
+    """
+    async with engine.begin() as conn:
+        return await conn.run_sync(_add_version_column)
+
+
+async def main() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        added = await migrate(engine)
+    finally:
+        await engine.dispose()
+    logger.info("✅ Added column tasks.version" if added else "✅ Nothing to do")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
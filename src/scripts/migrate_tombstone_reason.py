@@ -0,0 +1,75 @@
+"""
+Tombstone Reason Migration
+==========================
+
+Añade la columna ``task_tombstones.reason`` a bases de datos creadas antes de
+que existiera. Los tombstones existentes son todos de borrado (``deleted``);
+los ``revoked`` (tarea reasignada fuera de un usuario) solo se escriben a
+partir de ahora.
+
+Usage:
+    # From project root
+    uv run python -m src.scripts.migrate_tombstone_reason
+
+    # Or with Docker
+    docker-compose exec api python -m src.scripts.migrate_tombstone_reason
+
+Features:
+    - Idempotente: no hace nada si la columna ya existe
+    - Un único ALTER TABLE con DEFAULT (sin reescribir la tabla en PostgreSQL 11+)
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.config import settings
+from src.db import TaskTombstone
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _add_reason_column(connection) -> bool:
+    """ALTER TABLE si la columna todavía no existe."""
+    existing = {
+        column["name"] for column in inspect(connection).get_columns("task_tombstones")
+    }
+    if "reason" in existing:
+        return False
+    column_type = TaskTombstone.__table__.c.reason.type.compile(
+        dialect=connection.dialect
+    )
+    connection.exec_driver_sql(
+        f"ALTER TABLE task_tombstones ADD COLUMN reason {column_type} "
+        "NOT NULL DEFAULT 'deleted'"
+    )
+    return True
+
+
+async def migrate(engine: AsyncEngine) -> bool:
+    """
+    Ejecuta la migración.
+
+    Returns:
+        True si se añadió la columna
+    """
+    async with engine.begin() as conn:
+        return await conn.run_sync(_add_reason_column)
+
+
+async def main() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        added = await migrate(engine)
+    finally:
+        await engine.dispose()
+    logger.info(
+        "✅ Added column task_tombstones.reason" if added else "✅ Nothing to do"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,7 +3,10 @@ Services package.
 Contiene la lógica de negocio de la aplicación.
 """
 
+from src.services.analytics_service import AnalyticsService
 from src.services.auth_service import AuthService
+from src.services.burndown_service import BurndownService
+from src.services.export_service import ExportService
 from src.services.notification_service import NotificationService
 from src.services.task_service import TaskService
 
@@ -11,4 +14,7 @@ __all__ = [
     "AuthService",
     "TaskService",
     "NotificationService",
+    "ExportService",
+    "AnalyticsService",
+    "BurndownService",
 ]
@@ -0,0 +1,229 @@
+"""
+Analytics service.
+Métricas de flujo calculadas a partir del activity log: lead time, cycle time
+(todo -> in_progress -> done) y throughput semanal por assignee.
+
+Las transiciones de estado se extraen en la DB de los ``changes``
+estructurados de UPDATE_TASK y las métricas se calculan con operaciones
+vectorizadas de NumPy, sin bucles por fila.
+"""
+
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, cast, extract, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import ActivityLog, Task, User
+from src.schemas import AssigneeThroughput, DurationStats, FlowMetricsResponse
+from src.services.task_service import TaskService
+
+DEFAULT_WINDOW_WEEKS = 12
+MAX_WINDOW_DAYS = 731
+ROLLING_WEEKS = 4
+
+# Caché de resultados por (visibilidad, ventana)
+ANALYTICS_CACHE_TTL_SECONDS = 300
+ANALYTICS_CACHE_MAX_ENTRIES = 256
+
+_SECONDS_PER_HOUR = 3600
+_SECONDS_PER_WEEK = 7 * 24 * _SECONDS_PER_HOUR
+_NO_TIMESTAMP = np.iinfo(np.int64).max
+
+_cache: dict[tuple, tuple[float, FlowMetricsResponse]] = {}
+
+
+def _epoch(column):
+    """Timestamp como segundos epoch calculados en la DB (evita convertir datetimes)."""
+    return cast(extract("epoch", column), BigInteger)
+
+
+def _day_epoch(day: date) -> int:
+    return int(np.datetime64(day, "s").astype(np.int64))
+
+
+def _duration_stats(seconds: np.ndarray) -> DurationStats:
+    if seconds.size == 0:
+        return DurationStats(
+            count=0, mean_hours=None, p50_hours=None, p85_hours=None, p95_hours=None
+        )
+    hours = seconds / _SECONDS_PER_HOUR
+    p50, p85, p95 = np.percentile(hours, [50, 85, 95])
+    return DurationStats(
+        count=int(hours.size),
+        mean_hours=round(float(hours.mean()), 2),
+        p50_hours=round(float(p50), 2),
+        p85_hours=round(float(p85), 2),
+        p95_hours=round(float(p95), 2),
+    )
+
+
+def compute_flow_metrics(
+    tasks: list[tuple[int, int, int | None]],
+    transitions: list[tuple[int, int, str]],
+    since: date,
+    until: date,
+) -> FlowMetricsResponse:
+    """
+    Calcula las métricas de flujo de las tareas terminadas en [since, until].
+
+    Args:
+        tasks: (id, created_at, assigned_to_id) de tareas en estado done,
+            ordenadas por id; timestamps en segundos epoch
+        transitions: (task_id, created_at, nuevo estado) de los pasos de esas
+            tareas a in_progress / done; timestamps en segundos epoch. Los de
+            tareas que no están en ``tasks`` se ignoran
+        since: Primer día de la ventana
+        until: Último día de la ventana (incluido)
+    """
+    window_start = _day_epoch(since)
+    window_end = _day_epoch(until + timedelta(days=1))
+    n_weeks = -(-(window_end - window_start) // _SECONDS_PER_WEEK)
+    week_starts = [since + timedelta(weeks=week) for week in range(n_weeks)]
+
+    task_ids = np.fromiter((t[0] for t in tasks), dtype=np.int64, count=len(tasks))
+    created = np.fromiter((t[1] for t in tasks), dtype=np.int64, count=len(tasks))
+    assignees = np.fromiter(
+        (-1 if t[2] is None else t[2] for t in tasks), dtype=np.int64, count=len(tasks)
+    )
+
+    count = len(transitions)
+    tr_ids = np.fromiter((t[0] for t in transitions), np.int64, count)
+    tr_time = np.fromiter((t[1] for t in transitions), np.int64, count)
+    tr_done = np.fromiter((t[2] == "done" for t in transitions), bool, count)
+    # Una tarea terminada entre las dos consultas trae pasos pero no está en
+    # ``tasks``: se descartan (searchsorted los atribuiría a otra tarea)
+    known = np.isin(tr_ids, task_ids)
+    tr_index = np.searchsorted(task_ids, tr_ids[known])
+    tr_time, tr_done = tr_time[known], tr_done[known]
+
+    # Primer paso a in_progress y último paso a done de cada tarea
+    first_start = np.full(task_ids.size, _NO_TIMESTAMP, dtype=np.int64)
+    np.minimum.at(first_start, tr_index[~tr_done], tr_time[~tr_done])
+    last_done = np.full(task_ids.size, -1, dtype=np.int64)
+    np.maximum.at(last_done, tr_index[tr_done], tr_time[tr_done])
+
+    in_window = (last_done >= window_start) & (last_done < window_end)
+    started = in_window & (first_start <= last_done)
+    lead_time = last_done[in_window] - created[in_window]
+    cycle_time = last_done[started] - first_start[started]
+
+    # Throughput: matriz assignee x semana con una sola acumulación
+    week_index = (last_done[in_window] - window_start) // _SECONDS_PER_WEEK
+    owners, owner_index = np.unique(assignees[in_window], return_inverse=True)
+    weekly = np.zeros((owners.size, n_weeks), dtype=np.int64)
+    np.add.at(weekly, (owner_index, week_index), 1)
+
+    # Media móvil sobre las últimas ROLLING_WEEKS semanas (sumas acumuladas)
+    cumulative = np.cumsum(np.pad(weekly, ((0, 0), (1, 0))), axis=1)
+    upper = np.arange(1, n_weeks + 1)
+    lower = np.maximum(upper - ROLLING_WEEKS, 0)
+    rolling = (cumulative[:, upper] - cumulative[:, lower]) / (upper - lower)
+
+    totals = weekly.sum(axis=1)
+    order = np.argsort(-totals, kind="stable")
+    return FlowMetricsResponse(
+        since=since,
+        until=until,
+        week_starts=week_starts,
+        lead_time=_duration_stats(lead_time),
+        cycle_time=_duration_stats(cycle_time),
+        throughput=[
+            AssigneeThroughput(
+                assigned_to_id=None if owners[i] == -1 else int(owners[i]),
+                total=int(totals[i]),
+                weekly=weekly[i].tolist(),
+                rolling_avg=np.round(rolling[i], 2).tolist(),
+            )
+            for i in order
+        ],
+    )
+
+
+class AnalyticsService:
+    """Service para métricas de flujo de tareas."""
+
+    @staticmethod
+    def clear_cache() -> None:
+        _cache.clear()
+
+    @staticmethod
+    def _resolve_window(since: date | None, until: date | None) -> tuple[date, date]:
+        until = until or datetime.utcnow().date()
+        since = since or until - timedelta(weeks=DEFAULT_WINDOW_WEEKS, days=-1)
+        if since > until:
+            raise HTTPException(status_code=400, detail="since must be before until")
+        if (until - since).days > MAX_WINDOW_DAYS:
+            raise HTTPException(
+                status_code=400, detail=f"Window is limited to {MAX_WINDOW_DAYS} days"
+            )
+        return since, until
+
+    @staticmethod
+    async def get_flow_metrics(
+        user: User,
+        db: AsyncSession,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> FlowMetricsResponse:
+        """
+        Lead time, cycle time y throughput de las tareas terminadas en la ventana.
+
+        Aplica el filtro de rol de ``list_tasks``. El resultado se cachea por
+        ventana (y por usuario, salvo para owners, que ven todo) durante
+        ANALYTICS_CACHE_TTL_SECONDS.
+
+        Raises:
+            HTTPException: 400 si la ventana es inválida o demasiado grande
+        """
+        since, until = AnalyticsService._resolve_window(since, until)
+        scope = "all" if user.is_owner() else user.id
+        key = (scope, since, until)
+        cached = _cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        done_tasks = TaskService._apply_list_filters(
+            select(Task.id, _epoch(Task.created_at), Task.assigned_to_id).where(
+                Task.status == "done"
+            ),
+            user,
+        ).order_by(Task.id)
+        tasks = (await db.execute(done_tasks)).all()
+
+        # Un cambio de estado por fila, extraído de ActivityLog.changes
+        window_end = datetime.combine(until + timedelta(days=1), datetime.min.time())
+        dialect = (await db.connection()).dialect.name
+        change = TaskService.change_entries(dialect)
+        new_status = change.c.value["new"].as_string()
+        transitions = (
+            await db.execute(
+                select(
+                    ActivityLog.entity_id, _epoch(ActivityLog.created_at), new_status
+                )
+                .join(change, true())
+                .where(
+                    ActivityLog.action == "UPDATE_TASK",
+                    ActivityLog.entity_type == "task",
+                    ActivityLog.entity_id.in_(
+                        done_tasks.with_only_columns(Task.id).order_by(None)
+                    ),
+                    ActivityLog.created_at < window_end,
+                    change.c.value["field"].as_string() == "status",
+                    new_status.in_(("in_progress", "done")),
+                )
+            )
+        ).all()
+
+        # CPU-bound: fuera del event loop
+        result = await asyncio.to_thread(
+            compute_flow_metrics, tasks, transitions, since, until
+        )
+
+        if len(_cache) >= ANALYTICS_CACHE_MAX_ENTRIES:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (time.monotonic() + ANALYTICS_CACHE_TTL_SECONDS, result)
+        return result
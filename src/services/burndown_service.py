@@ -0,0 +1,152 @@
+"""
+Burndown service.
+Snapshots diarios de la distribución de tareas (status x owner x assignee) y
+lecturas de burndown / cumulative flow que solo consultan esos snapshots:
+el coste de una consulta depende del número de días, no de eventos.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import Date, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db import Task, TaskDailySnapshot, User
+from src.schemas import BurndownPoint, BurndownResponse, BurndownSnapshotResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BURNDOWN_DAYS = 30
+MAX_BURNDOWN_DAYS = 366
+
+# El job nocturno guarda el cierre del día anterior poco después de medianoche (UTC)
+NIGHTLY_SNAPSHOT_DELAY = timedelta(minutes=5)
+
+
+class BurndownService:
+    """Service para snapshots diarios y burndown."""
+
+    @staticmethod
+    async def take_snapshot(db: AsyncSession, day: date) -> BurndownSnapshotResponse:
+        """
+        Guarda la distribución actual de las tareas como snapshot de ``day``.
+
+        Un único INSERT ... SELECT agrupado en la DB. Si el día ya tenía
+        snapshot se reemplaza en la misma transacción.
+        """
+        await db.execute(delete(TaskDailySnapshot).where(TaskDailySnapshot.day == day))
+        result = await db.execute(
+            insert(TaskDailySnapshot).from_select(
+                ["day", "status", "owner_id", "assigned_to_id", "task_count"],
+                select(
+                    literal(day, Date),
+                    Task.status,
+                    Task.owner_id,
+                    Task.assigned_to_id,
+                    func.count(Task.id),
+                ).group_by(Task.status, Task.owner_id, Task.assigned_to_id),
+            )
+        )
+        await db.commit()
+
+        logger.info(f"Burndown snapshot for {day}: {result.rowcount} groups")
+        return BurndownSnapshotResponse(day=day, groups=result.rowcount)
+
+    @staticmethod
+    async def take_snapshot_now(
+        user: User, db: AsyncSession
+    ) -> BurndownSnapshotResponse:
+        """
+        Snapshot bajo demanda del día en curso (solo owners).
+
+        Raises:
+            HTTPException: 403 si el usuario no es owner
+        """
+        if not user.is_owner():
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return await BurndownService.take_snapshot(db, datetime.utcnow().date())
+
+    @staticmethod
+    async def run_nightly(session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Job nocturno: se ejecuta hasta que se cancela (ver lifespan en main)."""
+        while True:
+            now = datetime.utcnow()
+            next_run = datetime.combine(now.date(), time()) + NIGHTLY_SNAPSHOT_DELAY
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            await asyncio.sleep((next_run - now).total_seconds())
+
+            try:
+                async with session_factory() as db:
+                    await BurndownService.take_snapshot(
+                        db, next_run.date() - timedelta(days=1)
+                    )
+            except Exception:
+                logger.exception("Nightly burndown snapshot failed")
+
+    @staticmethod
+    async def get_burndown(
+        user: User,
+        db: AsyncSession,
+        start: date | None = None,
+        end: date | None = None,
+        assigned_to_id: int | None = None,
+    ) -> BurndownResponse:
+        """
+        Tareas por estado y día en [start, end], leídas de los snapshots.
+
+        Aplica el filtro de rol de ``list_tasks`` sobre owner/assignee del
+        snapshot.
+
+        Raises:
+            HTTPException: 400 si el rango es inválido o demasiado grande
+        """
+        end = end or datetime.utcnow().date()
+        start = start or end - timedelta(days=DEFAULT_BURNDOWN_DAYS - 1)
+        if start > end:
+            raise HTTPException(status_code=400, detail="from must be before to")
+        if (end - start).days >= MAX_BURNDOWN_DAYS:
+            raise HTTPException(
+                status_code=400, detail=f"Range is limited to {MAX_BURNDOWN_DAYS} days"
+            )
+
+        query = (
+            select(
+                TaskDailySnapshot.day,
+                TaskDailySnapshot.status,
+                func.sum(TaskDailySnapshot.task_count).label("count"),
+            )
+            .where(TaskDailySnapshot.day.between(start, end))
+            .group_by(TaskDailySnapshot.day, TaskDailySnapshot.status)
+            .order_by(TaskDailySnapshot.day)
+        )
+        if not user.is_owner():
+            query = query.where(
+                (TaskDailySnapshot.owner_id == user.id)
+                | (TaskDailySnapshot.assigned_to_id == user.id)
+            )
+        if assigned_to_id is not None:
+            query = query.where(TaskDailySnapshot.assigned_to_id == assigned_to_id)
+        rows = (await db.execute(query)).all()
+
+        by_day: dict[date, dict[str, int]] = {}
+        for row in rows:
+            counts = by_day.setdefault(
+                row.day, dict.fromkeys(("todo", "in_progress", "done"), 0)
+            )
+            counts[row.status] = int(row.count)
+
+        return BurndownResponse(
+            start=start,
+            end=end,
+            points=[
+                BurndownPoint(
+                    day=day,
+                    by_status=counts,
+                    remaining=sum(c for s, c in counts.items() if s != "done"),
+                )
+                for day, counts in by_day.items()
+            ],
+        )
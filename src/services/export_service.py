@@ -0,0 +1,222 @@
+"""
+Export service.
+Exportaciones asíncronas: el job se encola, un worker en background escribe
+el fichero comprimido (gzip) en disco y el cliente consulta el progreso y
+descarga el resultado.
+"""
+
+import asyncio
+import gzip
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi import HTTPException
+from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.export import get_row_encoder
+from src.db import ExportJob, User
+from src.schemas import ActivityLogRow, ExportJobCreate, ExportJobResponse, TaskRow
+from src.services.task_service import TaskService
+
+logger = logging.getLogger(__name__)
+
+# Nivel de gzip de los ficheros exportados (se escriben una vez, se leen muchas)
+EXPORT_GZIP_LEVEL = 6
+
+
+class ExportService:
+    """Service para exportaciones asíncronas de tareas y actividad."""
+
+    @staticmethod
+    def export_dir() -> Path:
+        return Path(settings.EXPORT_DIR)
+
+    @staticmethod
+    async def create_job(
+        request: ExportJobCreate, user: User, db: AsyncSession
+    ) -> ExportJobResponse:
+        """Registra un job 'pending'; el worker lo procesa con ``run_job``."""
+        job = ExportJob(
+            user_id=user.id,
+            kind=request.kind,
+            format=request.format,
+            status_filter=request.status if request.kind == "tasks" else None,
+            search=request.search if request.kind == "tasks" else None,
+        )
+        db.add(job)
+        await db.flush()
+        logger.info(f"Export job {job.id} queued ({job.kind}, {job.format})")
+
+        await db.commit()
+        await db.refresh(job)
+        return ExportJobResponse.model_validate(job)
+
+    @staticmethod
+    async def _get_own_job(job_id: int, user: User, db: AsyncSession) -> ExportJob:
+        """Carga el job y verifica que pertenezca al usuario."""
+        # populate_existing: el worker actualiza el job desde otra sesión
+        result = await db.execute(
+            select(ExportJob)
+            .where(ExportJob.id == job_id)
+            .execution_options(populate_existing=True)
+        )
+        job = result.scalar_one_or_none()
+
+        if not job:
+            raise HTTPException(status_code=404, detail="Export not found")
+        if job.user_id != user.id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return job
+
+    @staticmethod
+    async def get_job(job_id: int, user: User, db: AsyncSession) -> ExportJobResponse:
+        job = await ExportService._get_own_job(job_id, user, db)
+        return ExportJobResponse.model_validate(job)
+
+    @staticmethod
+    async def get_job_file(job_id: int, user: User, db: AsyncSession) -> Path:
+        """
+        Ruta del fichero de un job terminado.
+
+        Raises:
+            HTTPException: 404/403 (ver ``_get_own_job``), 409 si aún no está
+                listo, 410 si expiró o ya no existe en disco
+        """
+        job = await ExportService._get_own_job(job_id, user, db)
+
+        if job.status != "done":
+            raise HTTPException(
+                status_code=409, detail=f"Export is not ready ({job.status})"
+            )
+        path = ExportService.export_dir() / job.file_name
+        if job.expires_at <= datetime.utcnow() or not path.is_file():
+            raise HTTPException(status_code=410, detail="Export has expired")
+        return path
+
+    @staticmethod
+    def _export_query(job: ExportJob, user: User) -> tuple[Select, type]:
+        """Reutiliza las consultas de exportación de TaskService."""
+        if job.kind == "tasks":
+            query = TaskService.export_tasks_query(
+                user, status_filter=job.status_filter, search=job.search
+            )
+            return query, TaskRow
+        return TaskService.export_activity_query(user), ActivityLogRow
+
+    @staticmethod
+    async def run_job(
+        job_id: int, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """
+        Worker: escribe el fichero del job y actualiza su progreso.
+
+        Usa dos sesiones: una mantiene abierto el cursor del servidor con las
+        filas y la otra hace commit del progreso tras cada chunk (un commit en
+        la sesión del cursor lo cerraría).
+        """
+        async with session_factory() as db, session_factory() as progress_db:
+            job = await progress_db.get(ExportJob, job_id)
+            if job is None or job.status != "pending":
+                return
+            file_name = f"{job.kind}-{job.id}.{job.format}.gz"
+            export_dir = ExportService.export_dir()
+            path = export_dir / file_name
+            partial = path.with_name(path.name + ".part")
+            rows_written = 0
+
+            async def set_job(**values) -> None:
+                await progress_db.execute(
+                    update(ExportJob).where(ExportJob.id == job_id).values(**values)
+                )
+                await progress_db.commit()
+
+            # Cualquier error (también al preparar la consulta) marca el job
+            # como fallido: nunca se queda en "pending"
+            try:
+                user = await db.get(User, job.user_id)
+                if user is None:
+                    raise ValueError("Export owner no longer exists")
+                query, row_type = ExportService._export_query(job, user)
+                encoder = get_row_encoder(row_type, job.format)
+
+                total_rows = (
+                    await db.execute(
+                        select(func.count()).select_from(
+                            query.order_by(None).subquery()
+                        )
+                    )
+                ).scalar_one()
+                await set_job(status="running", total_rows=total_rows)
+
+                await asyncio.to_thread(export_dir.mkdir, parents=True, exist_ok=True)
+                # Compresión y escritura en un thread para no bloquear el event loop
+                fh = await asyncio.to_thread(
+                    gzip.open, partial, "wb", EXPORT_GZIP_LEVEL
+                )
+                try:
+                    await asyncio.to_thread(fh.write, encoder.header())
+                    async for rows in TaskService.stream_rows(query, db):
+                        await asyncio.to_thread(fh.write, encoder.encode(rows))
+                        rows_written += len(rows)
+                        await set_job(rows_written=rows_written)
+                finally:
+                    await asyncio.to_thread(fh.close)
+                await asyncio.to_thread(partial.replace, path)
+            except Exception as exc:
+                logger.exception(f"Export job {job_id} failed")
+                await asyncio.to_thread(partial.unlink, missing_ok=True)
+                await progress_db.rollback()
+                finished_at = datetime.utcnow()
+                # También caduca: cleanup_expired borra los jobs fallidos
+                await set_job(
+                    status="failed",
+                    error=str(exc)[:500],
+                    finished_at=finished_at,
+                    expires_at=finished_at + timedelta(hours=settings.EXPORT_TTL_HOURS),
+                )
+                return
+
+            finished_at = datetime.utcnow()
+            await set_job(
+                status="done",
+                file_name=file_name,
+                finished_at=finished_at,
+                expires_at=finished_at + timedelta(hours=settings.EXPORT_TTL_HOURS),
+            )
+            logger.info(f"Export job {job_id} done ({rows_written} rows)")
+
+    @staticmethod
+    async def cleanup_expired(session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """
+        Borra los ficheros y jobs cuyo TTL ya venció.
+
+        Returns:
+            Número de jobs eliminados
+        """
+        async with session_factory() as db:
+            result = await db.execute(
+                select(ExportJob.id, ExportJob.file_name).where(
+                    ExportJob.expires_at < datetime.utcnow()
+                )
+            )
+            expired = result.all()
+            if not expired:
+                return 0
+
+            export_dir = ExportService.export_dir()
+            for _, file_name in expired:
+                if file_name:
+                    await asyncio.to_thread(
+                        (export_dir / file_name).unlink, missing_ok=True
+                    )
+
+            await db.execute(
+                delete(ExportJob).where(ExportJob.id.in_([id_ for id_, _ in expired]))
+            )
+            await db.commit()
+
+        logger.info(f"Removed {len(expired)} expired export(s)")
+        return len(expired)
@@ -0,0 +1,202 @@
+"""
+Request-scoped loaders.
+Agrupan y de-duplican las lecturas por id de usuarios y tareas dentro de un
+request (patrón DataLoader).
+
+Las claves pedidas durante el mismo tick del event loop se resuelven con un
+único ``WHERE id IN (...)`` por tipo de entidad, y cada id se lee como mucho
+una vez por transacción: las llamadas siguientes salen de la cache del loader.
+Solo se seleccionan columnas (``UserSummary`` / ``TaskResponse``), nunca
+instancias ORM, así que tampoco se disparan las relaciones ``selectin``.
+
+Los loaders viven en ``session.info``: la sesión de ``get_db`` es por
+request, y la cache se vacía al terminar la transacción (commit o rollback)
+para no servir filas que el propio request acaba de modificar.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Generic, TypeVar
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.db import Task, User
+from src.schemas import TaskResponse, UserSummary
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_SESSION_INFO_KEY = "request_loaders"
+
+# Columnas de TaskResponse (incluida ``version``, para el ETag)
+_TASK_COLUMNS = tuple(Task.__table__.c[name] for name in TaskResponse.model_fields)
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Carga por lotes con cache por clave.
+
+    ``batch_load`` recibe las claves pendientes (sin duplicados) y devuelve un
+    dict clave -> valor; las claves que falten se resuelven como None.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[dict[K, V]]],
+        lock: asyncio.Lock,
+    ) -> None:
+        self._batch_load = batch_load
+        # Compartido entre loaders: una AsyncSession no admite consultas
+        # concurrentes
+        self._lock = lock
+        self._cache: dict[K, asyncio.Future[V | None]] = {}
+        self._pending: list[K] = []
+
+    async def load_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """
+        Valores de las claves que existen.
+
+        La primera llamada de un tick cede el control una vez para que las
+        demás corrutinas del mismo tick encolen sus claves, y lanza la
+        consulta del lote con todas ellas. Si quien lanza el lote se cancela
+        (cliente desconectado, deadline), las demás vuelven a pedir sus
+        claves en un lote nuevo.
+        """
+        values: dict[K, V | None] = {}
+        pending = list(dict.fromkeys(keys))
+        while pending:
+            futures = await self._schedule(pending)
+            pending = []
+            for key, future in futures.items():
+                try:
+                    values[key] = await future
+                except asyncio.CancelledError:
+                    if not future.cancelled() or asyncio.current_task().cancelling():
+                        raise
+                    pending.append(key)  # Se canceló el lote, no esta corrutina
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def load(self, key: K) -> V | None:
+        """Valor de una clave, o None si no existe."""
+        return (await self.load_many([key])).get(key)
+
+    def clear(self) -> None:
+        """Olvida los valores cargados (las cargas en curso terminan igual)."""
+        self._cache = {key: self._cache[key] for key in self._pending}
+
+    async def _schedule(self, keys: list[K]) -> dict[K, asyncio.Future[V | None]]:
+        loop = asyncio.get_running_loop()
+        futures: dict[K, asyncio.Future[V | None]] = {}
+        dispatch = False
+        for key in keys:
+            future = self._cache.get(key)
+            if future is None:
+                future = self._cache[key] = loop.create_future()
+                dispatch = dispatch or not self._pending
+                self._pending.append(key)
+            futures[key] = future
+
+        if dispatch:
+            try:
+                await asyncio.sleep(0)  # Fin del tick
+            except asyncio.CancelledError:
+                # Nadie más lanzaría el lote: no dejar claves en _pending
+                keys, self._pending = self._pending, []
+                self._fail([(key, self._cache[key]) for key in keys], None)
+                raise
+            await self._dispatch()
+        return futures
+
+    async def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        if not keys:
+            return  # Otro lote ya las recogió
+        futures = [(key, self._cache[key]) for key in keys]
+        try:
+            async with self._lock:
+                values = await self._batch_load(keys)
+        except asyncio.CancelledError:
+            self._fail(futures, None)
+            raise
+        except BaseException as exc:
+            self._fail(futures, exc)
+            raise
+        for key, future in futures:
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def _fail(
+        self,
+        futures: list[tuple[K, asyncio.Future[V | None]]],
+        exc: BaseException | None,
+    ) -> None:
+        """Resuelve un lote fallido: con ``exc``, o cancelado si es None."""
+        for key, future in futures:
+            if self._cache.get(key) is future:
+                del self._cache[key]  # No cachear errores
+            if future.done():
+                continue
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()  # Marcada como recuperada
+
+
+class RequestLoaders:
+    """Loaders de usuarios y tareas de una sesión (un request)."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+        lock = asyncio.Lock()
+        self.users: DataLoader[int, UserSummary] = DataLoader(self._users, lock)
+        self.tasks: DataLoader[int, TaskResponse] = DataLoader(self._tasks, lock)
+
+    async def load_users(self, user_ids: Iterable[int]) -> dict[int, UserSummary]:
+        """Usuarios existentes por id (una consulta por tick)."""
+        return await self.users.load_many(user_ids)
+
+    async def load_tasks(self, task_ids: Iterable[int]) -> dict[int, TaskResponse]:
+        """Tareas existentes por id (una consulta por tick, sin chequeo de acceso)."""
+        return await self.tasks.load_many(task_ids)
+
+    def clear(self) -> None:
+        self.users.clear()
+        self.tasks.clear()
+
+    async def _users(self, user_ids: list[int]) -> dict[int, UserSummary]:
+        result = await self._db.execute(
+            select(User.id, User.username, User.role).where(User.id.in_(user_ids))
+        )
+        return {row.id: UserSummary.model_validate(row) for row in result}
+
+    async def _tasks(self, task_ids: list[int]) -> dict[int, TaskResponse]:
+        result = await self._db.execute(
+            select(*_TASK_COLUMNS).where(Task.id.in_(task_ids))
+        )
+        return {
+            row["id"]: TaskResponse.model_validate(dict(row))
+            for row in result.mappings()
+        }
+
+
+def _clear_on_transaction_end(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    # Los flush abren subtransacciones: solo cuenta la transacción raíz
+    loaders = session.info.get(_SESSION_INFO_KEY)
+    if loaders is not None and transaction.parent is None:
+        loaders.clear()
+
+
+def get_loaders(db: AsyncSession) -> RequestLoaders:
+    """Loaders de la sesión (se crean en el primer uso)."""
+    loaders = db.info.get(_SESSION_INFO_KEY)
+    if loaders is None:
+        loaders = db.info[_SESSION_INFO_KEY] = RequestLoaders(db)
+        event.listen(
+            db.sync_session, "after_transaction_end", _clear_on_transaction_end
+        )
+    return loaders
@@ -6,16 +6,20 @@ Business logic for notification management.
 import logging
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.notifications import Notification
 from src.db.tasks import Task
 from src.db.users import User
 from src.schemas.notification import NotificationCreate
+from src.schemas.task import TaskResponse
 
 logger = logging.getLogger(__name__)
 
+# Tasks due within this window count as "due soon"
+DUE_SOON_WINDOW = timedelta(days=3)
+
 
 class NotificationService:
     """Service for notification operations."""
@@ -169,6 +173,53 @@ class NotificationService:
         logger.info(f"Notification {notification_id} deleted")
         return True
 
+    @staticmethod
+    async def create_notifications_bulk(
+        notifications: list[NotificationCreate], db: AsyncSession
+    ) -> int:
+        """
+        Create many notifications with a single INSERT statement.
+
+        Args:
+            notifications: Notification data
+            db: Database session
+
+        Returns:
+            int: Number of notifications created
+        """
+        if not notifications:
+            return 0
+
+        await db.execute(insert(Notification), [n.model_dump() for n in notifications])
+        logger.info(f"Bulk created {len(notifications)} notifications")
+        return len(notifications)
+
+    @staticmethod
+    def task_assigned_payload(
+        task_id: int, task_title: str, assigned_user_id: int, assigner: User
+    ) -> NotificationCreate:
+        """Build the 'task_assigned' notification for an assignee."""
+        return NotificationCreate(
+            user_id=assigned_user_id,
+            task_id=task_id,
+            type="task_assigned",
+            title="New Task Assigned",
+            message=f"{assigner.username} assigned you the task: {task_title}",
+        )
+
+    @staticmethod
+    def task_updated_payload(
+        task_id: int, task_title: str, assigned_user_id: int, updater: User
+    ) -> NotificationCreate:
+        """Build the 'task_updated' notification for an assignee."""
+        return NotificationCreate(
+            user_id=assigned_user_id,
+            task_id=task_id,
+            type="task_updated",
+            title="Task Updated",
+            message=f"{updater.username} updated the task: {task_title}",
+        )
+
     @staticmethod
     async def create_task_assigned_notification(
         task: Task, assigned_user: User, assigner: User, db: AsyncSession
@@ -185,38 +236,30 @@ class NotificationService:
         if assigned_user.id == assigner.id:
             return  # Don't notify if user assigned task to themselves
 
-        notification_data = NotificationCreate(
-            user_id=assigned_user.id,
-            task_id=task.id,
-            type="task_assigned",
-            title="New Task Assigned",
-            message=f"{assigner.username} assigned you the task: {task.title}",
+        notification_data = NotificationService.task_assigned_payload(
+            task.id, task.title, assigned_user.id, assigner
         )
 
         await NotificationService.create_notification(notification_data, db)
 
     @staticmethod
     async def create_task_comment_notification(
-        task: Task, commenter: User, db: AsyncSession
+        task: Task | TaskResponse, commenter: User, db: AsyncSession
     ) -> None:
         """
-        Create notification when someone comments on a task.
+        Create notifications when someone comments on a task.
+
+        Owner and assignee are notified with a single INSERT statement.
 
         Args:
             task: Task that was commented on
             commenter: User who made the comment
             db: Database session
         """
+        recipients = []
         # Notify task owner if they're not the commenter
         if task.owner_id != commenter.id:
-            notification_data = NotificationCreate(
-                user_id=task.owner_id,
-                task_id=task.id,
-                type="task_comment",
-                title="New Comment",
-                message=f"{commenter.username} commented on: {task.title}",
-            )
-            await NotificationService.create_notification(notification_data, db)
+            recipients.append(task.owner_id)
 
         # Notify assigned user if they exist and are not the commenter or owner
         if (
@@ -224,14 +267,21 @@ class NotificationService:
             and task.assigned_to_id != commenter.id
             and task.assigned_to_id != task.owner_id
         ):
-            notification_data = NotificationCreate(
-                user_id=task.assigned_to_id,
-                task_id=task.id,
-                type="task_comment",
-                title="New Comment",
-                message=f"{commenter.username} commented on: {task.title}",
-            )
-            await NotificationService.create_notification(notification_data, db)
+            recipients.append(task.assigned_to_id)
+
+        await NotificationService.create_notifications_bulk(
+            [
+                NotificationCreate(
+                    user_id=user_id,
+                    task_id=task.id,
+                    type="task_comment",
+                    title="New Comment",
+                    message=f"{commenter.username} commented on: {task.title}",
+                )
+                for user_id in recipients
+            ],
+            db,
+        )
 
     @staticmethod
     async def create_task_updated_notification(
@@ -247,12 +297,8 @@ class NotificationService:
         """
         # Notify assigned user if they exist and are not the updater
         if task.assigned_to_id and task.assigned_to_id != updater.id:
-            notification_data = NotificationCreate(
-                user_id=task.assigned_to_id,
-                task_id=task.id,
-                type="task_updated",
-                title="Task Updated",
-                message=f"{updater.username} updated the task: {task.title}",
+            notification_data = NotificationService.task_updated_payload(
+                task.id, task.title, task.assigned_to_id, updater
             )
             await NotificationService.create_notification(notification_data, db)
 
@@ -269,7 +315,7 @@ class NotificationService:
             int: Number of notifications created
         """
         now = datetime.utcnow()
-        three_days_from_now = now + timedelta(days=3)
+        three_days_from_now = now + DUE_SOON_WINDOW
 
         # Get all tasks that are not done and have a due date
         result = await db.execute(
@@ -4,29 +4,167 @@ Contiene lógica de negocio para CRUD de tareas, comentarios y activity logs.
 """
 
 import logging
-from datetime import timezone
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from typing import AsyncIterator, get_type_hints
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    FromClause,
+    Select,
+    case,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    true,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import TypedDict
 
-from src.db import ActivityLog, Comment, Task, User
+from src.core.http_cache import make_etag
+from src.core.import_parsers import ParsedRecord
+from src.core.pagination import (
+    decode_cursor,
+    decode_watermark,
+    encode_cursor,
+    encode_watermark,
+)
+from src.db import ActivityLog, Comment, Task, TaskSnapshot, TaskTombstone, User
 from src.schemas import (
+    ActivityChange,
+    ActivityField,
     ActivityLogResponse,
     CommentCreate,
     CommentResponse,
+    NotificationCreate,
+    Page,
+    TaskAssigneeCount,
+    TaskBatchGetResponse,
+    TaskBulkItemResult,
+    TaskBulkRequest,
+    TaskBulkResponse,
+    TaskChangesResponse,
     TaskCreate,
+    TaskDetailResponse,
+    TaskImportResponse,
+    TaskImportRowError,
     TaskResponse,
+    TaskRow,
+    TaskStatsResponse,
     TaskUpdate,
+    UserSummary,
 )
-from src.services.notification_service import NotificationService
+from src.services.loaders import get_loaders
+from src.services.notification_service import DUE_SOON_WINDOW, NotificationService
 
 logger = logging.getLogger(__name__)
 
+# Columnas de TaskResponse, para lecturas que no necesitan instancias ORM
+TASK_RESPONSE_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.due_date,
+    Task.assigned_to_id,
+    Task.owner_id,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# Columnas de ActivityLogResponse
+ACTIVITY_LOG_COLUMNS = (
+    ActivityLog.id,
+    ActivityLog.user_id,
+    ActivityLog.action,
+    ActivityLog.entity_type,
+    ActivityLog.entity_id,
+    ActivityLog.details,
+    ActivityLog.changes,
+    ActivityLog.created_at,
+)
+
+# Longitud máxima de ActivityLog.details (resumen legible de los cambios)
+ACTIVITY_DETAILS_MAX_LENGTH = 500
+
+# Cada cuántos cambios (UPDATE_TASK) se guarda un TaskSnapshot: acota el
+# número de cambios a aplicar para reconstruir una tarea con ?as_of=
+TASK_SNAPSHOT_INTERVAL = 50
+
+# ETag de una tarea: legible para poder traducir If-Match a una versión
+TASK_ETAG_RE = re.compile(r'(?:W/)?"task-(\d+)-v(\d+)"')
+
+# Filas por chunk en exportaciones (yield_per del cursor del servidor)
+EXPORT_CHUNK_SIZE = 1000
+
+# Importación: filas por INSERT/COPY (y por transacción) y errores reportados
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 1000
+
+# Columnas que se escriben al importar (COPY requiere la lista explícita)
+IMPORT_COLUMNS = (
+    "title",
+    "description",
+    "status",
+    "due_date",
+    "assigned_to_id",
+    "owner_id",
+    "created_at",
+    "updated_at",
+)
+
+# Margen para escrituras concurrentes: updated_at se fija en el flush, antes
+# del commit, así que una transacción lenta puede hacerse visible con un
+# timestamp anterior al watermark ya entregado.
+SYNC_WATERMARK_OVERLAP = timedelta(seconds=2)
+
+
+# Campos seleccionables con ?fields= (mismo orden que TaskResponse)
+TASK_FIELDS = tuple(column.key for column in TASK_RESPONSE_COLUMNS)
+_TASK_COLUMNS_BY_FIELD = {column.key: column for column in TASK_RESPONSE_COLUMNS}
+
+
+@cache
+def _task_rows_adapter(fields: tuple[str, ...] = TASK_FIELDS) -> TypeAdapter:
+    """
+    TypeAdapter de serialización para un conjunto de campos.
+
+    Se construye una única vez por conjunto (como mucho 2^8 variantes, ya que
+    ``id`` siempre está incluido); para un subconjunto se genera un TypedDict
+    con solo esos campos.
+    """
+    if fields == TASK_FIELDS:
+        return TypeAdapter(list[TaskRow])
+    hints = get_type_hints(TaskRow)
+    schema = TypedDict(
+        f"TaskRow_{'_'.join(fields)}", {field: hints[field] for field in fields}
+    )
+    return TypeAdapter(list[schema])
+
 
 class TaskService:
     """Service para operaciones CRUD de tareas."""
 
+    @staticmethod
+    def _to_naive_utc(value: datetime | None) -> datetime | None:
+        """Normaliza fechas con zona horaria a UTC naive (como se guardan en DB)."""
+        if value and value.tzinfo:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
     @staticmethod
     async def _log_activity(
         db: AsyncSession,
@@ -35,7 +173,8 @@ class TaskService:
         entity_type: str,
         entity_id: int,
         details: str | None = None,
-    ) -> None:
+        changes: list[ActivityChange] | None = None,
+    ) -> ActivityLog:
         """Helper para registrar actividad."""
         log = ActivityLog(
             user_id=user_id,
@@ -43,48 +182,297 @@ class TaskService:
             entity_type=entity_type,
             entity_id=entity_id,
             details=details,
+            changes=changes,
         )
         db.add(log)
         # No hacemos commit aquí, esperamos que el caller lo haga
+        return log
 
     @staticmethod
-    async def list_tasks(
+    def _change(field: str, old, new) -> ActivityChange:
+        """Cambio de un campo, con fechas serializadas a ISO 8601 (JSON)."""
+        if isinstance(old, datetime):
+            old = old.isoformat()
+        if isinstance(new, datetime):
+            new = new.isoformat()
+        return ActivityChange(field=field, old=old, new=new)
+
+    @staticmethod
+    def _changes_details(changes: list[ActivityChange]) -> str:
+        """Resumen "campo: viejo -> nuevo" de los cambios (texto de ``details``)."""
+        details = ", ".join(
+            f"{change['field']}: {change['old']} -> {change['new']}"
+            for change in changes
+        )
+        return details[:ACTIVITY_DETAILS_MAX_LENGTH]
+
+    @staticmethod
+    def change_entries(dialect: str) -> FromClause:
+        """
+        Un elemento de ``ActivityLog.changes`` por fila (columna ``value``).
+
+        Se usa correlacionado con ``activity_logs`` (JOIN o EXISTS).
+        """
+        if dialect == "postgresql":
+            return (
+                func.jsonb_array_elements(ActivityLog.changes)
+                .table_valued(column("value", JSON))
+                .render_derived("change")
+            )
+        # SQLite: json_each ya expone la columna "value" (no admite alias de columnas)
+        return (
+            func.json_each(ActivityLog.changes)
+            .table_valued(column("value", JSON))
+            .alias("change")
+        )
+
+    @staticmethod
+    def changed_field_filter(field: str, dialect: str) -> ColumnElement[bool]:
+        """Entradas de actividad que cambiaron ``field``."""
+        if dialect == "postgresql":
+            # Contención JSONB: usa el índice GIN ix_activity_logs_changes
+            return type_coerce(ActivityLog.changes, JSONB).contains([{"field": field}])
+        change = TaskService.change_entries(dialect)
+        return exists(
+            select(1)
+            .select_from(change)
+            .where(change.c.value["field"].as_string() == field)
+        )
+
+    @staticmethod
+    def _access_predicate(user: User) -> ColumnElement[bool]:
+        """Regla de acceso owner/assignee como expresión SQL."""
+        if user.is_owner():
+            return true()
+        return (Task.owner_id == user.id) | (Task.assigned_to_id == user.id)
+
+    @staticmethod
+    def visibility_class(user: User) -> str:
+        """
+        Qué tareas ve el usuario: ``all`` (owners) o ``user:<id>``.
+
+        Usuarios con la misma clase ven exactamente las mismas tareas.
+        """
+        return "all" if user.is_owner() else f"user:{user.id}"
+
+    @staticmethod
+    def _apply_list_filters(
+        query: Select,
         user: User,
-        db: AsyncSession,
         status_filter: str | None = None,
         search: str | None = None,
-    ) -> list[TaskResponse]:
-        # Lazy check for due date notifications
-        await NotificationService.check_and_create_due_date_notifications(db)
-
-        query = select(Task)
-
+    ) -> Select:
+        """Aplica el filtro de rol, estado y búsqueda usado al listar tareas."""
         # 1. Aplicar filtro de Rol
         if not user.is_owner():
-            logger.info(f"Member user_id={user.id} listing OWN + ASSIGNED tasks")
-            query = query.where(
-                (Task.owner_id == user.id) | (Task.assigned_to_id == user.id)
-            )
-        else:
-            logger.info(f"Owner user_id={user.id} listing ALL tasks")
+            query = query.where(TaskService._access_predicate(user))
 
         # 2. Aplicar filtro de Status
         if status_filter:
-            logger.info(f"Filtering by status: {status_filter}")
             query = query.where(Task.status == status_filter)
 
         # 3. Aplicar filtro de búsqueda (título o descripción)
         if search:
             search_pattern = f"%{search}%"
-            logger.info(f"Searching for: {search}")
             query = query.where(
                 (Task.title.ilike(search_pattern))
                 | (Task.description.ilike(search_pattern))
             )
 
+        return query
+
+    @staticmethod
+    def parse_fields(fields: str | None) -> tuple[str, ...]:
+        """
+        Normaliza el parámetro ``?fields=a,b,c`` a una tupla canónica.
+
+        ``id`` se incluye siempre y el orden sigue al de TaskResponse, de modo
+        que el mismo conjunto produce siempre la misma clave de caché.
+
+        Raises:
+            HTTPException: 400 si algún campo no existe
+        """
+        if not fields:
+            return TASK_FIELDS
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested - set(TASK_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        requested.add("id")
+        return tuple(field for field in TASK_FIELDS if field in requested)
+
+    @staticmethod
+    async def _list_task_rows(
+        user: User,
+        db: AsyncSession,
+        status_filter: str | None = None,
+        search: str | None = None,
+        fields: tuple[str, ...] = TASK_FIELDS,
+    ) -> list[dict]:
+        """
+        Filas del listado como dicts planos.
+
+        Selecciona solo las columnas pedidas con SQLAlchemy Core: no se
+        hidratan instancias ORM ni se disparan las relaciones selectin.
+        """
+        # Lazy check for due date notifications
+        await NotificationService.check_and_create_due_date_notifications(db)
+
+        if not user.is_owner():
+            logger.info(f"Member user_id={user.id} listing OWN + ASSIGNED tasks")
+        else:
+            logger.info(f"Owner user_id={user.id} listing ALL tasks")
+        if status_filter:
+            logger.info(f"Filtering by status: {status_filter}")
+        if search:
+            logger.info(f"Searching for: {search}")
+
+        columns = [_TASK_COLUMNS_BY_FIELD[field] for field in fields]
+        query = TaskService._apply_list_filters(
+            select(*columns), user, status_filter, search
+        )
+
         result = await db.execute(query)
-        tasks = result.scalars().all()
-        return [TaskResponse.model_validate(task) for task in tasks]
+        return [row._asdict() for row in result]
+
+    @staticmethod
+    async def list_tasks(
+        user: User,
+        db: AsyncSession,
+        status_filter: str | None = None,
+        search: str | None = None,
+    ) -> list[TaskResponse]:
+        rows = await TaskService._list_task_rows(user, db, status_filter, search)
+        return [TaskResponse.model_validate(row) for row in rows]
+
+    @staticmethod
+    async def list_tasks_json(
+        user: User,
+        db: AsyncSession,
+        status_filter: str | None = None,
+        search: str | None = None,
+        fields: tuple[str, ...] = TASK_FIELDS,
+    ) -> bytes:
+        """
+        Igual que ``list_tasks`` pero devuelve el JSON ya serializado.
+
+        Las filas vienen de la DB con los tipos correctos, así que se
+        serializan directamente con un TypeAdapter cacheado (sin validar).
+        Con ``fields`` solo se seleccionan y serializan esas columnas.
+        """
+        rows = await TaskService._list_task_rows(
+            user, db, status_filter, search, fields
+        )
+        return _task_rows_adapter(fields).dump_json(rows)
+
+    @staticmethod
+    async def list_tasks_etag(
+        user: User,
+        db: AsyncSession,
+        status_filter: str | None = None,
+        search: str | None = None,
+        fields: tuple[str, ...] = TASK_FIELDS,
+    ) -> str:
+        """
+        ETag del listado: una sola consulta de agregación (count + max updated_at)
+        con los mismos filtros que ``list_tasks``. Cada fieldset es una
+        representación distinta, así que también forma parte del ETag.
+        """
+        query = TaskService._apply_list_filters(
+            select(func.count(Task.id), func.max(Task.updated_at)),
+            user,
+            status_filter,
+            search,
+        )
+        count, last_updated = (await db.execute(query)).one()
+        return make_etag(
+            "tasks",
+            TaskService.visibility_class(user),
+            status_filter,
+            search,
+            fields,
+            count,
+            last_updated,
+        )
+
+    @staticmethod
+    async def get_stats(user: User, db: AsyncSession) -> TaskStatsResponse:
+        """
+        Estadísticas del dashboard en una sola consulta agrupada.
+
+        Agrupa por (status, assigned_to_id) con el filtro de rol de
+        ``list_tasks``; vencidas y por vencer se cuentan con SUM(CASE ...) en
+        la misma consulta. El resultado tiene como mucho
+        estados x assignees filas, así que el resto se agrega en Python.
+        """
+        now = datetime.utcnow()
+        pending = (Task.status != "done") & Task.due_date.isnot(None)
+        query = TaskService._apply_list_filters(
+            select(
+                Task.status,
+                Task.assigned_to_id,
+                func.count(Task.id).label("count"),
+                func.sum(case((pending & (Task.due_date < now), 1), else_=0)).label(
+                    "overdue"
+                ),
+                func.sum(
+                    case(
+                        (
+                            pending
+                            & (Task.due_date >= now)
+                            & (Task.due_date <= now + DUE_SOON_WINDOW),
+                            1,
+                        ),
+                        else_=0,
+                    )
+                ).label("due_soon"),
+            ).group_by(Task.status, Task.assigned_to_id),
+            user,
+        )
+        rows = (await db.execute(query)).all()
+
+        by_status = dict.fromkeys(("todo", "in_progress", "done"), 0)
+        by_assignee: dict[int | None, int] = defaultdict(int)
+        for row in rows:
+            by_status[row.status] = by_status.get(row.status, 0) + row.count
+            by_assignee[row.assigned_to_id] += row.count
+
+        return TaskStatsResponse(
+            total=sum(row.count for row in rows),
+            by_status=by_status,
+            by_assignee=[
+                TaskAssigneeCount(assigned_to_id=assignee, count=count)
+                for assignee, count in sorted(
+                    by_assignee.items(), key=lambda item: -item[1]
+                )
+            ],
+            overdue=sum(row.overdue for row in rows),
+            due_soon=sum(row.due_soon for row in rows),
+        )
+
+    @staticmethod
+    def task_etag(task: Task | TaskResponse) -> str:
+        """ETag de una tarea individual, derivado de ``version``."""
+        return f'"task-{task.id}-v{task.version}"'
+
+    @staticmethod
+    def if_match_version(task_id: int, if_match: str | None) -> int | None:
+        """
+        Versión que exige un header If-Match (None si no hay precondición).
+
+        Acepta ETags débiles (la compresión los marca con ``W/``). Un ETag de
+        otra tarea o con otro formato nunca coincide: devuelve -1.
+        """
+        if if_match is None or if_match.strip() == "*":
+            return None
+        for tag in if_match.split(","):
+            match = TASK_ETAG_RE.fullmatch(tag.strip())
+            if match and int(match.group(1)) == task_id:
+                return int(match.group(2))
+        return -1
 
     @staticmethod
     async def create_task(
@@ -92,10 +480,7 @@ class TaskService:
     ) -> TaskResponse:
         logger.info(f"Creating task for user_id={user.id}")
 
-        if task_data.due_date and task_data.due_date.tzinfo:
-            task_data.due_date = task_data.due_date.astimezone(timezone.utc).replace(
-                tzinfo=None
-            )
+        task_data.due_date = TaskService._to_naive_utc(task_data.due_date)
 
         new_task = Task(
             title=task_data.title,
@@ -121,23 +506,34 @@ class TaskService:
 
         # Create notification if task is assigned to someone
         if new_task.assigned_to_id and new_task.assigned_to_id != user.id:
-            result = await db.execute(
-                select(User).where(User.id == new_task.assigned_to_id)
-            )
-            assigned_user = result.scalar_one_or_none()
+            assigned_user = await get_loaders(db).users.load(new_task.assigned_to_id)
             if assigned_user:
-                await NotificationService.create_task_assigned_notification(
-                    new_task, assigned_user, user, db
+                await NotificationService.create_notifications_bulk(
+                    [
+                        NotificationService.task_assigned_payload(
+                            new_task.id, new_task.title, assigned_user.id, user
+                        )
+                    ],
+                    db,
                 )
 
+        # Los defaults ya se aplicaron en el flush: sin refresh tras el commit
+        # (que volvería a leer la tarea y sus relaciones selectin)
+        response = TaskResponse.model_validate(new_task)
         await db.commit()
-        await db.refresh(new_task)
-        return TaskResponse.model_validate(new_task)
+        return response
 
     @staticmethod
-    async def get_task(task_id: int, user: User, db: AsyncSession) -> TaskResponse:
-        result = await db.execute(select(Task).where(Task.id == task_id))
-        task = result.scalar_one_or_none()
+    async def _get_accessible_task(
+        task_id: int, user: User, db: AsyncSession
+    ) -> TaskResponse:
+        """
+        Carga la tarea y verifica que el usuario pueda acceder a ella.
+
+        Pasa por los loaders del request: si la tarea ya se leyó en la misma
+        transacción no hay otra consulta.
+        """
+        task = await get_loaders(db).tasks.load(task_id)
 
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
@@ -151,77 +547,367 @@ class TaskService:
         if not can_access:
             raise HTTPException(status_code=403, detail="Not authorized")
 
-        return TaskResponse.model_validate(task)
+        return task
 
     @staticmethod
-    async def update_task(
-        task_id: int, task_data: TaskUpdate, user: User, db: AsyncSession
+    async def get_task(task_id: int, user: User, db: AsyncSession) -> TaskResponse:
+        return await TaskService._get_accessible_task(task_id, user, db)
+
+    @staticmethod
+    def _snapshot_version():
+        """
+        Versión del último snapshot de la tarea (1, la creación, si no hay).
+
+        Subconsulta escalar correlacionada con ``tasks``: va en el RETURNING
+        del UPDATE, sin otra ida y vuelta.
+        """
+        # SQLite no cualifica las columnas del RETURNING ("task_id = id"): la
+        # tabla derivada no tiene ``id``, así que ``id`` es el de la tarea
+        snapshots = select(TaskSnapshot.task_id, TaskSnapshot.version).subquery(
+            "snapshots"
+        )
+        return (
+            select(func.coalesce(func.max(snapshots.c.version), 1))
+            .where(snapshots.c.task_id == Task.id)
+            .scalar_subquery()
+            .label("snapshot_version")
+        )
+
+    @staticmethod
+    async def _snapshot_if_due(
+        task: TaskResponse, snapshot_version: int, log: ActivityLog, db: AsyncSession
+    ) -> None:
+        """
+        Guarda un TaskSnapshot si la tarea acumula TASK_SNAPSHOT_INTERVAL
+        versiones desde el último.
+
+        Cada UPDATE (también los de ``bulk_tasks``, que no guardan snapshots)
+        incrementa ``version``: la diferencia es el número de cambios a
+        reaplicar, sin contar el historial.
+        """
+        if task.version - snapshot_version < TASK_SNAPSHOT_INTERVAL:
+            return
+        await db.flush()  # id / created_at del log
+        db.add(
+            TaskSnapshot(
+                task_id=task.id,
+                activity_log_id=log.id,
+                taken_at=log.created_at,
+                version=task.version,
+                state=task.model_dump(mode="json"),
+            )
+        )
+
+    @staticmethod
+    async def get_task_as_of(
+        task_id: int, user: User, db: AsyncSession, as_of: datetime
     ) -> TaskResponse:
-        from sqlalchemy.orm import selectinload
+        """
+        Reconstruye la tarea tal como estaba en ``as_of``.
+
+        Parte del último snapshot anterior a ``as_of`` y le aplica los cambios
+        posteriores hasta esa fecha. Si no hay ninguno, parte del primer
+        snapshot posterior (o de la tarea actual) y deshace los cambios
+        hechos después de ``as_of``. Con un snapshot cada
+        TASK_SNAPSHOT_INTERVAL cambios, el coste no depende de la longitud del
+        historial.
+
+        Raises:
+            HTTPException: 404 si la tarea no existe (o no existía en
+                ``as_of``), 403 si no es accesible
+        """
+        task = await TaskService._get_accessible_task(task_id, user, db)
+        as_of = TaskService._to_naive_utc(as_of)
+        if as_of < task.created_at:
+            raise HTTPException(status_code=404, detail="Task did not exist at as_of")
 
+        updates = select(
+            ActivityLog.id, ActivityLog.created_at, ActivityLog.changes
+        ).where(
+            ActivityLog.entity_type == "task",
+            ActivityLog.entity_id == task_id,
+            ActivityLog.action == "UPDATE_TASK",
+        )
+        snapshots = select(TaskSnapshot).where(TaskSnapshot.task_id == task_id)
+
+        before = (
+            await db.execute(
+                snapshots.where(TaskSnapshot.taken_at <= as_of)
+                .order_by(TaskSnapshot.taken_at.desc(), TaskSnapshot.id.desc())
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+        if before:
+            # Hacia delante: snapshot + cambios hasta as_of
+            state = dict(before.state)
+            rows = await db.execute(
+                updates.where(
+                    ActivityLog.id > before.activity_log_id,
+                    ActivityLog.created_at <= as_of,
+                ).order_by(ActivityLog.id)
+            )
+            for _, created_at, changes in rows:
+                for change in changes or []:
+                    state[change["field"]] = change["new"]
+                state["updated_at"] = created_at
+            return TaskResponse.model_validate(state)
+
+        # Hacia atrás: primer snapshot posterior (o tarea actual) - cambios
+        after = (
+            await db.execute(
+                snapshots.order_by(TaskSnapshot.taken_at, TaskSnapshot.id).limit(1)
+            )
+        ).scalar_one_or_none()
+        if after:
+            state = dict(after.state)
+            updates = updates.where(ActivityLog.id <= after.activity_log_id)
+        else:
+            state = task.model_dump(mode="json")
+        state["updated_at"] = task.created_at
+        rows = await db.execute(updates.order_by(ActivityLog.id.desc()))
+        for _, created_at, changes in rows:
+            if created_at <= as_of:
+                # Último cambio vigente en as_of: el resto ya se aplicó
+                state["updated_at"] = created_at
+                break
+            for change in changes or []:
+                state[change["field"]] = change["old"]
+        return TaskResponse.model_validate(state)
+
+    @staticmethod
+    async def get_task_detail(
+        task_id: int, user: User, db: AsyncSession, limit: int = 50
+    ) -> TaskDetailResponse:
+        """
+        Devuelve la tarea junto con sus comentarios e historial.
+
+        El permiso se verifica una sola vez y las tres consultas se ejecutan
+        en la misma transacción de la sesión.
+        """
+        task = await TaskService._get_accessible_task(task_id, user, db)
+        comments = await TaskService._fetch_comments(task_id, db, limit=limit)
+        history = await TaskService._fetch_history(task_id, db, limit=limit)
+
+        return TaskDetailResponse(
+            task=task,
+            comments=comments,
+            history=history,
+        )
+
+    @staticmethod
+    async def batch_get_tasks(
+        task_ids: list[int], user: User, db: AsyncSession
+    ) -> TaskBatchGetResponse:
+        """
+        Carga varias tareas con un solo ``WHERE id IN (...)``.
+
+        La regla de acceso se evalúa en SQL como columna calculada, de modo que
+        se distingue entre tareas prohibidas e inexistentes sin hidratar
+        instancias ORM ni cargar relaciones.
+        """
+        requested = list(dict.fromkeys(task_ids))  # Sin duplicados, en orden
         result = await db.execute(
-            select(Task)
-            .where(Task.id == task_id)
-            .options(selectinload(Task.owner), selectinload(Task.assigned_to))
+            select(
+                *TASK_RESPONSE_COLUMNS,
+                TaskService._access_predicate(user).label("can_access"),
+            ).where(Task.id.in_(requested))
         )
-        task = result.scalar_one_or_none()
+        rows = {row["id"]: row for row in result.mappings()}
 
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
+        tasks, forbidden, missing = [], [], []
+        for task_id in requested:
+            row = rows.get(task_id)
+            if row is None:
+                missing.append(task_id)
+            elif not row["can_access"]:
+                forbidden.append(task_id)
+            else:
+                tasks.append(TaskResponse.model_validate(dict(row)))
 
-        # Access Control
-        can_modify = (
-            user.is_owner()
-            or task.owner_id == user.id
-            or task.assigned_to_id == user.id
+        return TaskBatchGetResponse(tasks=tasks, forbidden=forbidden, missing=missing)
+
+    @staticmethod
+    async def _update_returning(
+        task_id: int,
+        values: dict,
+        user: User,
+        version: int | None,
+        db: AsyncSession,
+    ) -> tuple[dict, dict] | None:
+        """
+        UPDATE ... RETURNING con acceso, versión y detección de cambios en el WHERE.
+
+        Returns:
+            (valores anteriores de los campos enviados, fila actualizada con
+            ``snapshot_version``), o None si ninguna fila cumple el WHERE
+        """
+        columns = [getattr(Task, field) for field in values]
+        conditions = [
+            TaskService._access_predicate(user),
+            or_(*(column.is_distinct_from(values[column.key]) for column in columns)),
+        ]
+        if version is not None:
+            conditions.append(Task.version == version)
+        stmt = (
+            update(Task)
+            .values(**values, version=Task.version + 1)
+            .execution_options(synchronize_session=False)
         )
-        if not can_modify:
-            raise HTTPException(status_code=403, detail="Not authorized")
 
-        if task_data.due_date and task_data.due_date.tzinfo:
-            task_data.due_date = task_data.due_date.astimezone(timezone.utc).replace(
-                tzinfo=None
+        if (await db.connection()).dialect.name == "postgresql":
+            # La subconsulta (con el lock de la fila) ve los valores previos
+            # al UPDATE: una sola ida y vuelta
+            old = (
+                select(Task.id, *columns)
+                .where(Task.id == task_id)
+                .with_for_update()
+                .subquery("old")
             )
+            row = (
+                (
+                    await db.execute(
+                        stmt.where(Task.id == old.c.id, *conditions).returning(
+                            *Task.__table__.c,
+                            TaskService._snapshot_version(),
+                            *(
+                                old.c[column.key].label(f"old_{column.key}")
+                                for column in columns
+                            ),
+                        )
+                    )
+                )
+                .mappings()
+                .one_or_none()
+            )
+            if row is None:
+                return None
+            return {field: row[f"old_{field}"] for field in values}, dict(row)
 
-        # Update fields
-        update_dict = task_data.model_dump(exclude_unset=True)
-        changes = []
-        old_assigned_to_id = task.assigned_to_id
+        # SQLite devuelve los valores nuevos también para la subconsulta: se
+        # leen antes, en la misma transacción
+        old_row = (
+            (await db.execute(select(*columns).where(Task.id == task_id)))
+            .mappings()
+            .one_or_none()
+        )
+        if old_row is None:
+            return None
+        row = (
+            (
+                await db.execute(
+                    stmt.where(Task.id == task_id, *conditions).returning(
+                        *Task.__table__.c, TaskService._snapshot_version()
+                    )
+                )
+            )
+            .mappings()
+            .one_or_none()
+        )
+        return None if row is None else (dict(old_row), dict(row))
 
-        for field, value in update_dict.items():
-            current_value = getattr(task, field)
-            if current_value != value:
-                changes.append(f"{field}: {current_value} -> {value}")
-                setattr(task, field, value)
+    @staticmethod
+    def _revoked_tombstone(
+        task_id: int, owner_id: int, old_assignee: int | None, new_assignee: int | None
+    ) -> dict | None:
+        """
+        Tombstone ``revoked`` para el assignee anterior de una tarea reasignada.
 
-        if changes:
-            # Log Activity
-            await TaskService._log_activity(
-                db, user.id, "UPDATE_TASK", "task", task.id, ", ".join(changes)
-            )
+        None si sigue viéndola (es el owner) o si no había assignee.
+        """
+        if old_assignee is None or old_assignee in (owner_id, new_assignee):
+            return None
+        return {
+            "task_id": task_id,
+            "owner_id": owner_id,
+            "assigned_to_id": old_assignee,
+            "reason": "revoked",
+        }
 
-            # Create notification if task was assigned to someone new
-            if (
-                "assigned_to_id" in update_dict
-                and task.assigned_to_id
-                and task.assigned_to_id != old_assigned_to_id
-                and task.assigned_to_id != user.id
-            ):
-                result = await db.execute(
-                    select(User).where(User.id == task.assigned_to_id)
+    @staticmethod
+    async def update_task(
+        task_id: int,
+        task_data: TaskUpdate,
+        user: User,
+        db: AsyncSession,
+        if_match: str | None = None,
+    ) -> TaskResponse:
+        """
+        Actualiza una tarea con un único UPDATE ... RETURNING.
+
+        El control de acceso, la versión exigida por If-Match y la detección
+        de cambios van en el WHERE. Solo si no se actualiza ninguna fila se
+        lee la tarea, para responder con el error adecuado (o sin cambios).
+
+        Raises:
+            HTTPException: 404 si no existe, 403 si no es accesible, 412 si
+                If-Match no coincide con la versión actual
+        """
+        version = TaskService.if_match_version(task_id, if_match)
+        values = task_data.model_dump(exclude_unset=True)
+        if "due_date" in values:
+            values["due_date"] = TaskService._to_naive_utc(values["due_date"])
+
+        updated = None
+        if values:
+            updated = await TaskService._update_returning(
+                task_id, values, user, version, db
+            )
+        if updated is None:
+            task = await TaskService._get_accessible_task(task_id, user, db)
+            if version is not None and task.version != version:
+                raise HTTPException(
+                    status_code=412,
+                    detail="Task was modified by another request",
+                    headers={"ETag": TaskService.task_etag(task)},
                 )
-                assigned_user = result.scalar_one_or_none()
-                if assigned_user:
-                    await NotificationService.create_task_assigned_notification(
-                        task, assigned_user, user, db
-                    )
+            return task  # Sin cambios
+
+        old, row = updated
+        task = TaskResponse.model_validate(row)
+        changes = [
+            TaskService._change(field, old[field], row[field])
+            for field in values
+            if old[field] != row[field]
+        ]
 
-            # Create general update notification
-            await NotificationService.create_task_updated_notification(task, user, db)
+        # Log Activity
+        log = await TaskService._log_activity(
+            db,
+            user.id,
+            "UPDATE_TASK",
+            "task",
+            task.id,
+            TaskService._changes_details(changes),
+            changes,
+        )
+        await TaskService._snapshot_if_due(task, row["snapshot_version"], log, db)
+
+        # El assignee anterior deja de ver la tarea: tombstone para su sync
+        if "assigned_to_id" in values and (
+            revoked := TaskService._revoked_tombstone(
+                task.id, task.owner_id, old["assigned_to_id"], task.assigned_to_id
+            )
+        ):
+            await db.execute(insert(TaskTombstone), [revoked])
+
+        # Notificaciones para el assignee (asignación nueva y actualización)
+        notifications: list[NotificationCreate] = []
+        if task.assigned_to_id and task.assigned_to_id != user.id:
+            if old.get("assigned_to_id", task.assigned_to_id) != task.assigned_to_id:
+                notifications.append(
+                    NotificationService.task_assigned_payload(
+                        task.id, task.title, task.assigned_to_id, user
+                    )
+                )
+            notifications.append(
+                NotificationService.task_updated_payload(
+                    task.id, task.title, task.assigned_to_id, user
+                )
+            )
+        await NotificationService.create_notifications_bulk(notifications, db)
 
         await db.commit()
-        await db.refresh(task)
-        return TaskResponse.model_validate(task)
+        return task
 
     @staticmethod
     async def delete_task(task_id: int, user: User, db: AsyncSession) -> None:
@@ -235,26 +921,496 @@ class TaskService:
         if not can_delete:
             raise HTTPException(status_code=403, detail="Not authorized")
 
+        # Tombstone para clientes que sincronizan con /tasks/changes
+        db.add(
+            TaskTombstone(
+                task_id=task.id,
+                owner_id=task.owner_id,
+                assigned_to_id=task.assigned_to_id,
+            )
+        )
         await db.delete(task)
         await db.commit()
 
+    # --- Bulk operations ---
+    @staticmethod
+    async def bulk_tasks(
+        request: TaskBulkRequest, user: User, db: AsyncSession
+    ) -> TaskBulkResponse:
+        """
+        Crea, actualiza y elimina varias tareas en una sola transacción.
+
+        Usa una consulta de permisos para todos los ids, sentencias
+        UPDATE/DELETE por conjunto e inserts en lote para activity logs y
+        notificaciones. Los errores por ítem (404/403/422) no abortan el lote.
+        """
+        results: list[TaskBulkItemResult] = []
+        activity: list[dict] = []
+        notifications: list[NotificationCreate] = []
+        tombstones: list[dict] = []
+
+        # 1. Una sola consulta de permisos para todo el lote
+        target_ids = {item.id for item in request.update} | set(request.delete)
+        existing = {}
+        if target_ids:
+            rows = await db.execute(
+                select(
+                    Task.id,
+                    Task.title,
+                    Task.status,
+                    Task.owner_id,
+                    Task.assigned_to_id,
+                    Task.due_date,
+                ).where(Task.id.in_(target_ids))
+            )
+            existing = {row.id: row for row in rows}
+
+        # 2. Validar assignees con una sola consulta
+        assignee_ids = {t.assigned_to_id for t in request.create} | {
+            u.assigned_to_id for u in request.update
+        }
+        assignee_ids.discard(None)
+        valid_assignees: set[int] = set()
+        if assignee_ids:
+            valid_assignees = set(
+                (await db.execute(select(User.id).where(User.id.in_(assignee_ids))))
+                .scalars()
+                .all()
+            )
+
+        def fail(op: str, index: int, item_id: int | None, code: int, detail: str):
+            results.append(
+                TaskBulkItemResult(
+                    op=op, index=index, id=item_id, status_code=code, detail=detail
+                )
+            )
+
+        # 3. Creates: un INSERT multi-fila con RETURNING
+        new_rows: list[dict] = []
+        new_indexes: list[int] = []
+        for index, item in enumerate(request.create):
+            if item.assigned_to_id and item.assigned_to_id not in valid_assignees:
+                fail("create", index, None, 422, "Assignee not found")
+                continue
+            new_rows.append(
+                {
+                    "title": item.title,
+                    "description": item.description,
+                    "status": item.status,
+                    "owner_id": user.id,
+                    "assigned_to_id": item.assigned_to_id,
+                    "due_date": TaskService._to_naive_utc(item.due_date),
+                }
+            )
+            new_indexes.append(index)
+
+        if new_rows:
+            created_ids = (
+                await db.execute(
+                    insert(Task).returning(Task.id, sort_by_parameter_order=True),
+                    new_rows,
+                )
+            ).scalars()
+            for index, task_id, row in zip(new_indexes, created_ids, new_rows):
+                results.append(
+                    TaskBulkItemResult(
+                        op="create", index=index, id=task_id, status_code=201
+                    )
+                )
+                activity.append(
+                    {
+                        "user_id": user.id,
+                        "action": "CREATE_TASK",
+                        "entity_type": "task",
+                        "entity_id": task_id,
+                        "details": f"Created task '{row['title']}'",
+                        "changes": None,
+                    }
+                )
+                if row["assigned_to_id"] and row["assigned_to_id"] != user.id:
+                    notifications.append(
+                        NotificationService.task_assigned_payload(
+                            task_id, row["title"], row["assigned_to_id"], user
+                        )
+                    )
+
+        # 4. Updates: un UPDATE por cada conjunto distinto de valores
+        grouped_updates: dict[tuple, list[int]] = defaultdict(list)
+        seen: set[int] = set()
+        for index, item in enumerate(request.update):
+            task = existing.get(item.id)
+            if item.id in seen:
+                fail("update", index, item.id, 400, "Duplicate task id")
+                continue
+            seen.add(item.id)
+            if task is None:
+                fail("update", index, item.id, 404, "Task not found")
+                continue
+            can_modify = (
+                user.is_owner()
+                or task.owner_id == user.id
+                or task.assigned_to_id == user.id
+            )
+            if not can_modify:
+                fail("update", index, item.id, 403, "Not authorized")
+                continue
+            if item.assigned_to_id and item.assigned_to_id not in valid_assignees:
+                fail("update", index, item.id, 422, "Assignee not found")
+                continue
+
+            update_dict = item.model_dump(exclude_unset=True, exclude={"id"})
+            # null explícito en una columna NOT NULL (p. ej. status)
+            not_null = [
+                field
+                for field, value in update_dict.items()
+                if value is None and not Task.__table__.c[field].nullable
+            ]
+            if not_null:
+                fail("update", index, item.id, 422, f"{not_null[0]}: cannot be null")
+                continue
+            if "due_date" in update_dict:
+                update_dict["due_date"] = TaskService._to_naive_utc(
+                    update_dict["due_date"]
+                )
+            diff = {
+                field: value
+                for field, value in update_dict.items()
+                if getattr(task, field) != value
+            }
+            results.append(
+                TaskBulkItemResult(
+                    op="update", index=index, id=item.id, status_code=200
+                )
+            )
+            if not diff:
+                continue
+
+            grouped_updates[tuple(sorted(diff.items(), key=lambda kv: kv[0]))].append(
+                item.id
+            )
+            changes = [
+                TaskService._change(field, getattr(task, field), value)
+                for field, value in diff.items()
+            ]
+            activity.append(
+                {
+                    "user_id": user.id,
+                    "action": "UPDATE_TASK",
+                    "entity_type": "task",
+                    "entity_id": item.id,
+                    "details": TaskService._changes_details(changes),
+                    "changes": changes,
+                }
+            )
+            assignee = diff.get("assigned_to_id", task.assigned_to_id)
+            if "assigned_to_id" in diff and (
+                revoked := TaskService._revoked_tombstone(
+                    item.id, task.owner_id, task.assigned_to_id, assignee
+                )
+            ):
+                tombstones.append(revoked)
+            if assignee and assignee != user.id:
+                if "assigned_to_id" in diff:
+                    notifications.append(
+                        NotificationService.task_assigned_payload(
+                            item.id, task.title, assignee, user
+                        )
+                    )
+                notifications.append(
+                    NotificationService.task_updated_payload(
+                        item.id, task.title, assignee, user
+                    )
+                )
+
+        for values, ids in grouped_updates.items():
+            await db.execute(
+                update(Task)
+                .where(Task.id.in_(ids))
+                .values(**dict(values), version=Task.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+
+        # 5. Activity logs y notificaciones en lote
+        if activity:
+            await db.execute(insert(ActivityLog), activity)
+        await NotificationService.create_notifications_bulk(notifications, db)
+
+        # 6. Deletes: tombstones (junto con los de reasignación) + un DELETE
+        to_delete = []
+        seen.clear()
+        for index, task_id in enumerate(request.delete):
+            task = existing.get(task_id)
+            if task_id in seen:
+                fail("delete", index, task_id, 400, "Duplicate task id")
+                continue
+            seen.add(task_id)
+            if task is None:
+                fail("delete", index, task_id, 404, "Task not found")
+                continue
+            if not (user.is_owner() or task.owner_id == user.id):
+                fail("delete", index, task_id, 403, "Not authorized")
+                continue
+            to_delete.append(task)
+            results.append(
+                TaskBulkItemResult(
+                    op="delete", index=index, id=task_id, status_code=204
+                )
+            )
+
+        tombstones.extend(
+            {
+                "task_id": task.id,
+                "owner_id": task.owner_id,
+                "assigned_to_id": task.assigned_to_id,
+                "reason": "deleted",
+            }
+            for task in to_delete
+        )
+        if tombstones:
+            await db.execute(insert(TaskTombstone), tombstones)
+        if to_delete:
+            await db.execute(
+                delete(Task)
+                .where(Task.id.in_([task.id for task in to_delete]))
+                .execution_options(synchronize_session=False)
+            )
+
+        logger.info(
+            f"Bulk by user_id={user.id}: {len(new_rows)} created, "
+            f"{len(grouped_updates)} update statements, {len(to_delete)} deleted"
+        )
+        await db.commit()
+
+        op_order = {"create": 0, "update": 1, "delete": 2}
+        results.sort(key=lambda r: (op_order[r.op], r.index))
+        return TaskBulkResponse(results=results)
+
+    # --- Import ---
+    @staticmethod
+    async def import_tasks(
+        records: AsyncIterator[ParsedRecord], user: User, db: AsyncSession
+    ) -> TaskImportResponse:
+        """
+        Importa tareas desde un stream de registros ya parseados.
+
+        Cada registro se valida con TaskCreate; el assignee puede venir como
+        ``assigned_to`` (username) o ``assigned_to_id``. Las filas válidas se
+        insertan en chunks de IMPORT_CHUNK_SIZE, cada uno en su transacción,
+        con una sola consulta de assignees y un único activity log por chunk.
+
+        Raises:
+            HTTPException: 400 si el cuerpo no es UTF-8 válido (los chunks
+                anteriores ya quedaron importados)
+        """
+        user_id = user.id  # Se lee antes de los commits de cada chunk
+        errors: list[TaskImportRowError] = []
+        failed = 0
+        created = 0
+        # username / id -> id de usuarios activos ya resueltos (None = no existe)
+        assignees: dict[str | int, int | None] = {}
+        chunk: list[tuple[int, TaskCreate, str | None]] = []
+
+        def fail(row: int, detail: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+                errors.append(TaskImportRowError(row=row, detail=detail))
+
+        try:
+            async for row, record in records:
+                if isinstance(record, str):
+                    fail(row, record)
+                    continue
+                username = record.pop("assigned_to", None)
+                if username is not None and not (
+                    isinstance(username, str) and username
+                ):
+                    fail(row, "assigned_to: must be a username string")
+                    continue
+                try:
+                    task_data = TaskCreate.model_validate(record)
+                except ValidationError as exc:
+                    fail(
+                        row,
+                        "; ".join(
+                            f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                            for error in exc.errors()
+                        ),
+                    )
+                    continue
+                chunk.append((row, task_data, username))
+
+                if len(chunk) >= IMPORT_CHUNK_SIZE:
+                    created += await TaskService._import_chunk(
+                        chunk, user_id, assignees, fail, db
+                    )
+                    chunk = []
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Body is not valid UTF-8")
+
+        if chunk:
+            created += await TaskService._import_chunk(
+                chunk, user_id, assignees, fail, db
+            )
+
+        logger.info(f"Import by user_id={user_id}: {created} created, {failed} failed")
+        return TaskImportResponse(
+            created=created,
+            failed=failed,
+            errors=errors,
+            errors_truncated=failed > len(errors),
+        )
+
+    @staticmethod
+    async def _import_chunk(
+        chunk: list[tuple[int, TaskCreate, str | None]],
+        user_id: int,
+        assignees: dict[str | int, int | None],
+        fail,
+        db: AsyncSession,
+    ) -> int:
+        """Inserta un chunk validado y hace commit. Devuelve las filas creadas."""
+        # 1. Una consulta para los usernames / ids aún no resueltos
+        usernames = {name for _, _, name in chunk if name} - assignees.keys()
+        ids = {
+            task.assigned_to_id for _, task, name in chunk if not name
+        } - assignees.keys()
+        ids.discard(None)
+        if usernames or ids:
+            result = await db.execute(
+                select(User.id, User.username).where(
+                    User.is_active, or_(User.username.in_(usernames), User.id.in_(ids))
+                )
+            )
+            for found_id, found_name in result:
+                assignees[found_id] = assignees[found_name] = found_id
+            for key in usernames | ids:
+                assignees.setdefault(key, None)
+
+        # 2. Filas a insertar (el username tiene prioridad sobre assigned_to_id)
+        now = datetime.utcnow()
+        rows: list[dict] = []
+        for row, task, username in chunk:
+            assignee_key = username or task.assigned_to_id
+            assigned_to_id = assignees[assignee_key] if assignee_key else None
+            if assignee_key and assigned_to_id is None:
+                fail(row, "Assignee not found")
+                continue
+            rows.append(
+                {
+                    "title": task.title,
+                    "description": task.description,
+                    "status": task.status,
+                    "due_date": TaskService._to_naive_utc(task.due_date),
+                    "assigned_to_id": assigned_to_id,
+                    "owner_id": user_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        if not rows:
+            return 0
+
+        # 3. Un activity log que resume el chunk. No se crean notificaciones de
+        # asignación: son datos migrados y COPY no devuelve los ids.
+        await TaskService._log_activity(
+            db,
+            user_id,
+            "IMPORT_TASKS",
+            "user",
+            user_id,
+            f"Imported {len(rows)} tasks (rows {chunk[0][0]}-{chunk[-1][0]})",
+        )
+        # El flush abre la transacción del driver antes del COPY
+        await db.flush()
+
+        # 4. Insert: COPY en PostgreSQL, INSERT multi-fila en el resto
+        connection = await db.connection()
+        if connection.dialect.name == "postgresql":
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Task.__tablename__,
+                records=[tuple(r[c] for c in IMPORT_COLUMNS) for r in rows],
+                columns=IMPORT_COLUMNS,
+            )
+        else:
+            await db.execute(insert(Task), rows)
+
+        await db.commit()
+        return len(rows)
+
+    # --- Delta sync ---
+    @staticmethod
+    async def get_changes(
+        user: User, db: AsyncSession, since: str | None = None
+    ) -> TaskChangesResponse:
+        """
+        Tareas creadas/modificadas y eliminadas desde un watermark.
+
+        Sin ``since`` devuelve todas las tareas visibles (sincronización
+        completa). ``deleted_ids`` incluye también las tareas que el usuario
+        dejó de ver al ser reasignadas (tombstones ``revoked``), salvo las que
+        vuelve a ver y ya van en ``changed``. El watermark devuelto se retrasa
+        ``SYNC_WATERMARK_OVERLAP`` para no perder escrituras que aún no habían
+        hecho commit; el cliente puede recibir una misma tarea dos veces y debe
+        aplicarlas por id.
+        """
+        now = datetime.utcnow()
+
+        since_ts = None
+        if since is not None:
+            try:
+                since_ts = decode_watermark(since)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid watermark")
+
+        query = TaskService._apply_list_filters(select(Task), user)
+        if since_ts is not None:
+            query = query.where(Task.updated_at > since_ts)
+        changed = (await db.execute(query.order_by(Task.updated_at))).scalars().all()
+
+        deleted_ids: list[int] = []
+        if since_ts is not None:
+            tombstones = select(TaskTombstone.task_id).where(
+                TaskTombstone.deleted_at > since_ts
+            )
+            if user.is_owner():
+                # Los owners ven todas las tareas: las reasignaciones no cuentan
+                tombstones = tombstones.where(TaskTombstone.reason == "deleted")
+            else:
+                tombstones = tombstones.where(
+                    (TaskTombstone.assigned_to_id == user.id)
+                    | (
+                        (TaskTombstone.reason == "deleted")
+                        & (TaskTombstone.owner_id == user.id)
+                    )
+                )
+            changed_ids = {task.id for task in changed}
+            deleted_ids = [
+                task_id
+                for task_id in dict.fromkeys((await db.execute(tombstones)).scalars())
+                if task_id not in changed_ids
+            ]
+
+        return TaskChangesResponse(
+            changed=[TaskResponse.model_validate(task) for task in changed],
+            deleted_ids=deleted_ids,
+            watermark=encode_watermark(now - SYNC_WATERMARK_OVERLAP),
+        )
+
     # --- Comments ---
     @staticmethod
     async def add_comment(
         task_id: int, comment_data: CommentCreate, user: User, db: AsyncSession
     ) -> CommentResponse:
-        # Check task existence & access
-        await TaskService.get_task(task_id, user, db)  # Reuses perm check logic
+        """
+        Añade un comentario y notifica al owner y al assignee de la tarea.
 
-        # Get task for notification (with eager loading to avoid lazy load issues)
-        from sqlalchemy.orm import selectinload
-
-        task_result = await db.execute(
-            select(Task)
-            .where(Task.id == task_id)
-            .options(selectinload(Task.owner), selectinload(Task.assigned_to))
-        )
-        task = task_result.scalar_one()
+        La tarea se lee una sola vez (la misma lectura sirve para el chequeo de
+        acceso y para las notificaciones) y la respuesta se construye sin
+        volver a leer el comentario.
+        """
+        task = await TaskService._get_accessible_task(task_id, user, db)
 
         new_comment = Comment(
             content=comment_data.content, task_id=task_id, user_id=user.id
@@ -270,35 +1426,229 @@ class TaskService:
         # Create comment notification
         await NotificationService.create_task_comment_notification(task, user, db)
 
+        # Antes del commit, que expira los atributos del comentario
+        response = CommentResponse(
+            id=new_comment.id,
+            content=new_comment.content,
+            task_id=task_id,
+            user_id=user.id,
+            user=UserSummary.model_validate(user),
+            created_at=new_comment.created_at,
+        )
         await db.commit()
-        await db.refresh(new_comment)
-        return CommentResponse.model_validate(new_comment)
+        return response
 
     @staticmethod
-    async def get_comments(
-        task_id: int, user: User, db: AsyncSession
-    ) -> list[CommentResponse]:
-        await TaskService.get_task(task_id, user, db)  # Check perms
+    def _parse_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+        if cursor is None:
+            return None
+        try:
+            return decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-        result = await db.execute(
-            select(Comment)
+    @staticmethod
+    async def _fetch_comments(
+        task_id: int, db: AsyncSession, limit: int, cursor: str | None = None
+    ) -> Page[CommentResponse]:
+        """Página de comentarios en orden cronológico (sin chequeo de permisos).
+
+        Se seleccionan solo columnas (sin cargar relaciones por fila) y los
+        autores se resuelven con una única consulta por página.
+        """
+        after = TaskService._parse_cursor(cursor)
+
+        query = (
+            select(
+                Comment.id,
+                Comment.content,
+                Comment.task_id,
+                Comment.user_id,
+                Comment.created_at,
+            )
             .where(Comment.task_id == task_id)
-            .order_by(Comment.created_at)
+            .order_by(Comment.created_at, Comment.id)
+            .limit(limit + 1)  # Fila extra para saber si hay más
         )
-        return [CommentResponse.model_validate(c) for c in result.scalars().all()]
+        if after:
+            query = query.where(tuple_(Comment.created_at, Comment.id) > after)
+
+        rows = (await db.execute(query)).mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        authors = await TaskService._load_user_summaries(
+            {row["user_id"] for row in rows}, db
+        )
+        items = [CommentResponse(**row, user=authors[row["user_id"]]) for row in rows]
+        return Page[CommentResponse](
+            items=items,
+            has_more=has_more,
+            next_cursor=(
+                encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+                if has_more
+                else None
+            ),
+        )
+
+    @staticmethod
+    async def _load_user_summaries(
+        user_ids: set[int], db: AsyncSession
+    ) -> dict[int, UserSummary]:
+        """Resuelve varios usuarios en una sola consulta (loaders del request)."""
+        if not user_ids:
+            return {}
+        return await get_loaders(db).load_users(user_ids)
+
+    @staticmethod
+    async def get_comments(
+        task_id: int,
+        user: User,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> Page[CommentResponse]:
+        await TaskService._get_accessible_task(task_id, user, db)  # Check perms
+        return await TaskService._fetch_comments(task_id, db, limit, cursor)
+
+    @staticmethod
+    async def get_comments_etag(
+        task_id: int,
+        user: User,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> str:
+        """ETag de una página de comentarios (los comentarios no se editan)."""
+        await TaskService._get_accessible_task(task_id, user, db)  # Check perms
+
+        count, last_created = (
+            await db.execute(
+                select(func.count(Comment.id), func.max(Comment.created_at)).where(
+                    Comment.task_id == task_id
+                )
+            )
+        ).one()
+        return make_etag("comments", task_id, limit, cursor, count, last_created)
 
     # --- History ---
     @staticmethod
-    async def get_history(
-        task_id: int, user: User, db: AsyncSession
-    ) -> list[ActivityLogResponse]:
-        await TaskService.get_task(task_id, user, db)  # Check perms
+    async def _fetch_history(
+        task_id: int,
+        db: AsyncSession,
+        limit: int,
+        cursor: str | None = None,
+        field: ActivityField | None = None,
+    ) -> Page[ActivityLogResponse]:
+        """
+        Página de historial, más reciente primero (sin chequeo de permisos).
 
-        result = await db.execute(
-            select(ActivityLog)
+        Con ``field`` solo se devuelven las entradas que cambiaron ese campo.
+        """
+        before = TaskService._parse_cursor(cursor)
+
+        query = (
+            select(*ACTIVITY_LOG_COLUMNS)
             .where(ActivityLog.entity_type == "task", ActivityLog.entity_id == task_id)
-            .order_by(ActivityLog.created_at.desc())
+            .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+            .limit(limit + 1)
         )
-        return [
-            ActivityLogResponse.model_validate(log) for log in result.scalars().all()
-        ]
+        if before:
+            query = query.where(tuple_(ActivityLog.created_at, ActivityLog.id) < before)
+        if field:
+            dialect = (await db.connection()).dialect.name
+            query = query.where(TaskService.changed_field_filter(field, dialect))
+
+        rows = (await db.execute(query)).mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        return Page[ActivityLogResponse](
+            items=[ActivityLogResponse(**row) for row in rows],
+            has_more=has_more,
+            next_cursor=(
+                encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+                if has_more
+                else None
+            ),
+        )
+
+    @staticmethod
+    async def get_history(
+        task_id: int,
+        user: User,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: str | None = None,
+        field: ActivityField | None = None,
+    ) -> Page[ActivityLogResponse]:
+        await TaskService._get_accessible_task(task_id, user, db)  # Check perms
+        return await TaskService._fetch_history(task_id, db, limit, cursor, field)
+
+    @staticmethod
+    async def get_history_etag(
+        task_id: int,
+        user: User,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: str | None = None,
+        field: ActivityField | None = None,
+    ) -> str:
+        """ETag de una página de historial (el historial es append-only)."""
+        await TaskService._get_accessible_task(task_id, user, db)  # Check perms
+
+        count, last_created = (
+            await db.execute(
+                select(
+                    func.count(ActivityLog.id), func.max(ActivityLog.created_at)
+                ).where(
+                    ActivityLog.entity_type == "task", ActivityLog.entity_id == task_id
+                )
+            )
+        ).one()
+        return make_etag("history", task_id, limit, cursor, field, count, last_created)
+
+    # --- Export ---
+    @staticmethod
+    def export_tasks_query(
+        user: User, status_filter: str | None = None, search: str | None = None
+    ) -> Select:
+        """Todas las tareas visibles (mismos filtros que ``list_tasks``), por id."""
+        query = TaskService._apply_list_filters(
+            select(*TASK_RESPONSE_COLUMNS), user, status_filter, search
+        )
+        return query.order_by(Task.id)
+
+    @staticmethod
+    def export_activity_query(user: User) -> Select:
+        """
+        Activity log completo, por id.
+
+        Un owner ve toda la actividad; un member solo la de las tareas que
+        puede ver (owner/assignee), con la misma regla que ``list_tasks``.
+        """
+        query = select(*ACTIVITY_LOG_COLUMNS).order_by(ActivityLog.id)
+        if not user.is_owner():
+            visible_tasks = select(Task.id).where(TaskService._access_predicate(user))
+            query = query.where(
+                ActivityLog.entity_type == "task",
+                ActivityLog.entity_id.in_(visible_tasks),
+            )
+        return query
+
+    @staticmethod
+    async def stream_rows(
+        query: Select, db: AsyncSession, chunk_size: int = EXPORT_CHUNK_SIZE
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Ejecuta ``query`` con un cursor del servidor y la entrega por chunks.
+
+        Con ``yield_per`` solo hay ``chunk_size`` filas en memoria a la vez,
+        sea cual sea el tamaño total del resultado.
+        """
+        result = await db.stream(query.execution_options(yield_per=chunk_size))
+        try:
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+        finally:
+            await result.close()
@@ -3,7 +3,8 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-from src.api.dependencies import get_db
+from src.api.dependencies import get_db, get_session_factory
+from src.core.principal_cache import principal_cache
 from src.core.security_middleware import limiter
 from src.db.base import Base
 from src.main import app
@@ -44,6 +45,8 @@ async def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Background workers open their own sessions on the test engine
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -51,3 +54,5 @@ async def client(db_session):
         yield c
 
     app.dependency_overrides.clear()
+    # Each test recreates the DB, so user ids (and tokens) repeat across tests
+    principal_cache.clear()
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.admission_control import (
+    ConcurrencyGate,
+    GradientLimit,
+    RouteClassLimits,
+    admission_controller,
+    classify_route,
+)
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+def test_classify_route():
+    assert classify_route("POST", "/api/v1/auth/login") == "auth"
+    assert classify_route("GET", "/api/v1/tasks/export") == "exports"
+    assert classify_route("GET", "/api/v1/activity/export") == "exports"
+    assert classify_route("POST", "/api/v1/exports") == "exports"
+    assert classify_route("POST", "/api/v1/tasks/import") == "exports"
+    # Consultar el estado de un job o descargarlo no compite con las exportaciones
+    assert classify_route("GET", "/api/v1/exports/7") == "reads"
+    assert classify_route("GET", "/api/v1/exports/7/file") == "downloads"
+    assert classify_route("GET", "/api/v1/tasks/exported") == "reads"
+    assert classify_route("GET", "/api/v1/tasks/1") == "reads"
+    assert classify_route("PATCH", "/api/v1/tasks/1") == "writes"
+    assert classify_route("GET", "/health") is None
+
+
+def test_gradient_limit_follows_latency():
+    limit = GradientLimit(initial=10, min_limit=2, max_limit=20)
+
+    for _ in range(50):  # Latencia estable con el límite en uso: crece
+        limit.update(0.010, inflight=int(limit.value))
+    assert limit.value == 20
+
+    for _ in range(20):  # La latencia se multiplica: baja
+        limit.update(0.200, inflight=int(limit.value))
+    assert limit.value < 10
+
+    before = limit.value
+    limit.update(0.001, inflight=0)  # Sin uso no hay información
+    assert limit.value == before
+
+
+@pytest.mark.asyncio
+async def test_gate_queues_then_sheds():
+    gate = ConcurrencyGate("reads", RouteClassLimits(1, 1, 1), queue_timeout=0.05)
+    assert await gate.acquire()
+
+    # Espera en cola y entra cuando se libera el hueco
+    waiting = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    assert gate.queued == 1
+    gate.release(None)
+    assert await waiting
+    assert gate.inflight == 1
+
+    # Espera agotada: se descarta
+    assert not await gate.acquire()
+    assert gate.queued == 0
+
+    # Cola llena: se descarta sin esperar
+    queued = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    assert not await gate.acquire()
+    assert not await queued
+    assert gate.inflight == 1
+
+
+@pytest.mark.asyncio
+async def test_overloaded_class_gets_503(client: AsyncClient, monkeypatch):
+    token = await _register_and_login(client, "shedder", "shedder@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    saturated = ConcurrencyGate("reads", RouteClassLimits(1, 1, 1), queue_timeout=0.01)
+    saturated.inflight = 1
+    monkeypatch.setitem(admission_controller.gates, "reads", saturated)
+
+    response = await client.get("/api/v1/tasks", headers=headers)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert "x-content-type-options" in response.headers
+
+    # El resto de clases y /health no se ven afectados
+    created = await client.post("/api/v1/tasks", json={"title": "T"}, headers=headers)
+    assert created.status_code == 201
+    assert (await client.get("/health")).status_code == 200
+    assert saturated.inflight == 1
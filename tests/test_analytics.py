@@ -0,0 +1,129 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from src.services import AnalyticsService
+from src.services.analytics_service import compute_flow_metrics
+
+
+@pytest.fixture(autouse=True)
+def clear_analytics_cache():
+    AnalyticsService.clear_cache()
+    yield
+    AnalyticsService.clear_cache()
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+def _ts(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+def test_compute_flow_metrics():
+    tasks = [
+        (1, _ts(2024, 1, 1), 7),
+        (2, _ts(2024, 1, 1), 7),
+        (3, _ts(2024, 1, 1), None),
+        (4, _ts(2023, 1, 1), 7),  # Terminada fuera de la ventana
+    ]
+    transitions = [
+        (1, _ts(2024, 1, 2), "in_progress"),
+        (1, _ts(2024, 1, 3), "done"),
+        # Reabierta y vuelta a terminar: cuenta el último done
+        (2, _ts(2024, 1, 2), "in_progress"),
+        (2, _ts(2024, 1, 4), "done"),
+        (2, _ts(2024, 1, 5), "in_progress"),
+        (2, _ts(2024, 1, 9), "done"),
+        # Directo a done: lead time sí, cycle time no
+        (3, _ts(2024, 1, 2), "done"),
+        (4, _ts(2023, 2, 1), "done"),
+    ]
+
+    metrics = compute_flow_metrics(
+        tasks, transitions, date(2024, 1, 1), date(2024, 1, 14)
+    )
+
+    assert metrics.week_starts == [date(2024, 1, 1), date(2024, 1, 8)]
+    assert metrics.lead_time.count == 3
+    assert metrics.lead_time.p50_hours == 48.0  # 24h, 48h, 192h
+    assert metrics.cycle_time.count == 2
+    assert metrics.cycle_time.mean_hours == (24 + 168) / 2
+
+    by_assignee = {t.assigned_to_id: t for t in metrics.throughput}
+    assert by_assignee[7].weekly == [1, 1]
+    assert by_assignee[7].rolling_avg == [1.0, 1.0]
+    assert by_assignee[None].weekly == [1, 0]
+    assert by_assignee[None].rolling_avg == [1.0, 0.5]
+    assert metrics.throughput[0].assigned_to_id == 7
+
+
+def test_compute_flow_metrics_ignores_unknown_tasks():
+    # Pasos de tareas terminadas después de leer ``tasks`` (ids 5 y 1_000)
+    tasks = [(2, _ts(2024, 1, 1), 7), (9, _ts(2024, 1, 1), 7)]
+    transitions = [
+        (5, _ts(2024, 1, 2), "done"),
+        (9, _ts(2024, 1, 3), "done"),
+        (1_000, _ts(2024, 1, 4), "done"),
+    ]
+
+    metrics = compute_flow_metrics(
+        tasks, transitions, date(2024, 1, 1), date(2024, 1, 7)
+    )
+
+    assert metrics.lead_time.count == 1
+    assert metrics.lead_time.p50_hours == 48.0
+    assert metrics.throughput[0].weekly == [1]
+
+
+def test_compute_flow_metrics_empty():
+    metrics = compute_flow_metrics([], [], date(2024, 1, 1), date(2024, 1, 1))
+    assert metrics.lead_time.count == 0
+    assert metrics.lead_time.p95_hours is None
+    assert metrics.throughput == []
+    assert metrics.week_starts == [date(2024, 1, 1)]
+
+
+@pytest.mark.asyncio
+async def test_flow_metrics_endpoint(client: AsyncClient):
+    alice = await _register_and_login(client, "flowalice", "flowalice@test.com")
+    bob = await _register_and_login(client, "flowbob", "flowbob@test.com")
+
+    for token, title in ((alice, "A"), (bob, "B")):
+        headers = {"Authorization": f"Bearer {token}"}
+        task_id = (
+            await client.post("/api/v1/tasks", json={"title": title}, headers=headers)
+        ).json()["id"]
+        for status in ("in_progress", "done"):
+            await client.patch(
+                f"/api/v1/tasks/{task_id}", json={"status": status}, headers=headers
+            )
+
+    response = await client.get(
+        "/api/v1/analytics/flow", headers={"Authorization": f"Bearer {alice}"}
+    )
+    assert response.status_code == 200
+    metrics = response.json()
+    assert len(metrics["week_starts"]) == 12
+    assert metrics["lead_time"]["count"] == 1
+    assert metrics["cycle_time"]["count"] == 1
+    assert [t["total"] for t in metrics["throughput"]] == [1]
+
+    invalid = await client.get(
+        "/api/v1/analytics/flow",
+        params={"since": "2024-02-01", "until": "2024-01-01"},
+        headers={"Authorization": f"Bearer {alice}"},
+    )
+    assert invalid.status_code == 400
@@ -0,0 +1,122 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.services import BurndownService
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_burndown_reads_daily_snapshots(client: AsyncClient, db_session):
+    member = await _register_and_login(client, "burnmember", "burnmember@test.com")
+    await _register_and_login(client, "burnowner", "burnowner@test.com")
+    await db_session.execute(
+        text("UPDATE users SET role = 'owner' WHERE username = 'burnowner'")
+    )
+    await db_session.commit()
+    owner = await _register_and_login(client, "burnowner", "burnowner@test.com")
+    member_headers = {"Authorization": f"Bearer {member}"}
+    owner_headers = {"Authorization": f"Bearer {owner}"}
+
+    member_tasks = [
+        (
+            await client.post(
+                "/api/v1/tasks", json={"title": f"M{i}"}, headers=member_headers
+            )
+        ).json()["id"]
+        for i in range(3)
+    ]
+    await client.post("/api/v1/tasks", json={"title": "O"}, headers=owner_headers)
+
+    await BurndownService.take_snapshot(db_session, date(2024, 1, 1))
+    for task_id, new_status in zip(member_tasks, ("in_progress", "done")):
+        await client.patch(
+            f"/api/v1/tasks/{task_id}",
+            json={"status": new_status},
+            headers=member_headers,
+        )
+    await BurndownService.take_snapshot(db_session, date(2024, 1, 2))
+    # Rehacer un día reemplaza su snapshot
+    await BurndownService.take_snapshot(db_session, date(2024, 1, 2))
+
+    params = {"from": "2024-01-01", "to": "2024-01-31"}
+    member_points = (
+        await client.get(
+            "/api/v1/tasks/burndown", params=params, headers=member_headers
+        )
+    ).json()["points"]
+    assert member_points == [
+        {
+            "day": "2024-01-01",
+            "by_status": {"todo": 3, "in_progress": 0, "done": 0},
+            "remaining": 3,
+        },
+        {
+            "day": "2024-01-02",
+            "by_status": {"todo": 1, "in_progress": 1, "done": 1},
+            "remaining": 2,
+        },
+    ]
+
+    owner_points = (
+        await client.get("/api/v1/tasks/burndown", params=params, headers=owner_headers)
+    ).json()["points"]
+    assert [p["remaining"] for p in owner_points] == [4, 3]
+
+    invalid = await client.get(
+        "/api/v1/tasks/burndown",
+        params={"from": "2024-02-01", "to": "2024-01-01"},
+        headers=owner_headers,
+    )
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_on_demand_snapshot_is_owner_only(client: AsyncClient, db_session):
+    member = await _register_and_login(client, "snapmember", "snapmember@test.com")
+    await _register_and_login(client, "snapowner", "snapowner@test.com")
+    await db_session.execute(
+        text("UPDATE users SET role = 'owner' WHERE username = 'snapowner'")
+    )
+    await db_session.commit()
+    owner = await _register_and_login(client, "snapowner", "snapowner@test.com")
+    await client.post(
+        "/api/v1/tasks",
+        json={"title": "Snap"},
+        headers={"Authorization": f"Bearer {member}"},
+    )
+
+    forbidden = await client.post(
+        "/api/v1/tasks/burndown/snapshot",
+        headers={"Authorization": f"Bearer {member}"},
+    )
+    assert forbidden.status_code == 403
+
+    response = await client.post(
+        "/api/v1/tasks/burndown/snapshot",
+        headers={"Authorization": f"Bearer {owner}"},
+    )
+    assert response.status_code == 200
+    assert response.json()["groups"] == 1
+
+    points = (
+        await client.get(
+            "/api/v1/tasks/burndown", headers={"Authorization": f"Bearer {member}"}
+        )
+    ).json()["points"]
+    assert [p["remaining"] for p in points] == [1]
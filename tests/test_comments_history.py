@@ -1,5 +1,9 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from src.db import ActivityLog
+from src.scripts.migrate_activity_changes import migrate, parse_legacy_details
 
 
 async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
@@ -84,3 +88,196 @@ async def test_comments_and_history_permissions_and_order(client: AsyncClient):
     history = history_response.json()
     assert len(history) >= 2
     assert history[0]["action"] in {"UPDATE_TASK", "COMMENTED"}
+
+
+@pytest.mark.asyncio
+async def test_task_detail_aggregates_comments_and_history(client: AsyncClient):
+    owner_token = await _register_and_login(
+        client, username="detailowner", email="detailowner@test.com"
+    )
+    other_token = await _register_and_login(
+        client, username="detailother", email="detailother@test.com"
+    )
+    headers = {"Authorization": f"Bearer {owner_token}"}
+
+    task_id = (
+        await client.post(
+            "/api/v1/tasks", json={"title": "Detail Task"}, headers=headers
+        )
+    ).json()["id"]
+    for content in ("one", "two", "three"):
+        await client.post(
+            f"/api/v1/tasks/{task_id}/comments",
+            json={"content": content},
+            headers=headers,
+        )
+
+    response = await client.get(
+        f"/api/v1/tasks/{task_id}/detail?limit=2", headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["task"]["title"] == "Detail Task"
+    assert [c["content"] for c in data["comments"]["items"]] == ["one", "two"]
+    assert data["comments"]["has_more"] is True
+    assert len(data["history"]["items"]) == 2
+    assert data["history"]["items"][0]["action"] == "COMMENTED"
+    assert data["history"]["has_more"] is True
+
+    forbidden = await client.get(
+        f"/api/v1/tasks/{task_id}/detail",
+        headers={"Authorization": f"Bearer {other_token}"},
+    )
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_comments_and_history_cursor_pagination(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="pageowner", email="pageowner@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "Paged"}, headers=headers)
+    ).json()["id"]
+    for i in range(5):
+        await client.post(
+            f"/api/v1/tasks/{task_id}/comments",
+            json={"content": f"c{i}"},
+            headers=headers,
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            f"/api/v1/tasks/{task_id}/comments", params=params, headers=headers
+        )
+        assert response.status_code == 200
+        page = response.json()
+        assert all(c["user"]["username"] == "pageowner" for c in page)
+        seen.extend(c["content"] for c in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == [f"c{i}" for i in range(5)]
+
+    # History: 1 CREATE_TASK + 5 COMMENTED, newest first
+    first = await client.get(
+        f"/api/v1/tasks/{task_id}/history", params={"limit": 4}, headers=headers
+    )
+    second = await client.get(
+        f"/api/v1/tasks/{task_id}/history",
+        params={"limit": 4, "cursor": first.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    ids = [h["id"] for h in first.json() + second.json()]
+    assert len(ids) == 6 and len(set(ids)) == 6
+    assert second.json()[-1]["action"] == "CREATE_TASK"
+    assert "X-Next-Cursor" not in second.headers
+
+    invalid = await client.get(
+        f"/api/v1/tasks/{task_id}/comments",
+        params={"cursor": "not-a-cursor"},
+        headers=headers,
+    )
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_history_field_filter(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="fieldowner", email="fieldowner@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "Fields"}, headers=headers)
+    ).json()["id"]
+    for update in (
+        {"status": "in_progress", "title": "Renamed"},
+        {"due_date": "2030-01-02T03:04:05"},
+        {"status": "done"},
+    ):
+        await client.patch(f"/api/v1/tasks/{task_id}", json=update, headers=headers)
+
+    response = await client.get(
+        f"/api/v1/tasks/{task_id}/history",
+        params={"field": "status"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert [h["changes"] for h in response.json()] == [
+        [{"field": "status", "old": "in_progress", "new": "done"}],
+        [
+            {"field": "title", "old": "Fields", "new": "Renamed"},
+            {"field": "status", "old": "todo", "new": "in_progress"},
+        ],
+    ]
+
+    due = await client.get(
+        f"/api/v1/tasks/{task_id}/history",
+        params={"field": "due_date"},
+        headers=headers,
+    )
+    assert due.json()[0]["changes"] == [
+        {"field": "due_date", "old": None, "new": "2030-01-02T03:04:05"}
+    ]
+    assert due.headers["etag"] != response.headers["etag"]
+
+    invalid = await client.get(
+        f"/api/v1/tasks/{task_id}/history",
+        params={"field": "owner_id"},
+        headers=headers,
+    )
+    assert invalid.status_code == 422
+
+
+def test_parse_legacy_details():
+    assert parse_legacy_details(
+        "title: a, b -> c, status: todo -> done, assigned_to_id: None -> 3"
+    ) == [
+        {"field": "title", "old": "a, b", "new": "c"},
+        {"field": "status", "old": "todo", "new": "done"},
+        {"field": "assigned_to_id", "old": None, "new": 3},
+    ]
+    assert parse_legacy_details("due_date: 2030-01-02 03:04:05 -> None") == [
+        {"field": "due_date", "old": "2030-01-02T03:04:05", "new": None}
+    ]
+    assert parse_legacy_details("Created task 'x'") == []
+
+
+@pytest.mark.asyncio
+async def test_migrate_activity_changes(db_session):
+    db_session.add_all(
+        [
+            ActivityLog(
+                user_id=1,
+                action="UPDATE_TASK",
+                entity_type="task",
+                entity_id=1,
+                details="status: todo -> in_progress",
+            ),
+            ActivityLog(
+                user_id=1,
+                action="COMMENTED",
+                entity_type="task",
+                entity_id=1,
+                details="Added comment",
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    assert await migrate(db_session.bind, batch_size=1) == 1
+    assert await migrate(db_session.bind) == 0  # Idempotente
+
+    changes = (
+        (await db_session.execute(select(ActivityLog.changes).order_by(ActivityLog.id)))
+        .scalars()
+        .all()
+    )
+    assert changes == [[{"field": "status", "old": "todo", "new": "in_progress"}], None]
@@ -0,0 +1,133 @@
+import gzip
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from src.core.compression_middleware import CompressionMiddleware, choose_encoding
+
+LARGE_BODY = b'{"items": "' + b"x" * 4000 + b'"}'
+
+
+async def _large(request):
+    return Response(
+        LARGE_BODY, media_type="application/json", headers={"ETag": '"abc"'}
+    )
+
+
+async def _small(request):
+    return Response(b'{"ok": true}', media_type="application/json")
+
+
+async def _png(request):
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def _stream(request):
+    async def rows():
+        for i in range(50):
+            yield f'{{"id": {i}}}\n'.encode()
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+def _client() -> AsyncClient:
+    app = Starlette(
+        routes=[
+            Route("/large", _large),
+            Route("/small", _small),
+            Route("/png", _png),
+            Route("/stream", _stream),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+def test_choose_encoding_respects_q_values():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("br, deflate") is None
+    assert choose_encoding("*") in ("gzip", "zstd")
+    assert choose_encoding("") is None
+
+
+@pytest.mark.asyncio
+async def test_large_response_is_gzipped_with_vary_and_weak_etag():
+    async with _client() as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert int(response.headers["Content-Length"]) < len(LARGE_BODY)
+    assert response.content == LARGE_BODY
+
+
+@pytest.mark.asyncio
+async def test_small_and_binary_responses_are_not_compressed():
+    async with _client() as client:
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        png = await client.get("/png", headers={"Accept-Encoding": "gzip"})
+        identity = await client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    for response in (small, png, identity):
+        assert "Content-Encoding" not in response.headers
+    assert identity.headers["ETag"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_chunk_by_chunk():
+    async with _client() as client:
+        async with client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert lines[0] == '{"id": 0}'
+    assert len(lines) == 50
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_task_list_is_compressed_and_revalidates(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="gzipuser", email="gzipuser@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"}
+    for i in range(20):
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": f"Task {i}", "description": "Lorem ipsum " * 10},
+            headers=headers,
+        )
+
+    response = await client.get("/api/v1/tasks", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(response.json()) == 20
+
+    # El ETag débil sigue sirviendo para revalidar
+    unchanged = await client.get(
+        "/api/v1/tasks",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert unchanged.status_code == 304
@@ -0,0 +1,120 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_task_list_etag_revalidation(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="etaguser", email="etaguser@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "E1"}, headers=headers)
+    ).json()["id"]
+
+    first = await client.get("/api/v1/tasks", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    unchanged = await client.get(
+        "/api/v1/tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["ETag"] == etag
+
+    # Un filtro distinto es otro recurso
+    filtered = await client.get(
+        "/api/v1/tasks?status=done", headers={**headers, "If-None-Match": etag}
+    )
+    assert filtered.status_code == 200
+
+    await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"status": "done"}, headers=headers
+    )
+    changed = await client.get(
+        "/api/v1/tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_single_task_and_comments_etag(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="etagsingle", email="etagsingle@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "S1"}, headers=headers)
+    ).json()["id"]
+
+    task_res = await client.get(f"/api/v1/tasks/{task_id}", headers=headers)
+    etag = task_res.headers["ETag"]
+    not_modified = await client.get(
+        f"/api/v1/tasks/{task_id}",
+        headers={**headers, "If-None-Match": "W/" + etag.removeprefix("W/")},
+    )
+    assert not_modified.status_code == 304
+
+    comments = await client.get(f"/api/v1/tasks/{task_id}/comments", headers=headers)
+    comments_etag = comments.headers["ETag"]
+    await client.post(
+        f"/api/v1/tasks/{task_id}/comments",
+        json={"content": "new"},
+        headers=headers,
+    )
+    refreshed = await client.get(
+        f"/api/v1/tasks/{task_id}/comments",
+        headers={**headers, "If-None-Match": comments_etag},
+    )
+    assert refreshed.status_code == 200
+    assert len(refreshed.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_users_list_etag(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="etagusers", email="etagusers@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    etag = (await client.get("/api/v1/users", headers=headers)).headers["ETag"]
+    cached = await client.get(
+        "/api/v1/users", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    await _register_and_login(
+        client, username="etagusers2", email="etagusers2@test.com"
+    )
+    fresh = await client.get(
+        "/api/v1/users", headers={**headers, "If-None-Match": etag}
+    )
+    assert fresh.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_non_cacheable_api_responses_stay_no_store(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="nostore", email="nostore@test.com"
+    )
+    response = await client.get(
+        "/api/v1/notifications", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert "no-store" in response.headers["Cache-Control"]
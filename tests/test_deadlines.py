@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.deadlines import (
+    DeadlineMiddleware,
+    _deadline,
+    apply_statement_timeout,
+    remaining_time,
+    route_timeout,
+)
+
+
+def _slow_app(events: list[str]) -> FastAPI:
+    """App mínima con el middleware y endpoints lentos."""
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/api/v1/tasks/slow")
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        finally:
+            events.append("cleanup")  # Lo que haría el finally de get_db
+        return {}
+
+    @app.get("/api/v1/tasks/remaining")
+    async def remaining():
+        return {"remaining": remaining_time()}
+
+    @app.get("/remaining")
+    async def remaining_outside_api():
+        return {"remaining": remaining_time()}
+
+    @app.post("/api/v1/tasks/background")
+    async def background(background_tasks: BackgroundTasks):
+        async def job():
+            await asyncio.sleep(0.1)
+            events.append("background done")
+
+        background_tasks.add_task(job)
+        return {}
+
+    return app
+
+
+def test_route_timeout():
+    assert route_timeout("GET", "/api/v1/tasks") == settings.REQUEST_TIMEOUT_MS / 1000
+    long = settings.EXPORT_REQUEST_TIMEOUT_MS / 1000
+    assert route_timeout("GET", "/api/v1/tasks/export") == long
+    # Las importaciones masivas no tienen el deadline de las escrituras
+    assert route_timeout("POST", "/api/v1/tasks/import") == long
+    assert route_timeout("GET", "/health") is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_request():
+    events: list[str] = []
+    transport = ASGITransport(app=_slow_app(events))
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get(
+            "/api/v1/tasks/slow", headers={"X-Request-Timeout-Ms": "50"}
+        )
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Request deadline exceeded"}
+    assert events == ["cleanup"]
+
+
+@pytest.mark.asyncio
+async def test_client_can_only_shorten_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "REQUEST_TIMEOUT_MS", 50)
+    transport = ASGITransport(app=_slow_app([]))
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        slow = await c.get(
+            "/api/v1/tasks/slow", headers={"X-Request-Timeout-Ms": "60000"}
+        )
+        inside = await c.get("/api/v1/tasks/remaining")
+        outside = await c.get("/remaining")
+
+    assert slow.status_code == 504
+    assert 0 < inside.json()["remaining"] <= 0.05
+    assert outside.json()["remaining"] is None
+
+
+@pytest.mark.asyncio
+async def test_background_tasks_outlive_deadline():
+    events: list[str] = []
+    transport = ASGITransport(app=_slow_app(events))
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.post(
+            "/api/v1/tasks/background", headers={"X-Request-Timeout-Ms": "50"}
+        )
+
+    assert response.status_code == 200
+    assert events == ["background done"]
+
+
+@pytest.mark.asyncio
+async def test_statement_timeout_is_postgresql_only(db_session):
+    token = _deadline.set(time.monotonic() + 1)
+    try:
+        async with AsyncSession(db_session.bind) as session:
+            apply_statement_timeout(session)
+            # En SQLite el listener de after_begin no emite SET
+            assert (await session.execute(text("SELECT 1"))).scalar() == 1
+    finally:
+        _deadline.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_api_requests_run_within_deadline(client: AsyncClient):
+    response = await client.get("/health", headers={"X-Request-Timeout-Ms": "1"})
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"username": "deadline", "email": "d@test.com", "password": "password123"},
+        headers={"X-Request-Timeout-Ms": "5000"},
+    )
+    assert response.status_code == 201
@@ -0,0 +1,182 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.db import User
+from src.services import TaskService
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+async def _login(client: AsyncClient, username: str) -> str:
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_export_tasks_ndjson_applies_role_filter(client: AsyncClient):
+    alice = await _register_and_login(client, "exportalice", "exportalice@test.com")
+    bob = await _register_and_login(client, "exportbob", "exportbob@test.com")
+    for i in range(3):
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": f"Alice {i}"},
+            headers={"Authorization": f"Bearer {alice}"},
+        )
+    await client.post(
+        "/api/v1/tasks",
+        json={"title": "Bob"},
+        headers={"Authorization": f"Bearer {bob}"},
+    )
+
+    response = await client.get(
+        "/api/v1/tasks/export", headers={"Authorization": f"Bearer {alice}"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "tasks.ndjson" in response.headers["content-disposition"]
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in rows] == ["Alice 0", "Alice 1", "Alice 2"]
+    assert set(rows[0]) == set(TaskService.parse_fields(None))
+
+
+@pytest.mark.asyncio
+async def test_export_tasks_csv(client: AsyncClient):
+    token = await _register_and_login(client, "exportcsv", "exportcsv@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post(
+        "/api/v1/tasks",
+        json={"title": "Comma, task", "due_date": "2030-01-02T03:04:05"},
+        headers=headers,
+    )
+    await client.post("/api/v1/tasks", json={"title": "Plain"}, headers=headers)
+
+    response = await client.get(
+        "/api/v1/tasks/export", params={"format": "csv"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == ["Comma, task", "Plain"]
+    assert rows[0]["due_date"] == "2030-01-02T03:04:05"
+    assert rows[1]["due_date"] == ""
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(client: AsyncClient):
+    token = await _register_and_login(client, "exportbad", "exportbad@test.com")
+    response = await client.get(
+        "/api/v1/tasks/export",
+        params={"format": "xml"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_activity_member_vs_owner(client: AsyncClient, db_session):
+    await _register_and_login(client, "actowner", "actowner@test.com")
+    await db_session.execute(
+        text("UPDATE users SET role = 'owner' WHERE username = 'actowner'")
+    )
+    await db_session.commit()
+    owner = await _login(client, "actowner")
+    member = await _register_and_login(client, "actmember", "actmember@test.com")
+
+    owner_task = (
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": "Owner"},
+            headers={"Authorization": f"Bearer {owner}"},
+        )
+    ).json()["id"]
+    member_task = (
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": "Member"},
+            headers={"Authorization": f"Bearer {member}"},
+        )
+    ).json()["id"]
+
+    member_rows = [
+        json.loads(line)
+        for line in (
+            await client.get(
+                "/api/v1/activity/export",
+                headers={"Authorization": f"Bearer {member}"},
+            )
+        ).text.splitlines()
+    ]
+    assert {row["entity_id"] for row in member_rows} == {member_task}
+
+    owner_response = await client.get(
+        "/api/v1/activity/export",
+        params={"format": "csv"},
+        headers={"Authorization": f"Bearer {owner}"},
+    )
+    owner_rows = list(csv.DictReader(io.StringIO(owner_response.text)))
+    assert {int(row["entity_id"]) for row in owner_rows} == {owner_task, member_task}
+
+
+@pytest.mark.asyncio
+async def test_export_activity_includes_changes(client: AsyncClient):
+    token = await _register_and_login(client, "actchanges", "actchanges@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "Old"}, headers=headers)
+    ).json()["id"]
+    await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"title": "New"}, headers=headers
+    )
+    expected = [{"field": "title", "old": "Old", "new": "New"}]
+
+    ndjson = await client.get("/api/v1/activity/export", headers=headers)
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["changes"] for row in rows] == [None, expected]
+
+    # En CSV, los cambios van como JSON dentro de la celda
+    response = await client.get(
+        "/api/v1/activity/export", params={"format": "csv"}, headers=headers
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows[0]["changes"] == ""
+    assert json.loads(rows[1]["changes"]) == expected
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_yields_fixed_size_chunks(client: AsyncClient, db_session):
+    token = await _register_and_login(client, "chunkuser", "chunkuser@test.com")
+    for i in range(5):
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": f"T{i}"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    user = await db_session.get(User, 1)
+
+    query = TaskService.export_tasks_query(user)
+    chunks = [chunk async for chunk in TaskService.stream_rows(query, db_session, 2)]
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
@@ -0,0 +1,165 @@
+import gzip
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.core.config import settings
+from src.services import ExportService
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+async def _create_tasks(client: AsyncClient, headers: dict, count: int) -> None:
+    for i in range(count):
+        await client.post("/api/v1/tasks", json={"title": f"T{i}"}, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_export_job_lifecycle(client: AsyncClient, export_dir):
+    token = await _register_and_login(client, "jobuser", "jobuser@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    await _create_tasks(client, headers, 3)
+
+    created = await client.post(
+        "/api/v1/exports", json={"kind": "tasks", "format": "ndjson"}, headers=headers
+    )
+    assert created.status_code == 202
+    assert created.json()["status"] == "pending"
+    job_id = created.json()["id"]
+
+    # El worker corre como background task tras la respuesta
+    job = (await client.get(f"/api/v1/exports/{job_id}", headers=headers)).json()
+    assert job["status"] == "done"
+    assert job["rows_written"] == job["total_rows"] == 3
+    assert job["expires_at"] is not None
+
+    download = await client.get(f"/api/v1/exports/{job_id}/file", headers=headers)
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/gzip"
+    assert download.headers["accept-ranges"] == "bytes"
+    lines = gzip.decompress(download.content).decode().splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["T0", "T1", "T2"]
+    assert not list(export_dir.glob("*.part"))
+
+    partial = await client.get(
+        f"/api/v1/exports/{job_id}/file", headers={**headers, "Range": "bytes=0-9"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == download.content[:10]
+
+
+@pytest.mark.asyncio
+async def test_export_job_is_private(client: AsyncClient):
+    alice = await _register_and_login(client, "jobalice", "jobalice@test.com")
+    bob = await _register_and_login(client, "jobbob", "jobbob@test.com")
+
+    job_id = (
+        await client.post(
+            "/api/v1/exports",
+            json={"kind": "activity", "format": "csv"},
+            headers={"Authorization": f"Bearer {alice}"},
+        )
+    ).json()["id"]
+
+    bob_headers = {"Authorization": f"Bearer {bob}"}
+    assert (
+        await client.get(f"/api/v1/exports/{job_id}", headers=bob_headers)
+    ).status_code == 403
+    assert (
+        await client.get(f"/api/v1/exports/{job_id}/file", headers=bob_headers)
+    ).status_code == 403
+    assert (
+        await client.get("/api/v1/exports/9999", headers=bob_headers)
+    ).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_file_not_ready(client: AsyncClient, db_session):
+    token = await _register_and_login(client, "jobwait", "jobwait@test.com")
+    await db_session.execute(
+        text(
+            "INSERT INTO export_jobs (user_id, kind, format, status, rows_written, "
+            "created_at) VALUES (1, 'tasks', 'csv', 'running', 0, CURRENT_TIMESTAMP)"
+        )
+    )
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/exports/1/file", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_expired_exports_are_cleaned_up(
+    client: AsyncClient, db_session, export_dir
+):
+    token = await _register_and_login(client, "jobttl", "jobttl@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    job_id = (
+        await client.post("/api/v1/exports", json={"kind": "tasks"}, headers=headers)
+    ).json()["id"]
+    assert len(list(export_dir.iterdir())) == 1
+
+    await db_session.execute(
+        text("UPDATE export_jobs SET expires_at = '2000-01-01 00:00:00'")
+    )
+    await db_session.commit()
+    expired = await client.get(f"/api/v1/exports/{job_id}/file", headers=headers)
+    assert expired.status_code == 410
+
+    assert await ExportService.cleanup_expired(TestingSessionLocal) == 1
+    assert not list(export_dir.iterdir())
+    assert (
+        await client.get(f"/api/v1/exports/{job_id}", headers=headers)
+    ).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_setup_errors_mark_job_failed(client: AsyncClient, monkeypatch):
+    token = await _register_and_login(client, "jobfail", "jobfail@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def broken_query(job, user):
+        raise RuntimeError("query failed")
+
+    # Falla antes de empezar a escribir (consulta / conteo)
+    monkeypatch.setattr(ExportService, "_export_query", broken_query)
+    job_id = (
+        await client.post("/api/v1/exports", json={"kind": "tasks"}, headers=headers)
+    ).json()["id"]
+
+    job = (await client.get(f"/api/v1/exports/{job_id}", headers=headers)).json()
+    assert job["status"] == "failed"
+    assert job["error"] == "query failed"
+    assert job["expires_at"] is not None
+
+    # Los jobs fallidos también caducan (la limpieza corre tras cada POST)
+    monkeypatch.setattr(settings, "EXPORT_TTL_HOURS", -1)
+    expired_id = (
+        await client.post("/api/v1/exports", json={"kind": "tasks"}, headers=headers)
+    ).json()["id"]
+    assert (
+        await client.get(f"/api/v1/exports/{expired_id}", headers=headers)
+    ).status_code == 404
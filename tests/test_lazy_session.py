@@ -0,0 +1,115 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import (
+    DatabaseDep,
+    StreamingDatabaseDep,
+    get_current_user,
+    get_db,
+)
+from src.core.principal_cache import PrincipalCache
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+def test_principal_cache_expiry():
+    cache = PrincipalCache(ttl=60, max_entries=2)
+    cache.put("a", {"id": 1})
+    cache.put("b", {"id": 2}, token_exp=time.time() - 1)  # Token ya expirado
+    assert cache.get("a") == {"id": 1}
+    assert cache.get("b") is None
+
+    cache.put("c", {"id": 3})
+    cache.put("d", {"id": 4})  # Expulsa "a" (LRU)
+    assert cache.get("a") is None
+
+    disabled = PrincipalCache(ttl=0)
+    disabled.put("a", {"id": 1})
+    assert disabled.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_principal_does_not_touch_pool(client: AsyncClient, db_session):
+    token = await _register_and_login(client, "lazy", "lazy@test.com")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    pool = db_session.bind.sync_engine.pool
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(pool, "checkout", on_checkout)
+    try:
+        async with AsyncSession(db_session.bind) as session:
+            await get_current_user(credentials, session)
+        assert len(checkouts) == 1
+
+        async with AsyncSession(db_session.bind) as session:
+            user = await get_current_user(credentials, session)
+            assert user in session
+            assert (user.username, user.is_owner()) == ("lazy", False)
+        assert len(checkouts) == 1
+    finally:
+        event.remove(pool, "checkout", on_checkout)
+
+    # Las rutas siguen funcionando con el usuario de la cache
+    response = await client.post(
+        "/api/v1/tasks",
+        json={"title": "Cached"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201
+    assert response.json()["owner_id"] == user.id
+
+
+@pytest.mark.asyncio
+async def test_session_released_before_body_is_sent():
+    events: list[str] = []
+
+    async def tracking_db():
+        events.append("open")
+        yield None
+        events.append("close")
+
+    def body():
+        events.append("body")
+        yield b"{}"
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = tracking_db
+
+    @app.get("/unit-of-work")
+    async def unit_of_work(db: DatabaseDep):
+        return StreamingResponse(body())
+
+    @app.get("/streaming")
+    async def streaming(db: StreamingDatabaseDep):
+        return StreamingResponse(body())
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        await c.get("/unit-of-work")
+        assert events == ["open", "close", "body"]
+
+        events.clear()
+        await c.get("/streaming")
+        assert events == ["open", "body", "close"]
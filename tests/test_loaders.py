@@ -0,0 +1,186 @@
+import asyncio
+import re
+from collections import Counter
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import Task, User
+from src.services.loaders import DataLoader, get_loaders
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+class _Statements:
+    """Registra "VERBO tabla" de cada sentencia ejecutada en el engine."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.engine = session.bind.sync_engine
+        self.items: list[str] = []
+
+    def _on_execute(self, conn, cursor, statement, *args):
+        table = re.search(r"(?:FROM|INTO|UPDATE)\s+(\w+)", statement).group(1)
+        self.items.append(f"{statement.split()[0]} {table}")
+
+    def __enter__(self) -> list[str]:
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self.items
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_and_deduplicates_per_tick():
+    batches: list[list[int]] = []
+
+    async def batch_load(keys: list[int]) -> dict[int, str]:
+        batches.append(keys)
+        return {key: f"v{key}" for key in keys if key != 404}
+
+    loader = DataLoader(batch_load, asyncio.Lock())
+    many, one, missing = await asyncio.gather(
+        loader.load_many([1, 2, 2]), loader.load(2), loader.load(404)
+    )
+    assert batches == [[1, 2, 404]]
+    assert (many, one, missing) == ({1: "v1", 2: "v2"}, "v2", None)
+
+    # Cacheado: no hay otro lote
+    assert await loader.load_many([1, 2]) == {1: "v1", 2: "v2"}
+    assert len(batches) == 1
+
+    loader.clear()
+    assert await loader.load(1) == "v1"
+    assert batches[-1] == [1]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_does_not_cache_errors():
+    calls = 0
+
+    async def batch_load(keys: list[int]) -> dict[int, int]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_load, asyncio.Lock())
+    results = await asyncio.gather(
+        loader.load(1), loader.load(1), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert await loader.load(1) == 1
+
+
+@pytest.mark.asyncio
+async def test_dataloader_survives_cancelled_dispatcher():
+    batches: list[list[int]] = []
+
+    async def batch_load(keys: list[int]) -> dict[int, int]:
+        batches.append(keys)
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_load, asyncio.Lock())
+    dispatcher = asyncio.create_task(loader.load(1))
+    waiter = asyncio.create_task(loader.load_many([1, 2]))
+    await asyncio.sleep(0)
+    # Ambas encolaron sus claves; el lote aún no salió
+    assert loader._pending == [1, 2]
+    dispatcher.cancel()
+
+    assert await asyncio.wait_for(waiter, 1) == {1: 1, 2: 2}
+    assert dispatcher.cancelled()
+    assert batches == [[1, 2]]
+    assert loader._pending == []
+
+
+@pytest.mark.asyncio
+async def test_request_loaders_share_the_session(db_session):
+    db_session.add(User(username="ana", email="ana@test.com", hashed_password="x"))
+    await db_session.flush()
+    db_session.add(Task(title="T", owner_id=1))
+    await db_session.commit()
+
+    loaders = get_loaders(db_session)
+    assert get_loaders(db_session) is loaders
+
+    with _Statements(db_session) as statements:
+        # Las dos consultas se serializan sobre la misma sesión
+        users, tasks = await asyncio.gather(
+            loaders.load_users([1, 1, 2]), loaders.load_tasks([1])
+        )
+        await loaders.load_users([1])
+        await loaders.load_tasks([1])
+    assert statements == ["SELECT users", "SELECT tasks"]
+    assert users[1].username == "ana" and 2 not in users
+    assert (tasks[1].title, tasks[1].version) == ("T", 1)
+
+    # El commit vacía la cache
+    await db_session.commit()
+    with _Statements(db_session) as statements:
+        await loaders.load_tasks([1])
+    assert statements == ["SELECT tasks"]
+
+
+@pytest.mark.asyncio
+async def test_comment_reads_task_once(client: AsyncClient, db_session):
+    owner = await _register_and_login(client, "cowner", "cowner@test.com")
+    await _register_and_login(client, "cassignee", "cassignee@test.com")
+    headers = {"Authorization": f"Bearer {owner}"}
+    await client.get("/api/v1/tasks", headers=headers)  # Principal en cache
+
+    with _Statements(db_session) as statements:
+        task = await client.post(
+            "/api/v1/tasks", json={"title": "T", "assigned_to_id": 2}, headers=headers
+        )
+    assert task.status_code == 201
+    # El assignee se lee por columnas, sin cargar sus colecciones de tareas
+    assert statements == [
+        "INSERT tasks",
+        "SELECT users",
+        "INSERT notifications",
+        "INSERT activity_logs",
+    ]
+
+    with _Statements(db_session) as statements:
+        comment = await client.post(
+            f"/api/v1/tasks/{task.json()['id']}/comments",
+            json={"content": "Hola"},
+            headers=headers,
+        )
+    assert comment.status_code == 200
+    assert comment.json()["user"]["username"] == "cowner"
+    assert Counter(statements) == {
+        "SELECT tasks": 1,
+        "INSERT comments": 1,
+        "INSERT activity_logs": 1,
+        "INSERT notifications": 1,
+    }
+
+    assignee = await client.post(
+        "/api/v1/auth/login",
+        json={"username": "cassignee", "password": "password123"},
+    )
+    notifications = await client.get(
+        "/api/v1/notifications",
+        headers={"Authorization": f"Bearer {assignee.json()['access_token']}"},
+    )
+    assert [n["type"] for n in notifications.json()] == [
+        "task_comment",
+        "task_assigned",
+    ]
@@ -0,0 +1,312 @@
+import asyncio
+import time
+from collections import defaultdict
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.rate_limit import RateLimiter
+from src.core.rate_limit_stores import (
+    MemoryTokenBucketStore,
+    RateLimit,
+    RedisTokenBucketStore,
+    RespError,
+    SQLiteTokenBucketStore,
+    create_store,
+    take_tokens,
+)
+from src.core.security_middleware import limiter
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+class FakeRedis:
+    """
+    Servidor RESP en memoria con GET/SET PX, WATCH/MULTI/EXEC y TIME, y AUTH
+    obligatorio si se le da una contraseña.
+    """
+
+    def __init__(self, password: str | None = None, username: str = "default") -> None:
+        self.password, self.username = password, username
+        self.commands: list[bytes] = []
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.versions: dict[bytes, int] = defaultdict(int)
+        self.aborted = 0
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> list[bytes] | None:
+        line = await reader.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            size = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(size + 2))[:-2])
+        return args
+
+    def _get(self, key: bytes) -> bytes | None:
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.time():
+            del self.data[key]
+            return None
+        return value
+
+    def _run(self, args: list[bytes]) -> bytes:
+        name, *rest = args
+        name = name.upper()
+        if name == b"GET":
+            value = self._get(rest[0])
+            return (
+                b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+            )
+        if name == b"SET":
+            key, value = rest[:2]
+            expires_at = time.time() + int(rest[3]) / 1000 if len(rest) > 3 else None
+            self.data[key] = (value, expires_at)
+            self.versions[key] += 1
+            return b"+OK\r\n"
+        if name == b"TIME":
+            seconds, micros = divmod(int(time.time() * 1_000_000), 1_000_000)
+            parts = [str(seconds).encode(), str(micros).encode()]
+            return b"*2\r\n" + b"".join(b"$%d\r\n%s\r\n" % (len(p), p) for p in parts)
+        if name == b"SELECT":
+            return b"+OK\r\n"  # Una sola base de datos
+        if name == b"FLUSHDB":
+            for key in self.data:
+                self.versions[key] += 1
+            self.data.clear()
+            return b"+OK\r\n"
+        return b"-ERR unknown command\r\n"
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        watched: dict[bytes, int] = {}
+        queued: list[list[bytes]] | None = None
+        authenticated = self.password is None
+        while (args := await self._read_command(reader)) is not None:
+            name = args[0].upper()
+            self.commands.append(name)
+            if name == b"AUTH":
+                credentials = [arg.decode() for arg in args[1:]]
+                if len(credentials) == 1:
+                    credentials.insert(0, "default")
+                authenticated = credentials == [self.username, self.password]
+                reply = b"+OK\r\n" if authenticated else b"-WRONGPASS invalid\r\n"
+            elif not authenticated:
+                reply = b"-NOAUTH Authentication required.\r\n"
+            elif name == b"WATCH":
+                watched.update({key: self.versions[key] for key in args[1:]})
+                reply = b"+OK\r\n"
+            elif name == b"UNWATCH":
+                watched.clear()
+                reply = b"+OK\r\n"
+            elif name == b"MULTI":
+                queued = []
+                reply = b"+OK\r\n"
+            elif name == b"EXEC":
+                if any(self.versions[key] != v for key, v in watched.items()):
+                    self.aborted += 1
+                    reply = b"*-1\r\n"
+                else:
+                    replies = [self._run(command) for command in queued]
+                    reply = b"*%d\r\n" % len(replies) + b"".join(replies)
+                watched.clear()
+                queued = None
+            elif queued is not None:
+                queued.append(args)
+                reply = b"+QUEUED\r\n"
+            else:
+                reply = self._run(args)
+            writer.write(reply)
+            await writer.drain()
+        writer.close()
+
+
+def test_take_tokens_refills_continuously():
+    limit = RateLimit.parse("60/minute")
+    tokens, result = take_tokens(None, 0.0, 0.0, limit, 1)
+    assert (tokens, result.allowed, result.remaining) == (59.0, True, 59)
+
+    tokens, result = take_tokens(0.0, 0.0, 0.5, limit, 1)
+    assert not result.allowed
+    assert result.retry_after == pytest.approx(0.5)
+
+    tokens, result = take_tokens(0.0, 0.0, 1000.0, limit, 1)  # Tope: capacidad
+    assert result.remaining == 59
+
+    with pytest.raises(ValueError):
+        RateLimit.parse("5 per minute")
+
+
+@pytest.mark.asyncio
+async def test_memory_store_is_bounded():
+    store = create_store("memory://?max_keys=2")
+    assert isinstance(store, MemoryTokenBucketStore)
+    limit = RateLimit.parse("2/hour")
+
+    assert (await store.acquire("a", limit)).allowed
+    assert (await store.acquire("a", limit)).allowed
+    assert not (await store.acquire("a", limit)).allowed
+    await store.acquire("b", limit)
+    await store.acquire("c", limit)  # Expulsa "a" (LRU)
+    assert list(store._buckets) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_is_shared_between_workers(tmp_path):
+    path = tmp_path / "ratelimit.db"
+    worker_a = SQLiteTokenBucketStore(str(path))
+    worker_b = create_store(f"sqlite:///{path}")
+    limit = RateLimit.parse("3/minute")
+
+    results = [
+        await store.acquire("user:1", limit)
+        for store in (worker_a, worker_b, worker_a, worker_b)
+    ]
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert results[-1].retry_after > 0
+
+    await worker_a.close()
+    await worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_store_against_fake_server(monkeypatch):
+    fake = FakeRedis()
+    server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    store = create_store(f"redis://127.0.0.1:{port}/0?pool_size=4")
+    assert isinstance(store, RedisTokenBucketStore)
+    monkeypatch.setattr(RedisTokenBucketStore, "MAX_ATTEMPTS", 100)
+    limit = RateLimit.parse("5/hour")
+
+    try:
+        # Concurrentes sobre la misma clave: WATCH evita consumir de más
+        results = await asyncio.gather(
+            *(store.acquire("user:1", limit) for _ in range(12))
+        )
+        assert sum(r.allowed for r in results) == 5
+        assert (await store.acquire("user:2", limit)).remaining == 4
+
+        # La clave expira cuando el bucket volvería a estar lleno
+        _, expires_at = fake.data[b"user:2"]
+        assert 0 < expires_at - time.time() <= 12 * 60
+
+        await store.clear()
+        assert (await store.acquire("user:1", limit)).allowed
+    finally:
+        await store.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("userinfo", "username"),
+    [(":s%40cret", "default"), ("limiter:s%40cret", "limiter")],
+    ids=["password", "acl_user"],
+)
+async def test_redis_store_authenticates(userinfo, username):
+    fake = FakeRedis(password="s@cret", username=username)
+    server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    store = create_store(f"redis://{userinfo}@127.0.0.1:{port}/1")
+    anonymous = create_store(f"redis://127.0.0.1:{port}/1")
+    limit = RateLimit.parse("5/hour")
+
+    try:
+        assert (await store.acquire("user:1", limit)).remaining == 4
+        # AUTH antes que SELECT
+        assert fake.commands[:2] == [b"AUTH", b"SELECT"]
+        with pytest.raises(RespError, match="NOAUTH"):
+            await anonymous.acquire("user:1", limit)
+    finally:
+        await store.close()
+        await anonymous.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_store_fails_open():
+    # Acepta la conexión pero nunca responde (Redis colgado / blackhole)
+    async def hang(reader, writer):
+        await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(hang, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    store = create_store(f"redis://127.0.0.1:{port}/0")
+    hanging = RateLimiter(store, default_limit="1/hour", timeout=0.05)
+    limit = RateLimit.parse("1/hour")
+
+    try:
+        started = time.monotonic()
+        results = [await hanging.acquire("user:1", limit) for _ in range(3)]
+        assert time.monotonic() - started < 1
+        assert all(result.allowed for result in results)
+    finally:
+        await store.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_default_limit_is_per_user(client: AsyncClient, monkeypatch):
+    alice = await _register_and_login(client, "limitalice", "limitalice@test.com")
+    bob = await _register_and_login(client, "limitbob", "limitbob@test.com")
+
+    monkeypatch.setattr(limiter, "enabled", True)
+    monkeypatch.setattr(limiter, "store", MemoryTokenBucketStore())
+    monkeypatch.setattr(limiter, "default_limit", RateLimit.parse("2/minute"))
+
+    for token in (alice, alice):
+        response = await client.get(
+            "/api/v1/tasks", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+    assert response.headers["x-ratelimit-limit"] == "2"
+    assert response.headers["x-ratelimit-remaining"] == "0"
+
+    blocked = await client.get(
+        "/api/v1/tasks", headers={"Authorization": f"Bearer {alice}"}
+    )
+    assert blocked.status_code == 429
+    assert int(blocked.headers["retry-after"]) >= 1
+    assert "x-content-type-options" in blocked.headers  # Security headers
+
+    other = await client.get(
+        "/api/v1/tasks", headers={"Authorization": f"Bearer {bob}"}
+    )
+    assert other.status_code == 200
+    assert (await client.get("/health")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_login_limit_is_per_ip(client: AsyncClient, monkeypatch):
+    await _register_and_login(client, "limitlogin", "limitlogin@test.com")
+    monkeypatch.setattr(limiter, "enabled", True)
+    monkeypatch.setattr(limiter, "store", MemoryTokenBucketStore())
+
+    statuses = [
+        (
+            await client.post(
+                "/api/v1/auth/login",
+                json={"username": "limitlogin", "password": "wrong-password"},
+            )
+        ).status_code
+        for _ in range(6)
+    ]
+    assert statuses == [401] * 5 + [429]
@@ -0,0 +1,35 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core.responses import FastJSONResponse, get_json_dumps
+from src.schemas import NotificationResponse
+
+NOTIFICATION = NotificationResponse(
+    id=1,
+    user_id=2,
+    task_id=None,
+    type="task_updated",
+    title="Task Updated",
+    message="ñandú updated the task",
+    is_read=False,
+    created_at=datetime(2024, 5, 1, 12, 30, 15, 123456),
+)
+
+
+def test_fast_json_response_serializes_models_directly():
+    body = FastJSONResponse([NOTIFICATION]).body
+    assert json.loads(body) == [json.loads(NOTIFICATION.model_dump_json())]
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "std", "auto"])
+def test_json_backends_agree_on_plain_content(backend):
+    content = NOTIFICATION.model_dump(mode="json")
+    dumps = get_json_dumps(backend)
+    assert json.loads(dumps(content)) == content
+
+
+def test_unknown_json_backend_is_rejected():
+    with pytest.raises(ValueError):
+        get_json_dumps("yaml")
@@ -0,0 +1,186 @@
+import asyncio
+import re
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+
+from src.core.singleflight import SingleFlight, request_coalescer
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+def _counter(results: list[int], delay: float = 0.01):
+    async def fn() -> int:
+        await asyncio.sleep(delay)
+        results.append(len(results) + 1)
+        return len(results)
+
+    return fn
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls: list[int] = []
+
+    values = await asyncio.gather(
+        *(flight.do("k", _counter(calls)) for _ in range(5)),
+        flight.do("other", _counter(calls)),
+    )
+    assert values == [1, 1, 1, 1, 1, 2]
+
+    # Sin ventana, una llamada posterior vuelve a ejecutar
+    assert await flight.do("k", _counter(calls)) == 3
+
+
+@pytest.mark.asyncio
+async def test_reuse_window_and_forget():
+    flight = SingleFlight(window=60)
+    calls: list[int] = []
+
+    assert await flight.do("k", _counter(calls)) == 1
+    assert await flight.do("k", _counter(calls)) == 1
+
+    flight.forget()
+    assert await flight.do("k", _counter(calls)) == 2
+
+    # Lo que termina después de forget() no se guarda
+    slow = asyncio.create_task(flight.do("slow", _counter(calls, delay=0.05)))
+    await asyncio.sleep(0.01)
+    flight.forget()
+    assert await flight.do("slow", _counter(calls)) == 3  # No se une al anterior
+    assert await slow == 4
+    assert await flight.do("slow", _counter(calls)) == 3
+
+    disabled = SingleFlight(window=60, enabled=False)
+    assert await disabled.do("k", _counter(calls)) == 5
+    assert await disabled.do("k", _counter(calls)) == 6
+
+
+@pytest.mark.asyncio
+async def test_leader_errors_are_shared_and_cancellation_is_retried():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+    calls: list[int] = []
+    leader = asyncio.create_task(flight.do("k", _counter(calls, delay=1)))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", _counter(calls)))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    # El que esperaba pasa a ser leader
+    assert await follower == 1
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+class _QueryCanceledError(Exception):
+    sqlstate = "57014"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [TimeoutError(), DBAPIError("SELECT 1", {}, _QueryCanceledError())],
+    ids=["timeout", "statement_timeout"],
+)
+async def test_leader_deadline_errors_are_not_shared(error):
+    flight = SingleFlight()
+    calls: list[int] = []
+
+    async def leader_fn():
+        await asyncio.sleep(0.01)
+        raise error
+
+    leader = asyncio.create_task(flight.do("k", leader_fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", _counter(calls)))
+
+    # El deadline del leader no es el de los demás: el siguiente reintenta
+    assert await follower == 1
+    with pytest.raises(type(error)):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_commit_discards_inflight_results(db_session):
+    calls: list[int] = []
+    first = asyncio.create_task(request_coalescer.do("k", _counter(calls, 0.05)))
+    await asyncio.sleep(0.01)
+
+    await db_session.execute(text("SELECT 1"))
+    await db_session.commit()
+
+    # Tras un commit no se reutiliza la ejecución que ya estaba en curso
+    assert await request_coalescer.do("k", _counter(calls)) == 1
+    assert await first == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_list_requests_share_queries(client: AsyncClient, db_session):
+    tokens = [
+        await _register_and_login(client, name, f"{name}@test.com")
+        for name in ("board1", "board2")
+    ]
+    await db_session.execute(text("UPDATE users SET role = 'owner'"))
+    await db_session.commit()
+    headers = [{"Authorization": f"Bearer {token}"} for token in tokens]
+    await client.post("/api/v1/tasks", json={"title": "Standup"}, headers=headers[0])
+    for h in headers:  # Principal en cache
+        await client.get("/api/v1/tasks/stats", headers=h)
+
+    statements: list[str] = []
+
+    def on_execute(conn, cursor, statement, *args):
+        table = re.search(r"FROM\s+(\w+)", statement).group(1)
+        statements.append(f"{statement.split()[0]} {table}")
+        time.sleep(0.05)  # En el hilo de aiosqlite: los demás requests llegan
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        # Dos owners (misma visibilidad) y parámetros en otro orden
+        responses = await asyncio.gather(
+            client.get("/api/v1/tasks?status=todo&fields=id,title", headers=headers[0]),
+            client.get("/api/v1/tasks?fields=id,title&status=todo", headers=headers[1]),
+            client.get("/api/v1/tasks?status=todo&fields=id,title", headers=headers[0]),
+        )
+        list_statements = list(statements)
+        statements.clear()
+        stats = await asyncio.gather(
+            *(client.get("/api/v1/tasks/stats", headers=h) for h in headers)
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    # ETag, aviso de vencimientos y listado: una sola vez para los tres
+    assert list_statements == ["SELECT tasks"] * 3
+    assert {r.content for r in responses} == {b'[{"id":1,"title":"Standup"}]'}
+    assert len({r.headers["etag"] for r in responses}) == 1
+
+    assert statements == ["SELECT tasks"]
+    assert [r.json()["total"] for r in stats] == [1, 1]
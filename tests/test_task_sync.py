@@ -0,0 +1,154 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.scripts.migrate_tombstone_reason import migrate
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_task_changes_since_watermark(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="syncuser", email="syncuser@test.com"
+    )
+    other_token = await _register_and_login(
+        client, username="syncother", email="syncother@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    other_headers = {"Authorization": f"Bearer {other_token}"}
+
+    doomed_id = (
+        await client.post("/api/v1/tasks", json={"title": "Doomed"}, headers=headers)
+    ).json()["id"]
+    other_doomed_id = (
+        await client.post(
+            "/api/v1/tasks", json={"title": "Not mine"}, headers=other_headers
+        )
+    ).json()["id"]
+
+    full = await client.get("/api/v1/tasks/changes", headers=headers)
+    assert full.status_code == 200
+    assert [t["title"] for t in full.json()["changed"]] == ["Doomed"]
+    assert full.json()["deleted_ids"] == []
+    watermark = full.json()["watermark"]
+
+    await client.post("/api/v1/tasks", json={"title": "Fresh"}, headers=headers)
+    await client.delete(f"/api/v1/tasks/{doomed_id}", headers=headers)
+    await client.delete(f"/api/v1/tasks/{other_doomed_id}", headers=other_headers)
+
+    delta = await client.get(
+        "/api/v1/tasks/changes", params={"since": watermark}, headers=headers
+    )
+    data = delta.json()
+    assert "Fresh" in {t["title"] for t in data["changed"]}
+    assert "Not mine" not in {t["title"] for t in data["changed"]}
+    assert data["deleted_ids"] == [doomed_id]
+    assert data["watermark"]
+
+
+@pytest.mark.asyncio
+async def test_task_changes_rejects_invalid_watermark(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="syncbad", email="syncbad@test.com"
+    )
+    response = await client.get(
+        "/api/v1/tasks/changes",
+        params={"since": "%%%"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_reassigned_task_is_revoked_for_previous_assignee(client: AsyncClient):
+    owner = await _register_and_login(client, "revowner", "revowner@test.com")
+    member = await _register_and_login(client, "revmember", "revmember@test.com")
+    await _register_and_login(client, "revnext", "revnext@test.com")
+    owner_headers = {"Authorization": f"Bearer {owner}"}
+    member_headers = {"Authorization": f"Bearer {member}"}
+
+    patched, bulked = [
+        (
+            await client.post(
+                "/api/v1/tasks",
+                json={"title": title, "assigned_to_id": 2},
+                headers=owner_headers,
+            )
+        ).json()["id"]
+        for title in ("Patched", "Bulked")
+    ]
+    full = await client.get("/api/v1/tasks/changes", headers=member_headers)
+    assert {t["id"] for t in full.json()["changed"]} == {patched, bulked}
+    owner_watermark = (
+        await client.get("/api/v1/tasks/changes", headers=owner_headers)
+    ).json()["watermark"]
+
+    await client.patch(
+        f"/api/v1/tasks/{patched}", json={"assigned_to_id": 3}, headers=owner_headers
+    )
+    await client.post(
+        "/api/v1/tasks/bulk",
+        json={"update": [{"id": bulked, "assigned_to_id": None}]},
+        headers=owner_headers,
+    )
+
+    delta = await client.get(
+        "/api/v1/tasks/changes",
+        params={"since": full.json()["watermark"]},
+        headers=member_headers,
+    )
+    assert delta.json()["changed"] == []
+    assert sorted(delta.json()["deleted_ids"]) == sorted([patched, bulked])
+
+    # El owner sigue viéndolas: no son borrados para él
+    owner_delta = await client.get(
+        "/api/v1/tasks/changes",
+        params={"since": owner_watermark},
+        headers=owner_headers,
+    )
+    assert owner_delta.json()["deleted_ids"] == []
+
+    # Si vuelve a estar asignada, llega como cambio y no como borrado
+    await client.patch(
+        f"/api/v1/tasks/{patched}", json={"assigned_to_id": 2}, headers=owner_headers
+    )
+    delta = await client.get(
+        "/api/v1/tasks/changes",
+        params={"since": full.json()["watermark"]},
+        headers=member_headers,
+    )
+    assert [t["id"] for t in delta.json()["changed"]] == [patched]
+    assert delta.json()["deleted_ids"] == [bulked]
+
+
+@pytest.mark.asyncio
+async def test_tombstone_reason_migration(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TABLE task_tombstones (id INTEGER PRIMARY KEY, task_id INTEGER)"
+        )
+        await conn.exec_driver_sql("INSERT INTO task_tombstones (task_id) VALUES (7)")
+
+    assert await migrate(engine) is True
+    assert await migrate(engine) is False  # Idempotente
+
+    async with engine.connect() as conn:
+        reason = (
+            await conn.exec_driver_sql("SELECT reason FROM task_tombstones")
+        ).scalar_one()
+    await engine.dispose()
+    assert reason == "deleted"
@@ -250,3 +250,41 @@ async def test_update_own_task(client: AsyncClient):
     data = update_res.json()
     assert data["title"] == "New Title"
     assert data["status"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_sparse_fieldset(client: AsyncClient):
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "username": "sparseuser",
+            "email": "sparse@example.com",
+            "password": "password123",
+        },
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": "sparseuser", "password": "password123"},
+        )
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post(
+        "/api/v1/tasks",
+        json={"title": "Board", "description": "x" * 500, "status": "todo"},
+        headers=headers,
+    )
+
+    response = await client.get(
+        "/api/v1/tasks?fields=title,status,due_date", headers=headers
+    )
+    assert response.status_code == 200
+    task = response.json()[0]
+    assert set(task) == {"id", "title", "status", "due_date"}
+    assert task["title"] == "Board"
+
+    full_etag = (await client.get("/api/v1/tasks", headers=headers)).headers["ETag"]
+    assert response.headers["ETag"] != full_etag
+
+    invalid = await client.get("/api/v1/tasks?fields=title,secret", headers=headers)
+    assert invalid.status_code == 400
@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import text
@@ -188,3 +190,91 @@ async def test_delete_task_not_found(client: AsyncClient):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_get_splits_found_forbidden_missing(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="batchuser", email="batchuser@test.com"
+    )
+    other_token = await _register_and_login(
+        client, username="batchother", email="batchother@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    mine = (
+        await client.post("/api/v1/tasks", json={"title": "Mine"}, headers=headers)
+    ).json()["id"]
+    theirs = (
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": "Theirs"},
+            headers={"Authorization": f"Bearer {other_token}"},
+        )
+    ).json()["id"]
+
+    response = await client.post(
+        "/api/v1/tasks/batch-get",
+        json={"ids": [theirs, mine, 9999, mine]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [t["title"] for t in data["tasks"]] == ["Mine"]
+    assert data["forbidden"] == [theirs]
+    assert data["missing"] == [9999]
+
+
+@pytest.mark.asyncio
+async def test_task_stats_respect_role_filter(client: AsyncClient, db_session):
+    await _register_and_login(client, username="statsowner", email="so@test.com")
+    await db_session.execute(
+        text("UPDATE users SET role = 'owner' WHERE username = 'statsowner'")
+    )
+    await db_session.commit()
+    owner_token = await _login(client, username="statsowner")
+    member_token = await _register_and_login(
+        client, username="statsmember", email="sm@test.com"
+    )
+    owner_headers = {"Authorization": f"Bearer {owner_token}"}
+    member_headers = {"Authorization": f"Bearer {member_token}"}
+
+    now = datetime.now(timezone.utc)
+    for payload in (
+        {"title": "Late", "due_date": (now - timedelta(days=1)).isoformat()},
+        {"title": "Soon", "due_date": (now + timedelta(days=1)).isoformat()},
+        {"title": "Later", "due_date": (now + timedelta(days=10)).isoformat()},
+        {
+            "title": "Late but done",
+            "status": "done",
+            "due_date": (now - timedelta(days=1)).isoformat(),
+        },
+    ):
+        await client.post("/api/v1/tasks", json=payload, headers=member_headers)
+    await client.post(
+        "/api/v1/tasks",
+        json={"title": "Owner", "status": "in_progress", "assigned_to_id": 2},
+        headers=owner_headers,
+    )
+
+    member_stats = (
+        await client.get("/api/v1/tasks/stats", headers=member_headers)
+    ).json()
+    assert member_stats["total"] == 5
+    assert member_stats["by_status"] == {"todo": 3, "in_progress": 1, "done": 1}
+    assert member_stats["overdue"] == 1
+    assert member_stats["due_soon"] == 1
+    assert member_stats["by_assignee"] == [
+        {"assigned_to_id": None, "count": 4},
+        {"assigned_to_id": 2, "count": 1},
+    ]
+
+    await client.post("/api/v1/tasks", json={"title": "Private"}, headers=owner_headers)
+    owner_stats = (
+        await client.get("/api/v1/tasks/stats", headers=owner_headers)
+    ).json()
+    assert owner_stats["total"] == 6
+    member_stats = (
+        await client.get("/api/v1/tasks/stats", headers=member_headers)
+    ).json()
+    assert member_stats["total"] == 5
@@ -0,0 +1,158 @@
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db import TaskSnapshot
+from src.scripts.migrate_snapshot_version import migrate
+from src.services import task_service
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_get_task_as_of(client: AsyncClient, db_session, monkeypatch):
+    monkeypatch.setattr(task_service, "TASK_SNAPSHOT_INTERVAL", 2)
+    token = await _register_and_login(client, "asofuser", "asofuser@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    before_create = datetime.utcnow()
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "v0"}, headers=headers)
+    ).json()["id"]
+
+    checkpoints = [datetime.utcnow()]
+    updates = [
+        {"title": "v1"},
+        {"title": "v2", "due_date": "2030-01-02T03:04:05"},
+        {"status": "in_progress"},
+        {"title": "v4", "due_date": None},
+        {"status": "done"},
+    ]
+    for update in updates:
+        await client.patch(f"/api/v1/tasks/{task_id}", json=update, headers=headers)
+        checkpoints.append(datetime.utcnow())
+
+    snapshots = (
+        await db_session.execute(select(func.count(TaskSnapshot.id)))
+    ).scalar_one()
+    assert snapshots == 2  # Tras el 2º y el 4º cambio
+
+    states = []
+    for checkpoint in checkpoints:
+        response = await client.get(
+            f"/api/v1/tasks/{task_id}",
+            params={"as_of": checkpoint.isoformat()},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        task = response.json()
+        states.append((task["title"], task["status"], task["due_date"]))
+
+    assert states == [
+        ("v0", "todo", None),
+        ("v1", "todo", None),
+        ("v2", "todo", "2030-01-02T03:04:05"),
+        ("v2", "in_progress", "2030-01-02T03:04:05"),
+        ("v4", "in_progress", None),
+        ("v4", "done", None),
+    ]
+
+    missing = await client.get(
+        f"/api/v1/tasks/{task_id}",
+        params={"as_of": before_create.isoformat()},
+        headers=headers,
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_updates_count_towards_snapshots(
+    client: AsyncClient, db_session, monkeypatch
+):
+    monkeypatch.setattr(task_service, "TASK_SNAPSHOT_INTERVAL", 3)
+    token = await _register_and_login(client, "asofbulk", "asofbulk@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "v1"}, headers=headers)
+    ).json()["id"]
+
+    # PATCH -> v2, bulk -> v3 y v4 (el límite del intervalo cae en un bulk)
+    await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"title": "v2"}, headers=headers
+    )
+    for status in ("in_progress", "done"):
+        response = await client.post(
+            "/api/v1/tasks/bulk",
+            json={"update": [{"id": task_id, "status": status}]},
+            headers=headers,
+        )
+        assert response.json()["results"][0]["status_code"] == 200
+    checkpoint = datetime.utcnow()
+    await client.patch(
+        f"/api/v1/tasks/{task_id}", json={"title": "v5"}, headers=headers
+    )
+
+    # El siguiente PATCH guarda el snapshot pendiente
+    snapshots = (
+        await db_session.execute(select(TaskSnapshot.version, TaskSnapshot.state))
+    ).all()
+    assert [
+        (version, state["title"], state["status"]) for version, state in snapshots
+    ] == [(5, "v5", "done")]
+
+    response = await client.get(
+        f"/api/v1/tasks/{task_id}",
+        params={"as_of": checkpoint.isoformat()},
+        headers=headers,
+    )
+    assert (response.json()["title"], response.json()["status"]) == ("v2", "done")
+
+
+@pytest.mark.asyncio
+async def test_migration_backfills_snapshot_version(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TABLE activity_logs (id INTEGER PRIMARY KEY, "
+            "action VARCHAR(50), entity_type VARCHAR(50), entity_id INTEGER)"
+        )
+        await conn.exec_driver_sql(
+            "CREATE TABLE task_snapshots (id INTEGER PRIMARY KEY, "
+            "task_id INTEGER, activity_log_id INTEGER)"
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO activity_logs (action, entity_type, entity_id) VALUES "
+            "('CREATE_TASK', 'task', 1), ('UPDATE_TASK', 'task', 1), "
+            "('UPDATE_TASK', 'task', 2), ('UPDATE_TASK', 'task', 1), "
+            "('UPDATE_TASK', 'task', 1)"
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO task_snapshots (task_id, activity_log_id) VALUES (1, 4)"
+        )
+
+    assert await migrate(engine) is True
+    assert await migrate(engine) is False  # Idempotente
+
+    async with engine.connect() as conn:
+        version = (
+            await conn.exec_driver_sql("SELECT version FROM task_snapshots")
+        ).scalar_one()
+    await engine.dispose()
+
+    # Dos UPDATE_TASK de la tarea hasta el log 4 (el de la tarea 2 no cuenta)
+    assert version == 3
@@ -0,0 +1,143 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_update_delete(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="bulkowner", email="bulkowner@test.com"
+    )
+    other_token = await _register_and_login(
+        client, username="bulkother", email="bulkother@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    other_headers = {"Authorization": f"Bearer {other_token}"}
+
+    users = (await client.get("/api/v1/users", headers=headers)).json()
+    other_id = next(u["id"] for u in users if u["username"] == "bulkother")
+    foreign_id = (
+        await client.post("/api/v1/tasks", json={"title": "F"}, headers=other_headers)
+    ).json()["id"]
+
+    created = await client.post(
+        "/api/v1/tasks/bulk",
+        json={
+            "create": [
+                {"title": "B1"},
+                {"title": "B2", "assigned_to_id": other_id},
+                {"title": "B3", "assigned_to_id": 99999},
+            ]
+        },
+        headers=headers,
+    )
+    assert created.status_code == 200
+    results = created.json()["results"]
+    assert [r["status_code"] for r in results] == [201, 201, 422]
+    b1_id, b2_id = results[0]["id"], results[1]["id"]
+
+    response = await client.post(
+        "/api/v1/tasks/bulk",
+        json={
+            "update": [
+                {"id": b1_id, "status": "done"},
+                {"id": b2_id, "status": "done"},
+                {"id": foreign_id, "status": "done"},
+                {"id": 99999, "status": "done"},
+            ],
+            "delete": [b1_id, foreign_id],
+        },
+        headers=headers,
+    )
+    results = response.json()["results"]
+    assert [(r["op"], r["status_code"]) for r in results] == [
+        ("update", 200),
+        ("update", 200),
+        ("update", 403),
+        ("update", 404),
+        ("delete", 204),
+        ("delete", 403),
+    ]
+
+    tasks = (await client.get("/api/v1/tasks", headers=headers)).json()
+    assert [(t["id"], t["status"]) for t in tasks] == [(b2_id, "done")]
+
+    history = (
+        await client.get(f"/api/v1/tasks/{b2_id}/history", headers=headers)
+    ).json()
+    assert history[0]["details"] == "status: todo -> done"
+    assert history[0]["changes"] == [{"field": "status", "old": "todo", "new": "done"}]
+
+    notifications = (
+        await client.get("/api/v1/notifications", headers=other_headers)
+    ).json()
+    assert {n["type"] for n in notifications} == {"task_assigned", "task_updated"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejects_oversized_batch(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="bulkbig", email="bulkbig@test.com"
+    )
+    response = await client.post(
+        "/api/v1/tasks/bulk",
+        json={"delete": list(range(1, 502))},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_null_for_required_fields(client: AsyncClient):
+    token = await _register_and_login(
+        client, username="bulknull", email="bulknull@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    ids = [
+        (await client.post("/api/v1/tasks", json={"title": t}, headers=headers)).json()[
+            "id"
+        ]
+        for t in ("N1", "N2")
+    ]
+
+    response = await client.post(
+        "/api/v1/tasks/bulk",
+        json={
+            "update": [
+                {"id": ids[0], "status": None},
+                # assigned_to_id / due_date sí admiten null
+                {
+                    "id": ids[1],
+                    "status": "done",
+                    "assigned_to_id": None,
+                    "due_date": None,
+                },
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["status_code"], r["detail"]) for r in results] == [
+        (422, "status: cannot be null"),
+        (200, None),
+    ]
+
+    tasks = (await client.get("/api/v1/tasks", headers=headers)).json()
+    assert sorted((t["title"], t["status"]) for t in tasks) == [
+        ("N1", "todo"),
+        ("N2", "done"),
+    ]
@@ -0,0 +1,181 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db import ActivityLog
+from src.scripts.migrate_task_version import migrate
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+@pytest.mark.asyncio
+async def test_if_match_rejects_concurrent_edit(client: AsyncClient):
+    token = await _register_and_login(client, "matcher", "matcher@test.com")
+    # Sin compresión, para recibir ETags fuertes
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "T"}, headers=headers)
+    ).json()["id"]
+
+    etag = (await client.get(f"/api/v1/tasks/{task_id}", headers=headers)).headers[
+        "etag"
+    ]
+    assert etag == f'"task-{task_id}-v1"'
+
+    first = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"status": "done"},
+        headers={**headers, "If-Match": etag},
+    )
+    assert first.status_code == 200
+    assert first.headers["etag"] == f'"task-{task_id}-v2"'
+    assert "version" not in first.json()
+
+    # Segundo cliente con el ETag viejo: 412 y el ETag actual
+    stale = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"title": "Overwrite"},
+        headers={**headers, "If-Match": etag},
+    )
+    assert stale.status_code == 412
+    assert stale.headers["etag"] == first.headers["etag"]
+
+    # ETag débil (respuesta comprimida) y comodín
+    weak = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"title": "Weak"},
+        headers={**headers, "If-Match": f"W/{first.headers['etag']}"},
+    )
+    assert weak.status_code == 200
+    star = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"title": "Star"},
+        headers={**headers, "If-Match": "*"},
+    )
+    assert star.status_code == 200
+    assert star.json()["title"] == "Star"
+
+    garbage = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"title": "Nope"},
+        headers={**headers, "If-Match": '"something-else"'},
+    )
+    assert garbage.status_code == 412
+
+
+@pytest.mark.asyncio
+async def test_noop_patch_keeps_version(client: AsyncClient, db_session):
+    token = await _register_and_login(client, "noop", "noop@test.com")
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "Same"}, headers=headers)
+    ).json()["id"]
+
+    response = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"title": "Same"},
+        headers={**headers, "If-Match": f'"task-{task_id}-v1"'},
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"task-{task_id}-v1"'
+
+    updates = (
+        await db_session.execute(
+            select(func.count(ActivityLog.id)).where(
+                ActivityLog.action == "UPDATE_TASK"
+            )
+        )
+    ).scalar_one()
+    assert updates == 0
+
+
+@pytest.mark.asyncio
+async def test_patch_is_a_single_update_statement(client: AsyncClient, db_session):
+    owner = await _register_and_login(client, "patchowner", "patchowner@test.com")
+    await _register_and_login(client, "patchee", "patchee@test.com")
+    headers = {"Authorization": f"Bearer {owner}"}
+    task_id = (
+        await client.post("/api/v1/tasks", json={"title": "T"}, headers=headers)
+    ).json()["id"]
+    await client.get("/api/v1/tasks", headers=headers)  # Principal en cache
+
+    statements: list[str] = []
+
+    def on_execute(conn, cursor, statement, *args):
+        table = re.search(r"(?:FROM|INTO|UPDATE)\s+(\w+)", statement).group(1)
+        statements.append(f"{statement.split()[0]} {table}")
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        response = await client.patch(
+            f"/api/v1/tasks/{task_id}",
+            json={"status": "in_progress", "assigned_to_id": 2},
+            headers=headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    assert response.status_code == 200
+    # SQLite lee los valores previos antes del UPDATE; PostgreSQL no lo necesita
+    assert statements == [
+        "SELECT tasks",
+        "UPDATE tasks",
+        "INSERT notifications",
+        "INSERT activity_logs",
+    ]
+
+    notifications = await client.get(
+        "/api/v1/notifications",
+        headers={
+            "Authorization": "Bearer "
+            + (
+                await client.post(
+                    "/api/v1/auth/login",
+                    json={"username": "patchee", "password": "password123"},
+                )
+            ).json()["access_token"]
+        },
+    )
+    assert [n["type"] for n in notifications.json()] == [
+        "task_updated",
+        "task_assigned",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_migration_adds_version_column(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200))"
+        )
+        await conn.exec_driver_sql("INSERT INTO tasks (title) VALUES ('legacy')")
+
+    assert await migrate(engine) is True
+    assert await migrate(engine) is False  # Idempotente
+
+    async with engine.connect() as conn:
+        columns = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_columns("tasks")
+        )
+        version = (await conn.exec_driver_sql("SELECT version FROM tasks")).scalar_one()
+    await engine.dispose()
+
+    assert "version" in {column["name"] for column in columns}
+    assert version == 1
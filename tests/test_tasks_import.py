@@ -0,0 +1,184 @@
+import json
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+
+from src.core.config import settings
+from src.db import ActivityLog
+from src.services import task_service
+
+
+async def _register_and_login(client: AsyncClient, username: str, email: str) -> str:
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "email": email, "password": "password123"},
+    )
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            json={"username": username, "password": "password123"},
+        )
+    ).json()["access_token"]
+    return token
+
+
+def _ndjson(*rows) -> bytes:
+    return "\n".join(
+        row if isinstance(row, str) else json.dumps(row) for row in rows
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_reports_row_errors(client: AsyncClient):
+    token = await _register_and_login(client, "importer", "importer@test.com")
+    await _register_and_login(client, "importee", "importee@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    body = _ndjson(
+        {"title": "One", "status": "in_progress"},
+        {"title": "Two", "assigned_to": "importee"},
+        {"title": ""},
+        "not json",
+        {"title": "Ghost", "assigned_to": "nobody"},
+        {"title": "Three", "due_date": "2030-01-01T10:00:00+02:00"},
+    )
+    response = await client.post("/api/v1/tasks/import", content=body, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3
+    assert data["failed"] == 3
+    assert [
+        error["row"] for error in sorted(data["errors"], key=lambda e: e["row"])
+    ] == [
+        3,
+        4,
+        5,
+    ]
+    assert any("title" in error["detail"] for error in data["errors"])
+
+    tasks = {
+        t["title"]: t
+        for t in (await client.get("/api/v1/tasks", headers=headers)).json()
+    }
+    assert set(tasks) == {"One", "Two", "Three"}
+    assert tasks["One"]["status"] == "in_progress"
+    assert tasks["Two"]["assigned_to_id"] == 2
+    assert tasks["Three"]["due_date"].startswith("2030-01-01T08:00:00")
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_non_string_assignee(client: AsyncClient):
+    token = await _register_and_login(client, "typedimport", "typedimport@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    body = _ndjson(
+        {"title": "List", "assigned_to": ["typedimport"]},
+        {"title": "Dict", "assigned_to": {"username": "typedimport"}},
+        {"title": "Int", "assigned_to": 1},
+        {"title": "Empty", "assigned_to": ""},
+        {"title": "Ok", "assigned_to": "typedimport"},
+    )
+    response = await client.post("/api/v1/tasks/import", content=body, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 1
+    assert [error["row"] for error in data["errors"]] == [1, 2, 3, 4]
+    assert {error["detail"] for error in data["errors"]} == {
+        "assigned_to: must be a username string"
+    }
+
+
+@pytest.mark.asyncio
+async def test_import_csv(client: AsyncClient):
+    token = await _register_and_login(client, "csvimporter", "csvimporter@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    body = (
+        "title,description,status,assigned_to\r\n"
+        '"Quoted, title","line 1\r\nline 2",done,csvimporter\r\n'
+        "Plain,,,\r\n"
+        "Bad,,archived,\r\n"
+    ).encode()
+    response = await client.post(
+        "/api/v1/tasks/import", params={"format": "csv"}, content=body, headers=headers
+    )
+    data = response.json()
+    assert data["created"] == 2
+    assert data["errors"][0]["row"] == 3
+
+    tasks = {
+        t["title"]: t
+        for t in (await client.get("/api/v1/tasks", headers=headers)).json()
+    }
+    assert tasks["Quoted, title"]["description"] == "line 1\r\nline 2"
+    assert tasks["Quoted, title"]["assigned_to_id"] == 1
+    assert tasks["Plain"]["status"] == "todo"
+
+
+@pytest.mark.asyncio
+async def test_import_logs_one_activity_per_chunk(
+    client: AsyncClient, db_session, monkeypatch
+):
+    monkeypatch.setattr(task_service, "IMPORT_CHUNK_SIZE", 2)
+    token = await _register_and_login(client, "chunkimp", "chunkimp@test.com")
+    body = _ndjson(*({"title": f"T{i}"} for i in range(5)))
+
+    response = await client.post(
+        "/api/v1/tasks/import",
+        content=body,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.json()["created"] == 5
+
+    logs = (
+        (
+            await db_session.execute(
+                select(ActivityLog.details).where(ActivityLog.action == "IMPORT_TASKS")
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert logs == [
+        "Imported 2 tasks (rows 1-2)",
+        "Imported 2 tasks (rows 3-4)",
+        "Imported 1 tasks (rows 5-5)",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_invalid_utf8(client: AsyncClient):
+    token = await _register_and_login(client, "badbytes", "badbytes@test.com")
+    response = await client.post(
+        "/api/v1/tasks/import",
+        content=b'{"title": "\xff"}',
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_uses_long_deadline(client: AsyncClient, db_session, monkeypatch):
+    token = await _register_and_login(client, "slowimport", "slowimport@test.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO tasks"):
+            time.sleep(0.1)  # Más que el deadline de las escrituras (50 ms)
+
+    monkeypatch.setattr(settings, "REQUEST_TIMEOUT_MS", 50)
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        imported = await client.post(
+            "/api/v1/tasks/import",
+            content=_ndjson({"title": "One"}, {"title": "Two"}),
+            headers=headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    assert imported.status_code == 200
+    assert imported.json()["created"] == 2